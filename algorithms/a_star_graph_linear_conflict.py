@@ -0,0 +1,27 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+A* graph search algorithm using linear conflict heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import best_first_seach as bfs
+from .util import heuristics
+
+
+def search(state, goal_state):
+    """A* graph search using linear conflict heuristic"""
+
+    def gn(node):
+        return node.g
+
+    def hn(node):
+        return node.h
+
+    def fn(node):
+        return gn(node) + hn(node)
+
+    return bfs.graph_search(state, goal_state, fn, heuristics.LinearConflict(goal_state))
@@ -0,0 +1,37 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+A* graph search algorithm using additive pattern database heuristic
+
+Pattern databases are built the first time they are used for a goal state (or when the algorithm is prepared for it),
+which takes a few minutes for 15-puzzle.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import best_first_seach as bfs
+from .util.pattern_database import PatternDatabase
+
+
+def prepare(goal_state):
+    """
+    Builds the pattern databases of goal_state, if they are not built yet.
+    """
+    PatternDatabase(goal_state)
+
+
+def search(state, goal_state):
+    """A* graph search using pattern database heuristic"""
+
+    def gn(node):
+        return node.g
+
+    def hn(node):
+        return node.h
+
+    def fn(node):
+        return gn(node) + hn(node)
+
+    return bfs.graph_search(state, goal_state, fn, PatternDatabase(goal_state))
@@ -0,0 +1,20 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Anytime weighted A* graph search algorithm using manhattan distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import best_first_seach as bfs
+from .util import heuristics
+
+# Weight of the heuristic for the first solution, the next solutions get closer to the optimal one
+WEIGHT = 3
+
+
+def search(state, goal_state):
+    """Anytime weighted A* using manhattan distance heuristic"""
+    return bfs.weighted_graph_search(state, goal_state, heuristics.ManhattanDistance(goal_state), WEIGHT, anytime=True)
@@ -0,0 +1,20 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Beam search algorithm using manhattan distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import best_first_seach as bfs
+from .util import heuristics
+
+# Number of nodes that are kept in every level, wider beams find shorter solutions but take more time and memory
+BEAM_WIDTH = 1000
+
+
+def search(state, goal_state):
+    """Beam search using manhattan distance heuristic"""
+    return bfs.beam_search(state, goal_state, heuristics.ManhattanDistance(goal_state), BEAM_WIDTH)
@@ -0,0 +1,18 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Bidirectional A* (MM) algorithm using manhattan distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import bidirectional_search
+from .util import heuristics
+
+
+def search(state, goal_state):
+    """Bidirectional A* (MM) using manhattan distance heuristic"""
+    return bidirectional_search.mm_search(state, goal_state, heuristics.ManhattanDistance(goal_state),
+                                        heuristics.ManhattanDistance(state))
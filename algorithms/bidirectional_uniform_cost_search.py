@@ -0,0 +1,16 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Bidirectional uniform-cost search algorithm
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import bidirectional_search
+
+
+def search(state, goal_state):
+    """Bidirectional uniform-cost search"""
+    return bidirectional_search.mm_search(state, goal_state)
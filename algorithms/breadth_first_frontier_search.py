@@ -0,0 +1,19 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Breadth-first search algorithm over sorted arrays of packed states (frontier search)
+
+Levels are expanded by a pool of processes and spilled to temporary files when they get too big, see
+util.frontier_search module.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import frontier_search
+
+
+def search(state, goal_state):
+    """Breadth-first frontier search"""
+    return frontier_search.search(state, goal_state)
@@ -0,0 +1,41 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Breadth-first graph search algorithm
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util.instrumentation import stats
+from .util.tree_search import root_node
+from collections import deque
+
+
+def search(state, goal_state):
+    """Breadth-first graph search"""
+    board, current_node = root_node(state)
+    goal = board.pack_goal(goal_state)
+    if current_node.packed == goal:
+        return current_node.path(board)
+
+    queue = deque([current_node])
+    # States that have been added to the queue
+    reached = {current_node.packed}
+    stats.track(queue, depth=lambda: queue[0].g if queue else None)
+    while queue:
+        if stats.stopped:
+            # All of the states up to the first queued node's depth have been generated and tested
+            return stats.partial(bound=queue[0].g + 1)
+        current_node = queue.popleft()
+        for child in current_node.expand(board):
+            if child.packed in reached:
+                continue
+            # Goal test is done when the node is generated, since all of the nodes on the queue are at least as deep
+            if child.packed == goal:
+                return child.path(board)
+            reached.add(child.packed)
+            queue.append(child)
+
+    return None
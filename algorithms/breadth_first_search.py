@@ -8,23 +8,23 @@ Author : Hamidreza Mahdavipanah
 Repository: http://github.com/mahdavipanah/pynpuzzle
 License : MIT License
 """
-from .util.tree_search import Node
+from .util.instrumentation import stats
+from .util.tree_search import root_node
 from collections import deque
 
 
 def search(state, goal_state):
     """Breadth-first search"""
     queue = deque()
-    current_node = Node(state)
-    while not current_node.is_goal(goal_state):
-        current_node.expand()
-        queue.extendleft(current_node.children)
+    board, current_node = root_node(state)
+    goal = board.pack_goal(goal_state)
+    # The next node to be expanded is on the right
+    stats.track(queue, depth=lambda: queue[-1].g if queue else None)
+    while current_node.packed != goal:
+        if stats.stopped:
+            # Nodes are expanded in order of their depth, so all of the shallower nodes have been tested
+            return stats.partial(bound=current_node.g)
+        queue.extendleft(current_node.expand(board))
         current_node = queue.pop()
 
-    output = []
-    output.append(current_node.state)
-    for parent in current_node.parents():
-        output.append(parent.state)
-    output.reverse()
-
-    return output
+    return current_node.path(board)
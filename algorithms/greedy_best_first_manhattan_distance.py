@@ -0,0 +1,25 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Greedy best-first graph search algorithm using manhattan distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import best_first_seach as bfs
+from .util import heuristics
+from .util.instrumentation import stats
+
+
+def search(state, goal_state):
+    """Greedy best-first search using manhattan distance heuristic"""
+    heuristic = heuristics.ManhattanDistance(goal_state)
+    # Queue is ordered by h, which is not a lower bound of the path cost
+    stats.lower_bound = heuristic.evaluate(heuristic.board.pack(state)[0])
+
+    def hn(node):
+        return node.h
+
+    return bfs.graph_search(state, goal_state, hn, heuristic)
@@ -0,0 +1,17 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Iterative deepening A* (IDA*) algorithm using linear conflict heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import heuristics
+from .util import ida_star
+
+
+def search(state, goal_state):
+    """IDA* using linear conflict heuristic"""
+    return ida_star.search(state, goal_state, heuristics.LinearConflict(goal_state))
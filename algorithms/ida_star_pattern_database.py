@@ -0,0 +1,27 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Iterative deepening A* (IDA*) algorithm using additive pattern database heuristic
+
+Pattern databases are built the first time they are used for a goal state (or when the algorithm is prepared for it),
+which takes a few minutes for 15-puzzle.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import ida_star
+from .util.pattern_database import PatternDatabase
+
+
+def prepare(goal_state):
+    """
+    Builds the pattern databases of goal_state, if they are not built yet.
+    """
+    PatternDatabase(goal_state)
+
+
+def search(state, goal_state):
+    """IDA* using pattern database heuristic"""
+    return ida_star.search(state, goal_state, PatternDatabase(goal_state))
@@ -0,0 +1,25 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Iterative deepening A* (IDA*) algorithm using manhattan distance heuristic and a persistent transposition table
+
+States of the optimal solutions are kept between runs (See util.transposition module), so solving puzzles that reach
+previously solved states is cut short.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import heuristics
+from .util import ida_star
+from .util.transposition import TranspositionTable
+
+
+def search(state, goal_state):
+    """IDA* using manhattan distance heuristic and transposition table"""
+    transposition = TranspositionTable(goal_state)
+    try:
+        return ida_star.search(state, goal_state, heuristics.ManhattanDistance(goal_state), transposition)
+    finally:
+        transposition.close()
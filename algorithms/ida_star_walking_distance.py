@@ -0,0 +1,17 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Iterative deepening A* (IDA*) algorithm using walking distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import ida_star
+from .util.walking_distance import WalkingDistance
+
+
+def search(state, goal_state):
+    """IDA* using walking distance heuristic"""
+    return ida_star.search(state, goal_state, WalkingDistance(goal_state))
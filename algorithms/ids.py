@@ -8,19 +8,24 @@ Author : Hamidreza Mahdavipanah
 Repository: http://github.com/mahdavipanah/pynpuzzle
 License : MIT License
 """
-from .util.tree_search import Node
+from .util.instrumentation import stats
+from .util.tree_search import root_node
 
 
 def search(state, goal_state):
     """Iterative deepening depth-first"""
     depth = 0
+    board, root = root_node(state)
+    goal = board.pack_goal(goal_state)
+    stats.track(depth=lambda: depth)
 
     def dls(node):
-        if node.is_goal(goal_state):
+        if node.packed == goal:
             return node
-        if node.depth < depth:
-            node.expand()
-            for child in node.children:
+        if stats.stopped:
+            return None
+        if node.g < depth:
+            for child in node.expand(board):
                 result = dls(child)
                 if result:
                     return result
@@ -28,13 +33,10 @@ def search(state, goal_state):
 
     answer = None
     while not answer:
-        answer = dls(Node(state))
+        answer = dls(root)
+        if stats.stopped:
+            # All of the paths which are shorter than depth have been searched
+            return stats.partial(bound=depth)
         depth += 1
 
-    output = []
-    output.append(answer.state)
-    for parent in answer.parents():
-        output.append(parent.state)
-    output.reverse()
-
-    return output
+    return answer.path(board)
@@ -0,0 +1,17 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Parallel iterative deepening A* (IDA*) algorithm using manhattan distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import heuristics
+from .util import parallel_ida_star
+
+
+def search(state, goal_state):
+    """Parallel IDA* using manhattan distance heuristic"""
+    return parallel_ida_star.search(state, goal_state, heuristics.ManhattanDistance)
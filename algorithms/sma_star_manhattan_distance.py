@@ -0,0 +1,25 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Simplified memory-bounded A* (SMA*) algorithm using manhattan distance heuristic
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import heuristics
+from .util import sma_star
+
+# Maximum memory (in MB) that search tree's nodes can take
+MAX_MEMORY = 256
+# Maximum number of nodes in memory, if it's not None it's used instead of MAX_MEMORY
+MAX_NODES = None
+
+
+def search(state, goal_state):
+    """SMA* using manhattan distance heuristic"""
+    max_nodes = MAX_NODES
+    if max_nodes is None:
+        max_nodes = MAX_MEMORY * (2 ** 20) // sma_star.node_size(len(state))
+    return sma_star.search(state, goal_state, heuristics.ManhattanDistance(goal_state), max_nodes)
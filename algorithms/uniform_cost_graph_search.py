@@ -0,0 +1,20 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Uniform-cost graph search algorithm
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .util import best_first_seach as bfs
+
+
+def search(state, goal_state):
+    """Uniform-cost graph search"""
+
+    def gn(node):
+        return node.g
+
+    return bfs.graph_search(state, goal_state, gn)
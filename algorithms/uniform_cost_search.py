@@ -15,6 +15,6 @@ def search(state, goal_state):
     """Uniform-cost search"""
 
     def gn(node):
-        return node.gn()
+        return node.g
 
     return bfs.search(state, goal_state, gn)
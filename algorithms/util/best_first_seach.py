@@ -9,26 +9,214 @@ Repository: http://github.com/mahdavipanah/pynpuzzle
 License : MIT License
 """
 import heapq
-from .tree_search import Node
+from . import vectorized
+from .instrumentation import stats
+from .tree_search import root_node
 
 
-def search(state, goal_state, fn):
-    """Best-first search"""
+def stopped_result(board, queue, heuristic=None):
+    """
+    Returns the PartialResult of a stopped search, with the path to the frontier's node that has the lowest h (if
+    heuristic is given) and stats.lower_bound (or the lowest value of the queue if it's not set) as the lower bound.
+    """
+    path = None
+    if heuristic is not None and queue:
+        node = min((item[2] for item in queue), key=lambda node: (node.h, node.g))
+        path = node.path(board)
+    bound = stats.lower_bound
+    if bound is None and queue:
+        bound = queue[0][0]
+    return stats.partial(path, bound)
+
+
+def search(state, goal_state, fn, heuristic=None):
+    """
+    Best-first search
+
+    If heuristic is given, nodes' h is kept updated by it, so fn can use it.
+
+    fn should be a lower bound of the path cost through a node (like g or g + h), which is reported if the search is
+    stopped, or stats.lower_bound should be set.
+    """
+    queue = []
+    entrance = 0
+    board, node = root_node(state, heuristic)
+    goal = board.pack_goal(goal_state)
+    stats.track(queue, lambda: queue[0][0] if queue else None)
+    while node.packed != goal:
+        if stats.stopped:
+            return stopped_result(board, queue, heuristic)
+        for child in node.expand(board, heuristic):
+            queue_item = (fn(child), entrance, child)
+            heapq.heappush(queue, queue_item)
+            entrance += 1
+        node = heapq.heappop(queue)[2]
+
+    return node.path(board)
+
+
+def graph_search(state, goal_state, fn, heuristic=None):
+    """
+    Best-first graph search
+
+    Generated states are remembered, so a state is only added to the queue again if it's reached with a lower path
+    cost and it's never expanded twice. Expanded states are not reopened, so fn should be based on a consistent
+    heuristic to find optimal solutions.
+
+    If heuristic is given, nodes' h is kept updated by it, so fn can use it.
+
+    Returns None if goal_state is not reachable from state.
+    """
     queue = []
     entrance = 0
-    node = Node(state)
-    while not node.is_goal(goal_state):
-        node.expand()
-        for child in node.children:
+    board, node = root_node(state, heuristic)
+    goal = board.pack_goal(goal_state)
+    # Expanded states
+    closed = set()
+    # Lowest path cost that every generated state has been reached with
+    generated = {node.packed: 0}
+    stats.track(queue, lambda: queue[0][0] if queue else None)
+    while node.packed != goal:
+        if stats.stopped:
+            return stopped_result(board, queue, heuristic)
+        closed.add(node.packed)
+        for child in node.expand(board, heuristic):
+            if child.packed in closed:
+                continue
+            g = generated.get(child.packed)
+            if g is not None and g <= child.g:
+                continue
+            generated[child.packed] = child.g
             queue_item = (fn(child), entrance, child)
             heapq.heappush(queue, queue_item)
             entrance += 1
+        # Skip the queue items that their states have been expanded through a cheaper path
+        while True:
+            if not queue:
+                return None
+            node = heapq.heappop(queue)[2]
+            if node.packed not in closed:
+                break
+
+    return node.path(board)
+
+
+def weighted_graph_search(state, goal_state, heuristic, weight, anytime=False):
+    """
+    Weighted A*
+
+    Best-first graph search ordered by g + weight * h. With an admissible heuristic the first solution is at most weight
+    times longer than the optimal one, and it's usually found much sooner than A* finds the optimal one.
+
+    If anytime is True, search goes on after a solution is found: nodes which their g + h is not less than the best
+    solution's length are pruned and every shorter solution is reported with stats.improve. When the queue gets empty
+    the best solution is optimal. If it's stopped (See instrumentation), the best solution is returned.
+
+    stats.lower_bound is kept as the lowest g + h of the queue's nodes, or the best solution's length if it's lower.
+
+    Returns None if goal_state is not reachable from state.
+    """
+    board, node = root_node(state, heuristic)
+    goal = board.pack_goal(goal_state)
+    queue = [(weight * node.h, 0, node)]
+    # The same nodes ordered by g + h, nodes that have been expanded are only removed when they get to the top
+    bound_queue = [(node.h, 0, node)]
+    entrance = 1
+    # Lowest path cost that every generated state has been reached with
+    generated = {node.packed: 0}
+    # Path cost that every state has been expanded with, a state is expanded again if it's reached with a lower cost
+    expanded = {}
+    # Best solution and it's length
+    best = None
+    best_moves = None
+    stats.lower_bound = node.h
+    stats.track(queue, lambda: stats.lower_bound)
+
+    while queue:
+        if stats.stopped:
+            break
         node = heapq.heappop(queue)[2]
+        # Node's state has been reached with a lower path cost after it was added to the queue
+        if generated[node.packed] < node.g:
+            continue
+        if best is not None and node.g + node.h >= best_moves:
+            continue
+        if node.packed == goal:
+            best = node.path(board)
+            best_moves = node.g
+        else:
+            expanded[node.packed] = node.g
+            for child in node.expand(board, heuristic):
+                g = generated.get(child.packed)
+                if g is not None and g <= child.g:
+                    continue
+                if best is not None and child.g + child.h >= best_moves:
+                    continue
+                generated[child.packed] = child.g
+                heapq.heappush(queue, (child.g + weight * child.h, entrance, child))
+                heapq.heappush(bound_queue, (child.g + child.h, entrance, child))
+                entrance += 1
+
+        while bound_queue:
+            top = bound_queue[0][2]
+            if generated[top.packed] >= top.g and expanded.get(top.packed, top.g + 1) > top.g:
+                break
+            heapq.heappop(bound_queue)
+        lower_bound = bound_queue[0][0] if bound_queue else best_moves
+        if best is not None and (lower_bound is None or best_moves < lower_bound):
+            lower_bound = best_moves
+        if lower_bound is not None:
+            stats.lower_bound = lower_bound
+
+        if node.packed == goal:
+            if not anytime:
+                break
+            stats.improve(best)
+
+    if best is None and stats.stopped:
+        return stopped_result(board, queue, heuristic)
+    if best is not None and not queue:
+        # Every node that could lead to a shorter solution has been searched
+        stats.lower_bound = best_moves
+    return best
+
+
+def beam_search(state, goal_state, heuristic, width):
+    """
+    Beam search
+
+    Breadth-first search that only keeps the width nodes with the lowest h of every level, so every level takes at
+    most width nodes. States that have been in a beam are not added again. The solution is not optimal and the goal
+    state may be missed (None is returned then).
+
+    stats.lower_bound is the heuristic value of state.
+
+    If NumPy is installed, levels are generated and evaluated at once (See vectorized).
+    """
+    if vectorized.numpy is not None:
+        return vectorized.beam_search(state, goal_state, heuristic, width)
+    board, node = root_node(state, heuristic)
+    goal = board.pack_goal(goal_state)
+    stats.lower_bound = node.h
+    beam = [node]
+    # States that have been in a beam
+    visited = {node.packed}
+    depth = 0
+    stats.track(depth=lambda: depth)
 
-    output = []
-    output.append(node.state)
-    for parent in node.parents():
-        output.append(parent.state)
-    output.reverse()
+    while beam:
+        if stats.stopped:
+            return stats.partial(min(beam, key=lambda node: node.h).path(board))
+        # Children of the beam, a state is only kept once
+        children = {}
+        for node in beam:
+            if node.packed == goal:
+                return node.path(board)
+            for child in node.expand(board, heuristic):
+                if child.packed not in visited and child.packed not in children:
+                    children[child.packed] = child
+        beam = heapq.nsmallest(width, children.values(), key=lambda node: node.h)
+        visited.update(node.packed for node in beam)
+        depth += 1
 
-    return output
+    return None
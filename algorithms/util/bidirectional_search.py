@@ -0,0 +1,207 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Bidirectional search algorithms
+
+A forward search from the state and a backward search from the goal state run together until their frontiers meet.
+Since moves are reversible, the backward search uses the same successors as the forward one. States are kept packed
+in dictionaries, so checking whether a state has been reached by the other search is a single lookup.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import heapq
+
+from .instrumentation import stats
+from .packed_state import get_board
+
+
+def join_path(board, meeting, forward_parents, backward_parents):
+    """
+    Returns the list of two dimensional states from the root of forward search to the root of backward search, through
+    the meeting state.
+
+    forward_parents, backward_parents : Map every reached state to it's parent (None for the roots).
+    """
+    output = []
+    packed = meeting
+    while packed is not None:
+        output.append(packed)
+        packed = forward_parents[packed]
+    output.reverse()
+    packed = backward_parents[meeting]
+    while packed is not None:
+        output.append(packed)
+        packed = backward_parents[packed]
+    return [board.unpack(packed) for packed in output]
+
+
+def breadth_first_search(state, goal_state):
+    """
+    Bidirectional breadth-first search
+
+    Searches expand a whole layer at a time, the search with the smaller frontier goes first. When a layer reaches the
+    other search's states, the shortest path through that layer is returned.
+
+    Returns None if goal_state is not reachable from state.
+    """
+    board = get_board(len(state))
+    start, start_blank = board.pack(state)
+    goal = board.pack_goal(goal_state)
+    if start == goal:
+        return [board.unpack(start)]
+    goal_blank = board.find_blank(goal)
+
+    # Depth of every reached state
+    forward_depths = {start: 0}
+    backward_depths = {goal: 0}
+    forward_parents = {start: None}
+    backward_parents = {goal: None}
+    forward_layer = [(start, start_blank)]
+    backward_layer = [(goal, goal_blank)]
+
+    # Depths of the current layers
+    forward_depth = 0
+    backward_depth = 0
+    stats.track(depth=lambda: forward_depth + backward_depth)
+
+    while forward_layer and backward_layer:
+        if len(forward_layer) <= len(backward_layer):
+            layer, depths, parents, other_depths = forward_layer, forward_depths, forward_parents, backward_depths
+        else:
+            layer, depths, parents, other_depths = backward_layer, backward_depths, backward_parents, forward_depths
+
+        next_layer = []
+        # Shortest path length through this layer and it's meeting state
+        best = None
+        meeting = None
+        for packed, blank in layer:
+            if stats.stopped:
+                # Searches have not met in their finished layers, so every path is longer than both of them together
+                path = join_path(board, meeting, forward_parents, backward_parents) if meeting is not None else None
+                return stats.partial(path, forward_depth + backward_depth + 1)
+            stats.expanded += 1
+            depth = depths[packed] + 1
+            for child, child_blank, _ in board.successors(packed, blank):
+                stats.generated += 1
+                if child in depths:
+                    continue
+                depths[child] = depth
+                parents[child] = packed
+                next_layer.append((child, child_blank))
+                other_depth = other_depths.get(child)
+                if other_depth is not None and (best is None or depth + other_depth < best):
+                    best = depth + other_depth
+                    meeting = child
+        if meeting is not None:
+            return join_path(board, meeting, forward_parents, backward_parents)
+
+        if layer is forward_layer:
+            forward_layer = next_layer
+            forward_depth += 1
+        else:
+            backward_layer = next_layer
+            backward_depth += 1
+
+    return None
+
+
+def mm_search(state, goal_state, forward_heuristic=None, backward_heuristic=None):
+    """
+    Bidirectional A* meeting in the middle (MM)
+
+    Each search orders it's nodes by max(f, 2g) and the search with the smaller minimum priority expands next, which
+    makes both searches meet in the middle. Search stops when the best path found so far is not longer than the
+    smallest priority. Without heuristics it's a bidirectional uniform-cost search.
+
+    forward_heuristic : A heuristics.Heuristic object which estimates the distance to goal_state.
+    backward_heuristic : A heuristics.Heuristic object which estimates the distance to state.
+
+    Returns None if goal_state is not reachable from state.
+    """
+    board = get_board(len(state))
+    start, start_blank = board.pack(state)
+    goal = board.pack_goal(goal_state)
+    goal_blank = board.find_blank(goal)
+
+    class Direction:
+        """
+        State of one of the searches.
+        """
+
+        def __init__(self, root, blank, heuristic):
+            self.heuristic = heuristic
+            h = heuristic.evaluate(root) if heuristic is not None else 0
+            # Items are (priority, g, entrance, packed, blank, h)
+            self.queue = [(max(h, 0), 0, 0, root, blank, h)]
+            self.g = {root: 0}
+            self.parents = {root: None}
+            self.closed = set()
+
+    forward = Direction(start, start_blank, forward_heuristic)
+    backward = Direction(goal, goal_blank, backward_heuristic)
+    entrance = 1
+    # Length of the best path that has been found and it's meeting state
+    best = float('inf')
+    meeting = start if start == goal else None
+    if meeting is not None:
+        best = 0
+
+    def prune(direction):
+        """
+        Removes the stale items from the top of direction's queue.
+        """
+        queue = direction.queue
+        while queue:
+            _, g, _, packed, _, _ = queue[0]
+            if packed in direction.closed or direction.g[packed] != g:
+                heapq.heappop(queue)
+            else:
+                return
+
+    stats.track(bound=lambda: min(forward.queue[0][0] if forward.queue else best,
+                                  backward.queue[0][0] if backward.queue else best))
+
+    while True:
+        prune(forward)
+        prune(backward)
+        if not forward.queue or not backward.queue:
+            break
+        if forward.queue[0][0] <= backward.queue[0][0]:
+            direction, other = forward, backward
+        else:
+            direction, other = backward, forward
+        if best <= direction.queue[0][0]:
+            break
+        if stats.stopped:
+            # No path is shorter than the smallest priority
+            path = join_path(board, meeting, forward.parents, backward.parents) if meeting is not None else None
+            return stats.partial(path, min(forward.queue[0][0], backward.queue[0][0]))
+
+        _, g, _, packed, blank, h = heapq.heappop(direction.queue)
+        direction.closed.add(packed)
+        stats.expanded += 1
+        heuristic = direction.heuristic
+        child_g = g + 1
+        for child, child_blank, tile in board.successors(packed, blank):
+            stats.generated += 1
+            old_g = direction.g.get(child)
+            if old_g is not None and old_g <= child_g:
+                continue
+            direction.g[child] = child_g
+            direction.parents[child] = packed
+            direction.closed.discard(child)
+            child_h = heuristic.update(h, child, tile, child_blank, blank) if heuristic is not None else 0
+            heapq.heappush(direction.queue, (max(child_g + child_h, 2 * child_g), child_g, entrance, child,
+                                             child_blank, child_h))
+            entrance += 1
+            other_g = other.g.get(child)
+            if other_g is not None and child_g + other_g < best:
+                best = child_g + other_g
+                meeting = child
+
+    if meeting is None:
+        return None
+    return join_path(board, meeting, forward.parents, backward.parents)
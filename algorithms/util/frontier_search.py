@@ -0,0 +1,275 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Level-synchronous breadth-first search over packed state arrays
+
+A level (the states at the same distance from the root) is kept as a sorted array of packed states, 8 bytes per state
+instead of a Python object. Levels are expanded in chunks by a pool of processes, every chunk's children are sorted
+and sent back as a sorted run, and the runs are merged into the next level.
+
+There is no visited set: since every move changes the blank tile's cell parity, the graph of states is bipartite and a
+state's neighbours are all in the previous or the next level. So the children that have been reached before are
+exactly the ones in the previous level, which are removed while merging.
+
+Levels and runs that have more than spill_states states are written to temporary files and memory-mapped, so a level
+can be bigger than RAM.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import heapq
+import mmap
+import multiprocessing
+import os
+import tempfile
+from array import array
+from bisect import bisect_left
+
+from . import vectorized
+from .instrumentation import stats
+from .packed_state import get_board
+
+# Default number of states of a level (or of the runs of a level) that are kept in memory
+SPILL_STATES = 2 ** 24
+# Number of states that are sent to a worker process at once
+CHUNK_SIZE = 20000
+# Packed states are stored as unsigned 64 bit integers
+TYPECODE = 'Q'
+
+_worker_board = None
+
+
+def _init_worker(n):
+    global _worker_board
+    _worker_board = get_board(n)
+
+
+def _expand_chunk(chunk):
+    """
+    Returns the sorted children of a chunk of packed states (as bytes).
+    """
+    states = array(TYPECODE)
+    states.frombytes(chunk)
+    return expand(_worker_board, states).tobytes()
+
+
+def expand(board, states):
+    """
+    Returns a sorted array of the children of packed states, without repeated states.
+
+    If NumPy is installed, states are expanded at once (See vectorized).
+    """
+    if vectorized.numpy is not None:
+        return vectorized.expand(board, states)
+    children = set()
+    for packed in states:
+        for child, _, _ in board.successors(packed, board.find_blank(packed)):
+            children.add(child)
+    return array(TYPECODE, sorted(children))
+
+
+class Level:
+    """
+    Sorted packed states, which are in memory or in a memory-mapped temporary file.
+
+    states is an array or a memoryview, both are indexed and iterated like a list.
+    """
+
+    def __init__(self, states, file=None):
+        self.file = file
+        self.map = None
+        if file is not None:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            states = memoryview(self.map).cast(TYPECODE)
+        self.states = states
+
+    def __len__(self):
+        return len(self.states)
+
+    def __iter__(self):
+        return iter(self.states)
+
+    def __contains__(self, packed):
+        i = bisect_left(self.states, packed)
+        return i < len(self.states) and self.states[i] == packed
+
+    def close(self):
+        """
+        Frees level's memory and removes it's file.
+        """
+        if self.map is not None:
+            self.states.release()
+            self.map.close()
+            self.file.close()
+            self.map = self.file = None
+        self.states = array(TYPECODE)
+
+
+class LevelWriter:
+    """
+    Collects states into a Level, writing them to a temporary file once there are more than spill_states of them.
+    """
+
+    def __init__(self, directory=None, spill_states=SPILL_STATES):
+        self.directory = directory
+        self.spill_states = spill_states
+        self.buffer = array(TYPECODE)
+        self.file = None
+        self.count = 0
+
+    def extend(self, states):
+        self.buffer.extend(states)
+        self.count += len(states)
+        if self.count > self.spill_states:
+            if self.file is None:
+                self.file = tempfile.TemporaryFile(prefix='pynpuzzle-bfs-', dir=self.directory)
+            self.buffer.tofile(self.file)
+            self.buffer = array(TYPECODE)
+
+    def close(self):
+        """
+        Returns the collected states as a Level.
+        """
+        if self.file is None:
+            return Level(self.buffer)
+        self.buffer.tofile(self.file)
+        self.file.flush()
+        self.buffer = array(TYPECODE)
+        return Level(None, self.file)
+
+
+def levels(state, processes=None, directory=None, spill_states=SPILL_STATES, keep=False):
+    """
+    Generates (depth, level) tuples of all states that are reachable from state, level by level.
+
+    processes : Number of processes that expand levels, None means number of CPUs.
+    directory : Directory of the temporary files, None means the system's default.
+    spill_states : Number of states of a level (or of it's runs) that are kept in memory.
+    keep : If it's True, levels are not closed and the caller should close them, otherwise a level is closed when the
+           next two levels have been generated.
+    """
+    n = len(state)
+    board = get_board(n)
+    if board.bits * board.size > 64:
+        raise ValueError('States of ' + str(n * n - 1) + '-puzzle are bigger than 64 bits')
+    packed, _ = board.pack(state)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    # Daemonic processes (like the batch workers) are not allowed to have children
+    if multiprocessing.current_process().daemon:
+        processes = 1
+    pool = None
+    if processes > 1:
+        pool = multiprocessing.Pool(processes, _init_worker, (n,))
+
+    def expand_level(level):
+        """
+        Yields the sorted runs of level's children.
+        """
+        chunks = (level.states[i:i + CHUNK_SIZE] for i in range(0, len(level), CHUNK_SIZE))
+        if pool is None:
+            for chunk in chunks:
+                yield expand(board, chunk)
+            return
+        for run in pool.imap_unordered(_expand_chunk, (chunk.tobytes() for chunk in chunks)):
+            states = array(TYPECODE)
+            states.frombytes(run)
+            yield states
+
+    depth = 0
+    stats.track(depth=lambda: depth)
+    previous = Level(array(TYPECODE))
+    current = Level(array(TYPECODE, [packed]))
+    try:
+        while len(current):
+            yield depth, current
+            stats.expanded += len(current)
+
+            # Runs are collected in one array (or file), offsets are where every run starts
+            runs_writer = LevelWriter(directory, spill_states)
+            offsets = [0]
+            for run in expand_level(current):
+                if stats.stopped:
+                    return
+                stats.generated += len(run)
+                runs_writer.extend(run)
+                offsets.append(runs_writer.count)
+            runs_level = runs_writer.close()
+            # Slices of a memoryview don't copy the states
+            runs_view = memoryview(runs_level.states)
+            runs = [runs_view[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+            writer = LevelWriter(directory, spill_states)
+            buffer = array(TYPECODE)
+            reached = iter(previous)
+            reached_state = next(reached, None)
+            last = None
+            for child in heapq.merge(*runs):
+                if child == last:
+                    continue
+                last = child
+                while reached_state is not None and reached_state < child:
+                    reached_state = next(reached, None)
+                if child == reached_state:
+                    continue
+                buffer.append(child)
+                if len(buffer) >= CHUNK_SIZE:
+                    writer.extend(buffer)
+                    buffer = array(TYPECODE)
+            writer.extend(buffer)
+            for run in runs:
+                run.release()
+            runs_view.release()
+            runs_level.close()
+
+            if not keep:
+                previous.close()
+            previous, current = current, writer.close()
+            depth += 1
+    finally:
+        if not keep:
+            previous.close()
+            current.close()
+        if pool is not None:
+            pool.terminate()
+
+
+def search(state, goal_state, processes=None, directory=None, spill_states=SPILL_STATES):
+    """
+    Breadth-first frontier search
+
+    Generates levels until goal_state is reached and then finds the path back through the previous levels.
+
+    Returns None if goal_state is not reachable from state. If it's stopped, the number of levels that have been
+    searched is the lower bound.
+    """
+    board = get_board(len(state))
+    goal = board.pack_goal(goal_state)
+    # Previous levels are kept to find the path
+    kept = []
+    generator = levels(state, processes, directory, spill_states, keep=True)
+    try:
+        for _, level in generator:
+            kept.append(level)
+            if goal not in level:
+                continue
+            output = [goal]
+            packed = goal
+            for previous in reversed(kept[:-1]):
+                for child, _, _ in board.successors(packed, board.find_blank(packed)):
+                    if child in previous:
+                        packed = child
+                        break
+                output.append(packed)
+            output.reverse()
+            return [board.unpack(packed) for packed in output]
+        if stats.stopped:
+            return stats.partial(bound=len(kept))
+        return None
+    finally:
+        generator.close()
+        for level in kept:
+            level.close()
@@ -0,0 +1,230 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Heuristic functions that can be evaluated incrementally
+
+A move only slides one tile, so most heuristics can compute a child's value from it's parent's value and the moved
+tile, instead of scanning the whole board again.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from bisect import bisect_left
+from functools import lru_cache
+
+from .packed_state import get_board
+
+
+class GoalTable:
+    """
+    Goal cells of tiles and per tile cost tables of a goal state.
+
+    It's built once per goal state (See goal_table) and is shared between all heuristics that use the same goal.
+    """
+
+    def __init__(self, goal_state):
+        board = get_board(len(goal_state))
+        n = board.n
+        # Goal cell, row and column of every tile
+        self.cells = [0] * board.size
+        for k, tile in enumerate(tile for row in goal_state for tile in row):
+            self.cells[tile] = k
+        self.rows = [cell // n for cell in self.cells]
+        self.cols = [cell % n for cell in self.cells]
+        # distances[tile][cell] is the manhattan distance of tile from it's goal cell when it's in cell
+        self.distances = [[abs(cell // n - self.rows[tile]) + abs(cell % n - self.cols[tile]) if tile else 0
+                           for cell in range(board.size)]
+                          for tile in range(board.size)]
+        # misplaced[tile][cell] is 1 if tile is not the blank tile and cell is not it's goal cell
+        self.misplaced = [[1 if tile and cell != self.cells[tile] else 0 for cell in range(board.size)]
+                          for tile in range(board.size)]
+
+
+@lru_cache(maxsize=16)
+def _goal_table(goal_state):
+    return GoalTable(goal_state)
+
+
+def goal_table(goal_state):
+    """
+    Returns the shared GoalTable of a two dimensional goal state.
+    """
+    return _goal_table(tuple(tuple(row) for row in goal_state))
+
+
+class Heuristic:
+    """
+    Base class of heuristics.
+
+    Subclasses should implement evaluate and if they can, update.
+    """
+
+    def __init__(self, goal_state):
+        """
+        goal_state : Two dimensional goal state that heuristic estimates the distance to.
+        """
+        self.board = get_board(len(goal_state))
+        self.goal_state = goal_state
+        self.goal = goal_table(goal_state)
+
+    def evaluate(self, packed):
+        """
+        Returns heuristic's value of a packed state.
+        """
+        raise NotImplementedError
+
+    def update(self, h, packed, tile, from_cell, to_cell):
+        """
+        Returns heuristic's value of a packed state that has been reached from a state with the value of h, by sliding
+        tile from from_cell to to_cell.
+
+        Default implementation evaluates packed from scratch.
+        """
+        return self.evaluate(packed)
+
+
+class TileHeuristic(Heuristic):
+    """
+    Base class of heuristics that are the sum of a cost for every tile which only depends on the tile's cell.
+
+    Subclasses should fill table, which table[tile][cell] is the cost of tile when it's in cell.
+    """
+
+    def __init__(self, goal_state):
+        super().__init__(goal_state)
+        self.table = None
+
+    def evaluate(self, packed):
+        table = self.table
+        return sum(table[tile][cell] for cell, tile in enumerate(self.board.unpack_list(packed)))
+
+    def update(self, h, packed, tile, from_cell, to_cell):
+        table = self.table[tile]
+        return h - table[from_cell] + table[to_cell]
+
+
+class ManhattanDistance(TileHeuristic):
+    """
+    Sum of the manhattan distances of tiles from their goal cells
+    """
+
+    def __init__(self, goal_state):
+        super().__init__(goal_state)
+        self.table = self.goal.distances
+
+
+class MisplacedTiles(TileHeuristic):
+    """
+    Number of tiles that are not in their goal cells
+    """
+
+    def __init__(self, goal_state):
+        super().__init__(goal_state)
+        self.table = self.goal.misplaced
+
+
+def line_conflicts(goal_positions):
+    """
+    Returns the minimum number of tiles that should be removed from a line so the rest of them are in their goal
+    order.
+
+    goal_positions : Goal positions (inside the line) of the line's tiles which their goal line is this line, in
+                     their current order.
+    """
+    # Length of the longest increasing subsequence
+    tails = []
+    for position in goal_positions:
+        i = bisect_left(tails, position)
+        if i == len(tails):
+            tails.append(position)
+        else:
+            tails[i] = position
+    return len(goal_positions) - len(tails)
+
+
+class LinearConflict(ManhattanDistance):
+    """
+    Manhattan distance plus two moves for every tile that should leave it's goal line to let other tiles pass it
+
+    Two tiles are in linear conflict if they are in their goal row (or column) but in reverse order. For every line,
+    the minimum number of tiles that should be removed to resolve all of it's conflicts is counted.
+    """
+
+    def __init__(self, goal_state):
+        super().__init__(goal_state)
+        n = self.board.n
+        # Cells of every row and every column
+        self.row_cells = [tuple(range(row * n, row * n + n)) for row in range(n)]
+        self.col_cells = [tuple(range(col, self.board.size, n)) for col in range(n)]
+        # Conflicts of lines that have already been computed (See line_value)
+        self.conflicts_cache = {}
+        self.conflicts_cache_size = 1000000
+
+    def row_conflicts(self, line_tiles, row):
+        goal = self.goal
+        return line_conflicts([goal.cols[tile] for tile in line_tiles if tile and goal.rows[tile] == row])
+
+    def col_conflicts(self, line_tiles, col):
+        goal = self.goal
+        return line_conflicts([goal.rows[tile] for tile in line_tiles if tile and goal.cols[tile] == col])
+
+    def line_value(self, is_row, line, line_tiles):
+        """
+        Returns conflicts of a row or column with the given tiles (as a tuple).
+
+        Results are cached since a line has few possible contents, the cache is cleared when it gets too big.
+        """
+        key = (is_row, line, line_tiles)
+        value = self.conflicts_cache.get(key)
+        if value is None:
+            if len(self.conflicts_cache) >= self.conflicts_cache_size:
+                self.conflicts_cache.clear()
+            if is_row:
+                value = self.row_conflicts(line_tiles, line)
+            else:
+                value = self.col_conflicts(line_tiles, line)
+            self.conflicts_cache[key] = value
+        return value
+
+    def evaluate(self, packed):
+        tiles = self.board.unpack_list(packed)
+        conflicts = 0
+        for line in range(self.board.n):
+            conflicts += self.row_conflicts([tiles[cell] for cell in self.row_cells[line]], line)
+            conflicts += self.col_conflicts([tiles[cell] for cell in self.col_cells[line]], line)
+        return super().evaluate(packed) + 2 * conflicts
+
+    def update(self, h, packed, tile, from_cell, to_cell):
+        n = self.board.n
+        tile_table = self.table[tile]
+        h = h - tile_table[from_cell] + tile_table[to_cell]
+        # A vertical move changes the tiles of two rows, a horizontal move the tiles of two columns, the order of tiles
+        # in the other lines stays the same
+        is_row = from_cell % n == to_cell % n
+        if is_row:
+            from_line, from_position = divmod(from_cell, n)
+            to_line, to_position = divmod(to_cell, n)
+            lines_cells = self.row_cells
+        else:
+            from_position, from_line = divmod(from_cell, n)
+            to_position, to_line = divmod(to_cell, n)
+            lines_cells = self.col_cells
+        shifts = self.board.shifts
+        mask = self.board.mask
+        line_value = self.line_value
+
+        # tile has left from_cell's line, the blank is in from_cell now
+        line_tiles = [(packed >> shifts[cell]) & mask for cell in lines_cells[from_line]]
+        h += 2 * line_value(is_row, from_line, tuple(line_tiles))
+        line_tiles[from_position] = tile
+        h -= 2 * line_value(is_row, from_line, tuple(line_tiles))
+
+        # tile has entered to_cell's line, where the blank was
+        line_tiles = [(packed >> shifts[cell]) & mask for cell in lines_cells[to_line]]
+        h += 2 * line_value(is_row, to_line, tuple(line_tiles))
+        line_tiles[to_position] = 0
+        h -= 2 * line_value(is_row, to_line, tuple(line_tiles))
+
+        return h
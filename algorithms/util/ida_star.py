@@ -0,0 +1,144 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Iterative deepening A* (IDA*) algorithm
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from .heuristics import TileHeuristic
+from .instrumentation import stats
+
+# Returned by dfs when the goal is found
+FOUND = -1
+# Returned by dfs when the search is stopped (See instrumentation)
+STOPPED = -2
+
+
+def bounded_dfs(heuristic, goal, path, transposition=None):
+    """
+    Returns the depth-first search function of IDA*, dfs(packed, blank, prev_blank, g, h, bound).
+
+    dfs searches the subtree of a packed state (which is the last item of path) that is bounded by f = g + h <= bound.
+    It returns FOUND, which path is the path to goal then, STOPPED if stats.stopped has been set or the smallest f value
+    which has exceeded the bound (None if there was no child to search).
+
+    heuristic : A heuristics.Heuristic object, children's values are computed by it's update method.
+    goal : Packed goal state.
+    path : List of packed states from the root to the searched state.
+    transposition : A transposition.TranspositionTable object. Children that have been solved before are not searched,
+                    their exact distance is used instead.
+    """
+    board = heuristic.board
+    shifts = board.shifts
+    mask = board.mask
+    neighbours = board.neighbours
+    lookup = transposition.lookup if transposition is not None else None
+
+    update = heuristic.update
+    # Tile heuristics are updated right inside dfs, which saves a function call per child
+    table = None
+    if isinstance(heuristic, TileHeuristic) and type(heuristic).update is TileHeuristic.update:
+        table = heuristic.table
+
+    def dfs(packed, blank, prev_blank, g, h, bound):
+        if packed == goal:
+            return FOUND
+        if stats.stopped:
+            return STOPPED
+
+        stats.expanded += 1
+        g += 1
+        minimum = None
+        blank_shift = shifts[blank]
+        cells = neighbours[blank]
+        stats.generated += len(cells) if prev_blank is None else len(cells) - 1
+        for cell in cells:
+            # Moving the blank back to where it was, just undoes the previous move
+            if cell == prev_blank:
+                continue
+            tile = (packed >> shifts[cell]) & mask
+            if table is None:
+                child = packed - (tile << shifts[cell]) + (tile << blank_shift)
+                child_h = update(h, child, tile, cell, blank)
+            else:
+                child = None
+                tile_table = table[tile]
+                child_h = h - tile_table[cell] + tile_table[blank]
+            f = g + child_h
+            if f > bound:
+                if minimum is None or f < minimum:
+                    minimum = f
+                continue
+            if child is None:
+                child = packed - (tile << shifts[cell]) + (tile << blank_shift)
+            if lookup is not None:
+                entry = lookup(child)
+                if entry is not None:
+                    # Child's distance is exact, so it's subtree doesn't need to be searched
+                    f = g + entry[0]
+                    if f > bound:
+                        if minimum is None or f < minimum:
+                            minimum = f
+                        continue
+                    solution = transposition.solution(child)
+                    if solution is not None:
+                        path.extend(solution)
+                        return FOUND
+            path.append(child)
+            t = dfs(child, cell, blank, g, child_h, bound)
+            # FOUND or STOPPED
+            if t is not None and t < 0:
+                return t
+            path.pop()
+            if t is not None and (minimum is None or t < minimum):
+                minimum = t
+
+        return minimum
+
+    return dfs
+
+
+def search(state, goal_state, heuristic, transposition=None):
+    """
+    IDA*
+
+    Depth-first search bounded by f = g + h, that is repeated with the smallest f which has exceeded the bound as the
+    new bound. Only the current path is kept in memory. Moves that undo the previous move are pruned.
+
+    heuristic : A heuristics.Heuristic object, children's values are computed by it's update method.
+    transposition : A transposition.TranspositionTable object. Children that have been solved before are not searched,
+                    their exact distance is used instead and the found path is recorded in it.
+
+    If it's stopped, returns the current bound as the lower bound (no path is shorter than it).
+    """
+    board = heuristic.board
+    goal = board.pack_goal(goal_state)
+
+    packed, blank = board.pack(state)
+    h = heuristic.evaluate(packed)
+
+    # Packed states of the current path, it's the only thing that grows with depth
+    path = [packed]
+    bound = h
+    if transposition is not None and transposition.lookup(packed) is not None:
+        solution = transposition.solution(packed)
+        if solution is not None:
+            return [board.unpack(p) for p in solution]
+    stats.track(bound=lambda: bound, depth=lambda: len(path) - 1)
+
+    dfs = bounded_dfs(heuristic, goal, path, transposition)
+    while True:
+        t = dfs(packed, blank, None, 0, h, bound)
+        if t == FOUND:
+            if transposition is not None:
+                transposition.record(path)
+            return [board.unpack(p) for p in path]
+        if t == STOPPED:
+            return stats.partial(bound=bound)
+        # There is no state left to search
+        if t is None:
+            return None
+        bound = t
@@ -0,0 +1,300 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Search statistics that algorithms update while they are searching
+
+Algorithms only increase counters in their loops, everything else (frontier size, current f bound and depth) is read
+from the algorithm's own data structures when a snapshot is taken, so the search loop doesn't pay for it.
+Snapshots are sent by a ProgressReporter thread at a fixed interval, so the app can show the search's progress.
+
+A search can be given a Budget (maximum expanded nodes, seconds and memory). A BudgetWatcher thread checks it at a fixed
+interval and sets stats.stopped when it's exceeded or the search is cancelled, so the search loop only reads one
+attribute. Algorithms that check it return a PartialResult with the best path and lower bound they have found so far:
+
+    if stats.stopped:
+        return stats.partial(best_path, bound)
+
+An algorithm that doesn't check it, is interrupted (KeyboardInterrupt is raised in the main thread) after
+GRACE_PERIOD seconds.
+
+Algorithms that don't find optimal solutions can keep a proven lower bound of the number of moves in
+stats.lower_bound, which solution's quality is measured against. Anytime algorithms report every better solution that
+they find with stats.improve, so it's shown while they are still searching.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import _thread
+import threading
+import time
+from collections import namedtuple
+
+# Default number of seconds between two progress snapshots
+PROGRESS_INTERVAL = 0.2
+# Number of seconds between two checks of a search's budget
+BUDGET_INTERVAL = 0.1
+# Number of seconds between two checks of a search's memory, which is slower than checking the other limits
+MEMORY_INTERVAL = 1
+# Number of seconds that a stopped search has to return it's partial result before it's interrupted
+GRACE_PERIOD = 1
+
+# Reasons of stopping a search
+STOP_NODES = 'nodes'
+STOP_SECONDS = 'seconds'
+STOP_MEMORY = 'memory'
+STOP_CANCELLED = 'cancelled'
+
+Budget = namedtuple('Budget', ('nodes', 'seconds', 'memory'))
+Budget.__new__.__defaults__ = (None, None, None)
+Budget.__doc__ = """
+Limits of a search, None means no limit. They are checked every BUDGET_INTERVAL seconds (memory every MEMORY_INTERVAL
+seconds), so a search can go a little over them.
+
+nodes : Maximum number of expanded nodes.
+seconds : Maximum wall time in seconds.
+memory : Maximum memory in MB.
+"""
+
+PartialResult = namedtuple('PartialResult', ('path', 'bound', 'reason'))
+PartialResult.__doc__ = """
+What a stopped search has found.
+
+path : List of two dimensional states from the puzzle towards the goal state (the most promising path that has been
+       found), None if there isn't one.
+bound : A lower bound of the number of moves of the puzzle's optimal solution, None if it's not known.
+reason : Why the search has been stopped, one of the STOP_* values.
+"""
+
+Improvement = namedtuple('Improvement', ('path', 'bound'))
+Improvement.__doc__ = """
+A solution that an anytime search has found, which is better than the previous ones.
+
+path : List of two dimensional states from the puzzle to the goal state.
+bound : Lower bound of the number of moves when the solution was found, None if it's not known.
+"""
+
+
+class SearchStats:
+    """
+    Counters of the running search.
+
+    There is only one search running in a process, so algorithms update the module's stats object directly:
+
+        stats.expanded += 1
+        stats.generated += len(children)
+
+    and register their data structures once with track.
+
+    stopped is None while the search can continue, otherwise it's the reason of stopping the search (See
+    BudgetWatcher).
+
+    lower_bound is a proven lower bound of the number of moves (None if it's not known) and best is the last path that
+    has been passed to improve. on_improvement is the function that improvements are passed to.
+    """
+    __slots__ = ('expanded', 'generated', 'frontier', 'bound', 'depth', 'stopped', 'lower_bound', 'best',
+                 'on_improvement')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.expanded = 0
+        self.generated = 0
+        self.frontier = None
+        self.bound = None
+        self.depth = None
+        self.stopped = None
+        self.lower_bound = None
+        self.best = None
+        self.on_improvement = None
+
+    def track(self, frontier=None, bound=None, depth=None):
+        """
+        Registers the running search's data structures.
+
+        frontier : The container of frontier's nodes (anything that has len).
+        bound : A function that returns the current f bound.
+        depth : A function that returns the current depth.
+        """
+        self.frontier = frontier
+        self.bound = bound
+        self.depth = depth
+
+    def snapshot(self):
+        """
+        Returns a (expanded, generated, frontier size, bound, depth) tuple, unknown values are None.
+
+        It's safe to call it from another thread while the search is running.
+        """
+        frontier = self.frontier
+        bound = self.bound
+        depth = self.depth
+        try:
+            return (self.expanded,
+                    self.generated,
+                    len(frontier) if frontier is not None else None,
+                    bound() if bound is not None else None,
+                    depth() if depth is not None else None)
+        except (IndexError, AttributeError):
+            # Frontier has changed while it was being read
+            return self.expanded, self.generated, None, None, None
+
+    def partial(self, path=None, bound=None):
+        """
+        Returns the PartialResult of a stopped search.
+
+        path : List of two dimensional states of the best path that has been found.
+        bound : Lower bound of the number of moves, if it's None lower_bound or the tracked f bound is used.
+        """
+        if bound is None:
+            bound = self.lower_bound if self.lower_bound is not None else self.snapshot()[3]
+        return PartialResult(path, bound, self.stopped)
+
+    def improve(self, path):
+        """
+        Reports a better solution of an anytime search.
+
+        path : List of two dimensional states from the puzzle to the goal state.
+        """
+        self.best = path
+        if self.on_improvement is not None:
+            self.on_improvement(Improvement(path, self.lower_bound))
+
+
+# Statistics of the search that is running in this process
+stats = SearchStats()
+
+
+def progress_text(snapshot):
+    """
+    Returns the text representation of a snapshot.
+    """
+    expanded, generated, frontier, bound, depth = snapshot
+    parts = ['Expanded: ' + str(expanded)]
+    if expanded:
+        parts.append('Branching factor: ' + str(round(generated / expanded, 2)))
+    if frontier is not None:
+        parts.append('Frontier: ' + str(frontier))
+    if bound is not None:
+        parts.append('f bound: ' + str(bound))
+    if depth is not None:
+        parts.append('Depth: ' + str(depth))
+    return '  '.join(parts)
+
+
+class ProgressReporter:
+    """
+    A thread that sends snapshots of stats every interval seconds while a search is running.
+    """
+
+    def __init__(self, send, interval=PROGRESS_INTERVAL):
+        """
+        send : Function that every snapshot is passed to, for example a pipe's send method.
+        interval : Seconds between two snapshots.
+        """
+        self.send = send
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.send(stats.snapshot())
+            except (OSError, EOFError):
+                # Receiver is gone
+                return
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the thread and sends the last snapshot.
+        """
+        self.stop_event.set()
+        self.thread.join()
+        try:
+            self.send(stats.snapshot())
+        except (OSError, EOFError):
+            pass
+
+
+class BudgetWatcher:
+    """
+    A thread that stops the running search when it exceeds it's budget or it's cancelled.
+
+    The search is stopped by setting stats.stopped, if it doesn't return in grace seconds KeyboardInterrupt is raised
+    in the main thread (which only happens when it runs Python code, not while it's waiting for a lock or a pipe).
+    """
+
+    def __init__(self, budget=None, memory=None, cancel=None, interval=BUDGET_INTERVAL, grace=GRACE_PERIOD,
+                 memory_interval=MEMORY_INTERVAL):
+        """
+        budget : A Budget, None means no limit.
+        memory : Function that returns the memory that search is using in MB, needed for budget's memory.
+        cancel : A Connection, receiving anything from it cancels the search.
+        interval : Seconds between two checks.
+        grace : Seconds that a stopped search has to return.
+        memory_interval : Seconds between two checks of the memory.
+        """
+        self.budget = budget or Budget()
+        self.memory = memory
+        self.cancel = cancel
+        self.interval = interval
+        self.grace = grace
+        self.memory_interval = memory_interval
+        self.memory_checked_at = None
+        self.interrupted = False
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def exceeded(self, started_at):
+        """
+        Returns the reason of stopping the search or None if it can continue.
+        """
+        budget = self.budget
+        now = time.monotonic()
+        if budget.nodes is not None and stats.expanded >= budget.nodes:
+            return STOP_NODES
+        if budget.seconds is not None and now - started_at >= budget.seconds:
+            return STOP_SECONDS
+        if budget.memory is not None and self.memory is not None and (
+                self.memory_checked_at is None or now - self.memory_checked_at >= self.memory_interval):
+            self.memory_checked_at = now
+            memory = self.memory()
+            if memory is not None and memory >= budget.memory:
+                return STOP_MEMORY
+        try:
+            if self.cancel is not None and self.cancel.poll():
+                self.cancel.recv()
+                return STOP_CANCELLED
+        except (OSError, EOFError):
+            # Nobody is waiting for the search anymore
+            return STOP_CANCELLED
+        return None
+
+    def run(self):
+        started_at = time.monotonic()
+        stopped_at = None
+        while not self.stop_event.wait(self.interval):
+            if stopped_at is None:
+                reason = self.exceeded(started_at)
+                if reason is not None:
+                    stats.stopped = reason
+                    stopped_at = time.monotonic()
+            elif time.monotonic() - stopped_at >= self.grace:
+                self.interrupted = True
+                _thread.interrupt_main()
+                return
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
@@ -0,0 +1,87 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Compact representation of paths
+
+A path is represented by it's first state and a string of the blank tile's moves: 'U', 'D', 'L' and 'R' mean the blank
+tile moves up, down, left or right. It takes one character per step instead of a whole board, so it's cheap to send
+from the search process to the app. Algorithms can return a MovePath instead of a list of states, the app replays it's
+moves to get the states back.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import math
+from collections import namedtuple
+
+MovePath = namedtuple('MovePath', ('start', 'moves'))
+MovePath.__doc__ = """
+A path as it's first state and the blank tile's moves.
+
+start : One dimensional list of the first state.
+moves : String of the blank tile's moves ('U', 'D', 'L' and 'R').
+"""
+
+# Change of the blank tile's (row, column) for every move
+DIRECTIONS = {
+    'U': (-1, 0),
+    'D': (1, 0),
+    'L': (0, -1),
+    'R': (0, 1),
+}
+
+
+def steps_to_moves(steps):
+    """
+    Returns the moves string of a path or None if a step is not one move away from the previous one.
+
+    steps : List of one dimensional states.
+    """
+    n = int(math.sqrt(len(steps[0])))
+    moves = []
+    blank = steps[0].index(0)
+    for previous, step in zip(steps, steps[1:]):
+        next_blank = step.index(0)
+        row, column = divmod(blank, n)
+        next_row, next_column = divmod(next_blank, n)
+        move = None
+        for direction, (d_row, d_column) in DIRECTIONS.items():
+            if (row + d_row, column + d_column) == (next_row, next_column):
+                move = direction
+        if move is None:
+            return None
+        # The only difference of two steps should be the slid tile
+        expected = previous[:]
+        expected[blank], expected[next_blank] = expected[next_blank], expected[blank]
+        if expected != step:
+            return None
+        moves.append(move)
+        blank = next_blank
+    return ''.join(moves)
+
+
+def replay(start, moves):
+    """
+    Returns the list of one dimensional states of a path by doing the moves on start or None if a move is not valid or
+    takes the blank tile out of the board.
+    """
+    n = int(math.sqrt(len(start)))
+    state = list(start)
+    blank = state.index(0)
+    steps = [state[:]]
+    for move in moves:
+        if move not in DIRECTIONS:
+            return None
+        d_row, d_column = DIRECTIONS[move]
+        row, column = divmod(blank, n)
+        row += d_row
+        column += d_column
+        if not (0 <= row < n and 0 <= column < n):
+            return None
+        next_blank = row * n + column
+        state[blank], state[next_blank] = state[next_blank], 0
+        blank = next_blank
+        steps.append(state[:])
+    return steps
@@ -0,0 +1,141 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Packed integer representation of n-puzzle states
+
+A state is packed into a single integer which every cell of the puzzle takes a fixed number of bits of it.
+Cell k (k = i * n + j) is stored at bits [k * bits, (k + 1) * bits).
+With 4 bits per cell an 8-puzzle takes 36 bits and a 15-puzzle exactly 64 bits, bigger puzzles simply use wider
+integers (a 24-puzzle takes 125 bits).
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from functools import lru_cache
+
+
+class Board:
+    """
+    Packing information and successor generator of an n * n board.
+    """
+
+    def __init__(self, n):
+        """
+        n : Puzzle's dimension (3 for 8-puzzle, 4 for 15-puzzle and so on).
+        """
+        self.n = n
+        self.size = n * n
+        # Number of bits that each cell takes
+        self.bits = max(1, (self.size - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        # Bit offset of every cell
+        self.shifts = tuple(k * self.bits for k in range(self.size))
+        # Neighbour cells of every cell in the same order that tree_search.operator generates them
+        # (up, left, down, right)
+        neighbours = []
+        for k in range(self.size):
+            i, j = divmod(k, n)
+            cells = []
+            if i != 0:
+                cells.append(k - n)
+            if j != 0:
+                cells.append(k - 1)
+            if i != n - 1:
+                cells.append(k + n)
+            if j != n - 1:
+                cells.append(k + 1)
+            neighbours.append(tuple(cells))
+        self.neighbours = tuple(neighbours)
+        # Last goal state that has been packed by pack_goal and it's packed value
+        self._goal_state = None
+        self._goal_packed = None
+
+    def pack(self, state):
+        """
+        Packs a two dimensional state.
+
+        Returns a (packed, blank) tuple which blank is the cell number of the blank tile.
+        """
+        packed = 0
+        blank = None
+        k = 0
+        for row in state:
+            for tile in row:
+                if tile == 0:
+                    blank = k
+                packed |= tile << self.shifts[k]
+                k += 1
+        return packed, blank
+
+    def pack_goal(self, goal_state):
+        """
+        Same as pack but only returns the packed value and remembers the last goal state it has packed.
+
+        Search algorithms compare every node with the same goal state object so it's only packed once.
+        """
+        if goal_state is not self._goal_state:
+            self._goal_packed = self.pack(goal_state)[0]
+            self._goal_state = goal_state
+        return self._goal_packed
+
+    def unpack(self, packed):
+        """
+        Converts a packed state to it's two dimensional representation.
+        """
+        return [[(packed >> self.shifts[i * self.n + j]) & self.mask for j in range(self.n)] for i in range(self.n)]
+
+    def unpack_list(self, packed):
+        """
+        Converts a packed state to it's one dimensional representation.
+        """
+        return [(packed >> shift) & self.mask for shift in self.shifts]
+
+    def tile_at(self, packed, cell):
+        """
+        Returns the tile that is in the given cell of a packed state.
+        """
+        return (packed >> self.shifts[cell]) & self.mask
+
+    def find_blank(self, packed):
+        """
+        Returns the cell number of the blank tile of a packed state.
+        """
+        mask = self.mask
+        for k, shift in enumerate(self.shifts):
+            if not (packed >> shift) & mask:
+                return k
+        return None
+
+    def slide(self, packed, blank, cell):
+        """
+        Slides the tile inside cell to the blank cell.
+
+        Returns a (packed, tile) tuple which packed is the new state and tile is the tile that has been slid,
+        the new blank cell is cell.
+        """
+        tile = (packed >> self.shifts[cell]) & self.mask
+        return packed - (tile << self.shifts[cell]) + (tile << self.shifts[blank]), tile
+
+    def successors(self, packed, blank):
+        """
+        Generates all states that are reachable from a packed state.
+
+        Yields (packed, blank, tile) tuples which tile is the tile that has moved from the new blank cell to the
+        previous blank cell.
+        """
+        shifts = self.shifts
+        mask = self.mask
+        blank_shift = shifts[blank]
+        for cell in self.neighbours[blank]:
+            tile = (packed >> shifts[cell]) & mask
+            yield packed - (tile << shifts[cell]) + (tile << blank_shift), cell, tile
+
+
+@lru_cache(maxsize=None)
+def get_board(n):
+    """
+    Returns the shared Board object of an n * n puzzle.
+    """
+    return Board(n)
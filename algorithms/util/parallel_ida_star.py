@@ -0,0 +1,151 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Parallel iterative deepening A* (IDA*) algorithm
+
+The top levels of the search tree are expanded breadth-first into work units, about UNITS_PER_PROCESS of them for
+every process. Each iteration hands the units that fit in the current bound to a pool of processes, the biggest
+subtrees (lowest f) first. Idle processes take the next unit from the pool's shared queue, so a process that got small
+subtrees keeps taking work that would otherwise wait for the busy ones. Units are searched with the same depth-first
+search as IDA* and the smallest f that has exceeded the bound in any of them is the next iteration's bound.
+
+Since every unit of an iteration is searched with the same bound, the first path that is found is optimal and the
+remaining units are cancelled by terminating the pool.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import multiprocessing
+import os
+
+from . import ida_star
+from .instrumentation import BUDGET_INTERVAL, stats
+
+# Number of work units for each process
+UNITS_PER_PROCESS = 16
+
+# Path and depth-first search function of a worker process
+_worker_path = None
+_worker_dfs = None
+
+
+def _init_worker(heuristic_class, goal_state):
+    global _worker_path, _worker_dfs
+    heuristic = heuristic_class(goal_state)
+    _worker_path = []
+    _worker_dfs = ida_star.bounded_dfs(heuristic, heuristic.board.pack_goal(goal_state), _worker_path)
+
+
+def _search_unit(task):
+    """
+    Searches a work unit's subtree.
+
+    task : A (prefix, blank, prev_blank, g, h, bound) tuple, prefix is the list of packed states from the root to the
+           unit's state.
+
+    Returns a (t, path, expanded, generated) tuple which t is dfs's returned value and path is the path to goal if t is
+    FOUND.
+    """
+    prefix, blank, prev_blank, g, h, bound = task
+    _worker_path[:] = prefix
+    stats.reset()
+    t = _worker_dfs(prefix[-1], blank, prev_blank, g, h, bound)
+    return t, _worker_path if t == ida_star.FOUND else None, stats.expanded, stats.generated
+
+
+def split(heuristic, goal, packed, blank, h, count):
+    """
+    Expands the top levels of the search tree until there are at least count leaves.
+
+    Returns the list of (prefix, blank, prev_blank, g, h, f) tuples of the leaves, f is the largest f on the leaf's
+    prefix, so a leaf is only searched when all of it's ancestors fit in the bound too.
+    """
+    board = heuristic.board
+    update = heuristic.update
+    units = [([packed], blank, None, 0, h, h)]
+    while len(units) < count:
+        next_units = []
+        for unit in units:
+            prefix, blank, prev_blank, g, h, f = unit
+            packed = prefix[-1]
+            # Goal state is a leaf of the tree
+            if packed == goal:
+                next_units.append(unit)
+                continue
+            stats.expanded += 1
+            for child, cell, tile in board.successors(packed, blank):
+                # Moving the blank back to where it was, just undoes the previous move
+                if cell == prev_blank:
+                    continue
+                stats.generated += 1
+                child_h = update(h, child, tile, cell, blank)
+                next_units.append((prefix + [child], cell, blank, g + 1, child_h, max(f, g + 1 + child_h)))
+        if len(next_units) == len(units):
+            break
+        units = next_units
+    units.sort(key=lambda unit: (unit[5], -unit[4]))
+    return units
+
+
+def search(state, goal_state, heuristic_class, processes=None):
+    """
+    Parallel IDA*
+
+    heuristic_class : A heuristics.Heuristic class, every process makes it's own heuristic with goal_state.
+    processes : Number of processes, None means number of CPUs.
+
+    Falls back to ida_star.search if there is only one process to use.
+    """
+    heuristic = heuristic_class(goal_state)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    # Daemonic processes (like the batch workers) are not allowed to have children
+    if multiprocessing.current_process().daemon:
+        processes = 1
+    if processes <= 1:
+        return ida_star.search(state, goal_state, heuristic)
+
+    board = heuristic.board
+    goal = board.pack_goal(goal_state)
+    packed, blank = board.pack(state)
+    h = heuristic.evaluate(packed)
+    units = split(heuristic, goal, packed, blank, h, processes * UNITS_PER_PROCESS)
+
+    bound = h
+    stats.track(bound=lambda: bound)
+    pool = multiprocessing.Pool(processes, _init_worker, (heuristic_class, goal_state))
+    try:
+        while True:
+            minimum = None
+            tasks = []
+            for prefix, unit_blank, prev_blank, g, unit_h, f in units:
+                if f > bound:
+                    if minimum is None or f < minimum:
+                        minimum = f
+                else:
+                    tasks.append((prefix, unit_blank, prev_blank, g, unit_h, bound))
+            results = pool.imap_unordered(_search_unit, tasks)
+            while True:
+                # Units don't know about stats.stopped, so results are waited for a short time to check it
+                try:
+                    t, path, expanded, generated = results.next(BUDGET_INTERVAL)
+                except multiprocessing.TimeoutError:
+                    if stats.stopped:
+                        return stats.partial(bound=bound)
+                    continue
+                except StopIteration:
+                    break
+                stats.expanded += expanded
+                stats.generated += generated
+                if t == ida_star.FOUND:
+                    return [board.unpack(p) for p in path]
+                if t is not None and (minimum is None or t < minimum):
+                    minimum = t
+            # There is no state left to search
+            if minimum is None:
+                return None
+            bound = minimum
+    finally:
+        pool.terminate()
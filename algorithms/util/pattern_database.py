@@ -0,0 +1,425 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Disjoint additive pattern databases
+
+Tiles (except the blank tile) are divided into disjoint groups. Each group's table keeps, for every placement of the
+group's tiles, the minimum number of moves of the group's own tiles that is needed to bring them to their goal cells.
+Since every move only moves one tile, the sum of the groups' values is an admissible heuristic.
+
+Tables are built by a breadth-first search backwards from the goal, stored as byte arrays (one byte per placement) in
+CACHE_DIR and are memory-mapped on later runs. Building is done in parallel and is checkpointed, so an interrupted
+build continues from it's last checkpoint. A table's build is locked with a lock file, so processes that need the same
+table at the same time build it once.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import hashlib
+import mmap
+import multiprocessing
+import os
+import struct
+import time
+from array import array
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+from .heuristics import Heuristic
+from .packed_state import get_board
+
+# Directory that tables are kept in
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pynpuzzle', 'pdb')
+# Default sizes of tiles groups for each puzzle dimension
+DEFAULT_PARTITIONS = {
+    3: (4, 4),
+    4: (6, 6, 3),
+}
+# Minimum number of seconds between two checkpoints of a build
+CHECKPOINT_INTERVAL = 60
+# Number of states that are sent to a worker process at once
+CHUNK_SIZE = 20000
+# Value of the table entries which have not been reached yet
+UNKNOWN = 255
+
+
+class Ranker:
+    """
+    Maps placements of k tiles on an n * n board to consecutive integers.
+
+    A placement is the tuple of the cells of the tiles and it's rank is it's index among all k-permutations of the
+    board's cells.
+    """
+
+    def __init__(self, n, k):
+        self.size = n * n
+        self.k = k
+        self.neighbours = get_board(n).neighbours
+        # factors[i] is the number of placements of the tiles after the ith tile
+        self.factors = []
+        for i in range(k):
+            factor = 1
+            for j in range(self.size - k + 1, self.size - i):
+                factor *= j
+            self.factors.append(factor)
+        # Number of all placements
+        self.count = self.factors[0] * self.size if k else 1
+
+    def rank(self, cells):
+        r = 0
+        for i, cell in enumerate(cells):
+            smaller = 0
+            for j in range(i):
+                if cells[j] < cell:
+                    smaller += 1
+            r += (cell - smaller) * self.factors[i]
+        return r
+
+    def unrank(self, r):
+        cells = []
+        used = []
+        for factor in self.factors:
+            d, r = divmod(r, factor)
+            # Find the dth unused cell
+            for cell in used:
+                if cell <= d:
+                    d += 1
+                else:
+                    break
+            cells.append(d)
+            used.append(d)
+            used.sort()
+        return cells
+
+    def expand(self, states):
+        """
+        Expands build states. A build state is rank * size + blank cell.
+
+        Returns a (zero, one) tuple of lists, zero contains the states that are reached by moving the blank to a cell
+        which is not occupied by the group's tiles (which doesn't count as a move) and one contains the states that
+        are reached by moving one of the group's tiles.
+        """
+        size = self.size
+        neighbours = self.neighbours
+        zero = []
+        one = []
+        for state in states:
+            r, blank = divmod(state, size)
+            cells = self.unrank(r)
+            for cell in neighbours[blank]:
+                if cell in cells:
+                    moved = cells[:]
+                    moved[cells.index(cell)] = blank
+                    one.append(self.rank(moved) * size + cell)
+                else:
+                    zero.append(r * size + cell)
+        return zero, one
+
+
+# Ranker of the worker processes
+_worker_ranker = None
+
+
+def _init_worker(n, k):
+    global _worker_ranker
+    _worker_ranker = Ranker(n, k)
+
+
+def _expand_chunk(chunk):
+    zero, one = _worker_ranker.expand(array('q', chunk))
+    return array('q', zero).tobytes(), array('q', one).tobytes()
+
+
+class _Checkpoint:
+    """
+    Saves and loads build's progress: the table, visited states, next cost's frontier and the cost.
+    """
+    header = struct.Struct('<4Q')
+
+    def __init__(self, path):
+        self.path = path
+        self.saved_at = time.monotonic()
+
+    def load(self):
+        """
+        Returns (cost, table, visited, frontier) or None if there is no checkpoint.
+        """
+        try:
+            with open(self.path, 'rb') as file:
+                cost, table_len, visited_len, frontier_len = self.header.unpack(file.read(self.header.size))
+                table = bytearray(file.read(table_len))
+                visited = bytearray(file.read(visited_len))
+                frontier = array('q')
+                frontier.frombytes(file.read(frontier_len * frontier.itemsize))
+        except (OSError, struct.error):
+            return None
+        if len(table) != table_len or len(visited) != visited_len or len(frontier) != frontier_len:
+            return None
+        return cost, table, visited, frontier
+
+    def save(self, cost, table, visited, frontier):
+        if time.monotonic() - self.saved_at < CHECKPOINT_INTERVAL:
+            return
+        tmp_path = self.path + '.' + str(os.getpid()) + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(self.header.pack(cost, len(table), len(visited), len(frontier)))
+            file.write(table)
+            file.write(visited)
+            file.write(frontier.tobytes())
+        os.replace(tmp_path, self.path)
+        self.saved_at = time.monotonic()
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+@contextmanager
+def _locked(path):
+    """
+    Holds an exclusive lock on the file at path (which is created if it doesn't exist), waits until it's released if
+    another process holds it.
+    """
+    with open(path, 'ab') as file:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            # msvcrt gives up after 10 seconds but a build may take much longer
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def build_table(n, goal_cells, blank_cell, path, processes=None):
+    """
+    Builds a group's table and saves it to path.
+
+    The build is locked with a lock file next to path, if another process has built the table while this one was
+    waiting for the lock, nothing is done.
+
+    n : Puzzle's dimension.
+    goal_cells : Goal cells of group's tiles.
+    blank_cell : Goal cell of the blank tile.
+    path : The file that table is saved to. Checkpoints are saved next to it.
+    processes : Number of worker processes, None means number of CPUs.
+    """
+    with _locked(path + '.lock'):
+        if not os.path.exists(path):
+            _build_table(n, goal_cells, blank_cell, path, processes)
+
+
+def _build_table(n, goal_cells, blank_cell, path, processes):
+    ranker = Ranker(n, len(goal_cells))
+    size = ranker.size
+    checkpoint = _Checkpoint(path + '.partial')
+
+    progress = checkpoint.load()
+    if progress:
+        cost, table, visited, frontier = progress
+    else:
+        cost = 0
+        table = bytearray([UNKNOWN]) * ranker.count
+        visited = bytearray((ranker.count * size + 7) // 8)
+        frontier = array('q', [ranker.rank(goal_cells) * size + blank_cell])
+    if processes is None:
+        processes = os.cpu_count() or 1
+    # Daemonic processes (like the app's search process) are not allowed to have children
+    if multiprocessing.current_process().daemon:
+        processes = 1
+    pool = None
+    if processes > 1:
+        pool = multiprocessing.Pool(processes, _init_worker, (n, len(goal_cells)))
+
+    def expand(states):
+        """
+        Yields (zero, one) tuples of expanded states.
+        """
+        if pool is None:
+            yield ranker.expand(states)
+            return
+        chunks = (array('q', states[i:i + CHUNK_SIZE]).tobytes() for i in range(0, len(states), CHUNK_SIZE))
+        for zero, one in pool.imap_unordered(_expand_chunk, chunks):
+            zero_states = array('q')
+            zero_states.frombytes(zero)
+            one_states = array('q')
+            one_states.frombytes(one)
+            yield zero_states, one_states
+
+    def fresh(states):
+        """
+        Returns the states that have not been visited yet and marks them as visited.
+        """
+        result = array('q')
+        for state in states:
+            byte = state >> 3
+            bit = 1 << (state & 7)
+            if not visited[byte] & bit:
+                visited[byte] |= bit
+                result.append(state)
+        return result
+
+    try:
+        while frontier:
+            current = fresh(frontier)
+            next_frontier = array('q')
+            # States that have been added to the next cost's frontier
+            queued = bytearray(len(visited))
+            while current:
+                for state in current:
+                    r = state // size
+                    if table[r] == UNKNOWN:
+                        table[r] = cost
+                next_current = array('q')
+                for zero, one in expand(current):
+                    next_current.extend(fresh(zero))
+                    for state in one:
+                        byte = state >> 3
+                        bit = 1 << (state & 7)
+                        if not visited[byte] & bit and not queued[byte] & bit:
+                            queued[byte] |= bit
+                            next_frontier.append(state)
+                current = next_current
+            frontier = next_frontier
+            cost += 1
+            # Progress is only consistent between two costs, so that's where it's saved
+            checkpoint.save(cost, table, visited, frontier)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    tmp_path = path + '.' + str(os.getpid()) + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(table)
+    os.replace(tmp_path, path)
+    checkpoint.remove()
+
+
+def load_table(path):
+    """
+    Memory-maps a table file and returns it.
+    """
+    with open(path, 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def partition_tiles(goal_state, sizes):
+    """
+    Divides the tiles of a goal state into groups with the given sizes.
+
+    Tiles are taken in order of their goal cells, so every group's goal cells are next to each other.
+    """
+    cells = [tile for row in goal_state for tile in row]
+    tiles = [tile for tile in cells if tile]
+    if sum(sizes) != len(tiles):
+        raise ValueError('Groups sizes should add up to ' + str(len(tiles)))
+    groups = []
+    start = 0
+    for group_size in sizes:
+        groups.append(tuple(tiles[start:start + group_size]))
+        start += group_size
+    return groups
+
+
+class PatternDatabase(Heuristic):
+    """
+    Sum of the values of disjoint pattern databases
+    """
+
+    def __init__(self, goal_state, sizes=None, cache_dir=None, processes=None):
+        """
+        goal_state : Two dimensional goal state.
+        sizes : Sizes of tiles groups, (See DEFAULT_PARTITIONS).
+        cache_dir : Directory that tables are kept in, default is CACHE_DIR.
+        processes : Number of processes that build the tables, None means number of CPUs.
+        """
+        super().__init__(goal_state)
+        n = self.board.n
+        if sizes is None:
+            if n not in DEFAULT_PARTITIONS:
+                raise ValueError('There is no default partition for ' + str(n * n - 1) + '-puzzle')
+            sizes = DEFAULT_PARTITIONS[n]
+        if cache_dir is None:
+            cache_dir = CACHE_DIR
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.groups = partition_tiles(goal_state, sizes)
+        self.rankers = []
+        self.tables = []
+        # Index of every tile's group (None for the blank tile) and the tile's index inside it's group
+        self.tile_groups = [None] * self.board.size
+        self.tile_positions = [None] * self.board.size
+        for index, group in enumerate(self.groups):
+            goal_cells = [self.goal.cells[tile] for tile in group]
+            key = hashlib.sha1(repr((n, goal_cells, self.goal.cells[0])).encode()).hexdigest()[:16]
+            path = os.path.join(cache_dir, str(n * n - 1) + '-puzzle-' + str(len(group)) + '-' + key + '.pdb')
+            if not os.path.exists(path):
+                build_table(n, goal_cells, self.goal.cells[0], path, processes)
+            self.rankers.append(Ranker(n, len(group)))
+            self.tables.append(load_table(path))
+            for position, tile in enumerate(group):
+                self.tile_groups[tile] = index
+                self.tile_positions[tile] = position
+        # (placements, ranks) of states that have been evaluated or updated (See update), the cache is cleared when it
+        # gets too big
+        self.placements_cache = {}
+        self.placements_cache_size = 100000
+
+    def placements(self, packed):
+        """
+        Returns (placements, ranks) of a packed state, placements is a tuple of the cells of every group's tiles and
+        ranks are their ranks.
+        """
+        cells_of_tiles = [0] * self.board.size
+        for cell, tile in enumerate(self.board.unpack_list(packed)):
+            cells_of_tiles[tile] = cell
+        placements = tuple(tuple(cells_of_tiles[tile] for tile in group) for group in self.groups)
+        return placements, tuple(ranker.rank(cells) for ranker, cells in zip(self.rankers, placements))
+
+    def evaluate(self, packed):
+        placements, ranks = self.placements(packed)
+        if len(self.placements_cache) >= self.placements_cache_size:
+            self.placements_cache.clear()
+        self.placements_cache[packed] = placements, ranks
+        return sum(table[r] for table, r in zip(self.tables, ranks))
+
+    def update(self, h, packed, tile, from_cell, to_cell):
+        # The state before the move is usually in the cache, only the moved tile's group changes and in it's placement
+        # only the tile's cell
+        shifts = self.board.shifts
+        parent = packed - (tile << shifts[to_cell]) + (tile << shifts[from_cell])
+        placements_cache = self.placements_cache
+        entry = placements_cache.get(parent)
+        if entry is None:
+            entry = self.placements(parent)
+        placements, ranks = entry
+        index = self.tile_groups[tile]
+        cells = list(placements[index])
+        cells[self.tile_positions[tile]] = to_cell
+        r = self.rankers[index].rank(cells)
+        if len(placements_cache) >= self.placements_cache_size:
+            placements_cache.clear()
+        placements_cache[packed] = (placements[:index] + (tuple(cells),) + placements[index + 1:],
+                                    ranks[:index] + (r,) + ranks[index + 1:])
+        table = self.tables[index]
+        return h - table[ranks[index]] + table[r]
@@ -0,0 +1,226 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Simplified memory-bounded A* (SMA*) algorithm
+
+SMA* works like A* until the number of nodes in memory reaches it's budget. Then the worst leaf (highest f, and the
+shallowest one between them) is forgotten and it's f value is kept in it's parent, so the parent knows how good the
+forgotten subtree was and can regenerate it when it becomes the best choice again. A node's f value is backed up from
+it's children once all of them have been generated, so f values of the remembered nodes are the best lower bounds that
+are known for their subtrees.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import heapq
+import sys
+
+from .instrumentation import stats
+from .packed_state import get_board
+
+INFINITY = float('inf')
+
+
+class SMANode:
+    """
+    A node of SMA*'s search tree.
+
+    successors are the (packed, blank, tile) tuples of the children that have never been generated, children are the
+    children that are in memory and forgotten maps the packed states of the forgotten children to their f values.
+    """
+    __slots__ = ('packed', 'blank', 'parent', 'g', 'h', 'f', 'depth', 'successors', 'children', 'forgotten',
+                 'alive')
+
+    def __init__(self, packed, blank, parent, g, h, f, depth, successors):
+        self.packed = packed
+        self.blank = blank
+        self.parent = parent
+        self.g = g
+        self.h = h
+        self.f = f
+        self.depth = depth
+        self.successors = successors
+        self.children = []
+        self.forgotten = {}
+        self.alive = True
+
+    def has_pending(self):
+        """
+        Returns True if node has a child that is not in memory.
+        """
+        return bool(self.successors or self.forgotten)
+
+    def backed_up_f(self):
+        """
+        Returns the smallest f of node's children, it's only meaningful when all of them have been generated once.
+        """
+        f = INFINITY
+        for child in self.children:
+            if child.f < f:
+                f = child.f
+        for child_f in self.forgotten.values():
+            if child_f < f:
+                f = child_f
+        return f
+
+
+def node_size(n):
+    """
+    Returns the approximate number of bytes that a node of an n * n board takes in memory.
+    """
+    board = get_board(n)
+    packed = (1 << (board.bits * board.size)) - 1
+    node = SMANode(packed, 0, None, 0, 0, 0, 0, [(packed, 0, 0)] * 3)
+    node.children.append(node)
+    node.forgotten[packed] = 0
+    size = (sys.getsizeof(node) + sys.getsizeof(node.packed) + sys.getsizeof(node.successors) +
+            sys.getsizeof(node.successors[0]) * 3 + sys.getsizeof(node.children) + sys.getsizeof(node.forgotten))
+    # Every node is in both of the queues
+    return size + 2 * sys.getsizeof((0, 0, 0, node))
+
+
+def search(state, goal_state, heuristic, max_nodes):
+    """
+    SMA*
+
+    heuristic : A heuristics.Heuristic object, children's values are computed by it's update method.
+    max_nodes : Maximum number of nodes that are kept in memory. It should be more than the length of the optimal
+                path, otherwise there is no solution that fits in memory.
+
+    Returns None if there is no solution that fits in memory.
+    """
+    board = heuristic.board
+    goal = board.pack_goal(goal_state)
+    update = heuristic.update
+
+    # Nodes that have children which are not in memory, the best (lowest f, and the deepest one between them) first
+    open_queue = []
+    # Leaves, the worst (highest f, and the shallowest one between them) first
+    leaves = []
+    # Makes queue items unique, so nodes are never compared
+    entrance = 0
+    # Nodes that are in memory
+    memory = set()
+
+    def successors(packed, blank, parent_blank):
+        # Moving the blank back to where it was, just undoes the previous move
+        return [successor for successor in board.successors(packed, blank) if successor[1] != parent_blank]
+
+    packed, blank = board.pack(state)
+    h = heuristic.evaluate(packed)
+    root = SMANode(packed, blank, None, 0, h, h, 0, successors(packed, blank, None))
+    memory.add(root)
+    heapq.heappush(open_queue, (root.f, 0, entrance, root))
+    entrance += 1
+
+    stats.track(memory, lambda: root.f)
+
+    def push_open(node):
+        nonlocal entrance
+        heapq.heappush(open_queue, (node.f, -node.depth, entrance, node))
+        entrance += 1
+
+    def push_leaf(node):
+        nonlocal entrance
+        heapq.heappush(leaves, (-node.f, node.depth, entrance, node))
+        entrance += 1
+
+    def back_up(node):
+        """
+        Updates f values of node and it's ancestors from their children.
+        """
+        while node is not None and not node.successors:
+            f = node.backed_up_f()
+            if f == node.f:
+                return
+            node.f = f
+            if node.has_pending():
+                push_open(node)
+            if not node.children and node is not root:
+                push_leaf(node)
+            node = node.parent
+
+    def forget_worst_leaf():
+        """
+        Removes the worst leaf from memory. Returns False if there is no leaf to remove.
+        """
+        while leaves:
+            minus_f, _, _, leaf = heapq.heappop(leaves)
+            if not leaf.alive or leaf.children or leaf is root or -minus_f != leaf.f:
+                continue
+            leaf.alive = False
+            memory.discard(leaf)
+            parent = leaf.parent
+            parent.children.remove(leaf)
+            parent.forgotten[leaf.packed] = leaf.f
+            # Parent has a child that is not in memory now
+            push_open(parent)
+            if not parent.children and parent is not root:
+                push_leaf(parent)
+            return True
+        return False
+
+    while open_queue:
+        if stats.stopped:
+            # root's f is the lowest f of all of the paths that have not been searched yet
+            return stats.partial(bound=root.f)
+        f, _, _, node = heapq.heappop(open_queue)
+        # Skip the items that are not valid anymore
+        if not node.alive or f != node.f or not (node.has_pending() or node.packed == goal):
+            continue
+        if node.f == INFINITY:
+            # All of the remaining paths need more memory than the budget
+            return None
+        if node.packed == goal:
+            output = []
+            while node is not None:
+                output.append(board.unpack(node.packed))
+                node = node.parent
+            output.reverse()
+            return output
+
+        if not node.children:
+            stats.expanded += 1
+        stats.generated += 1
+        # Generate the next child which is not in memory, the children that have never been generated come first and
+        # then the best forgotten one
+        if node.successors:
+            child_packed, child_blank, tile = node.successors.pop()
+            forgotten_f = None
+        else:
+            child_packed = min(node.forgotten, key=node.forgotten.get)
+            forgotten_f = node.forgotten.pop(child_packed)
+            child_blank = board.find_blank(child_packed)
+            tile = board.tile_at(node.packed, child_blank)
+
+        depth = node.depth + 1
+        child_h = update(node.h, child_packed, tile, child_blank, node.blank)
+        if child_packed != goal and depth >= max_nodes - 1:
+            # The child can't have children, since the path from the root would not fit in memory
+            child_f = INFINITY
+            child_successors = []
+        else:
+            child_f = max(node.f, node.g + 1 + child_h)
+            if forgotten_f is not None:
+                child_f = max(child_f, forgotten_f)
+            child_successors = successors(child_packed, child_blank, node.blank)
+            if not child_successors and child_packed != goal:
+                # A dead end
+                child_f = INFINITY
+        child = SMANode(child_packed, child_blank, node, node.g + 1, child_h, child_f, depth, child_successors)
+        node.children.append(child)
+        memory.add(child)
+        push_leaf(child)
+        if child.has_pending() or child_packed == goal:
+            push_open(child)
+
+        back_up(node)
+        if node.has_pending():
+            push_open(node)
+
+        while len(memory) > max_nodes and forget_worst_leaf():
+            pass
+
+    return None
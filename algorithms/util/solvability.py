@@ -0,0 +1,79 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Solvability check of puzzles
+
+Half of the states of an n-puzzle can't be reached from the other half. A state can be reached from a goal state if
+the permutation of tiles (relative to the goal state's order) and the blank tile's row distance have the right parity.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import math
+
+
+def count_inversions(lst):
+    """
+    Returns the number of pairs of items of a list which are not in ascending order, using merge sort (O(n log n)).
+    """
+    items = list(lst)
+    buffer = items[:]
+    inversions = 0
+    width = 1
+    # Bottom-up merge sort, every pass merges pairs of sorted runs of length width
+    while width < len(items):
+        for start in range(0, len(items), 2 * width):
+            middle = min(start + width, len(items))
+            end = min(start + 2 * width, len(items))
+            i, j, k = start, middle, start
+            while i < middle and j < end:
+                if items[j] < items[i]:
+                    # items[j] is smaller than all of the remaining items of the left run
+                    inversions += middle - i
+                    buffer[k] = items[j]
+                    j += 1
+                else:
+                    buffer[k] = items[i]
+                    i += 1
+                k += 1
+            buffer[k:end] = items[i:middle] if i < middle else items[j:end]
+        items, buffer = buffer, items
+        width *= 2
+    return inversions
+
+
+def is_solvable(lst, goal_lst):
+    """
+    Returns True if goal state can be reached from a puzzle.
+
+    lst : One dimensional list of the puzzle.
+    goal_lst : One dimensional list of the goal state.
+    """
+    n = int(math.sqrt(len(lst)))
+    # Index of every tile in goal state's order (the blank tile is not counted)
+    order = {}
+    for tile in goal_lst:
+        if tile:
+            order[tile] = len(order)
+    inversions = count_inversions([order[tile] for tile in lst if tile])
+
+    if n % 2 == 1:
+        return inversions % 2 == 0
+    # On boards with an even width, moving the blank tile to another row changes the inversions' parity
+    blank_rows = abs(lst.index(0) // n - goal_lst.index(0) // n)
+    return (inversions + blank_rows) % 2 == 0
+
+
+def make_solvable(lst, goal_lst):
+    """
+    Returns a puzzle that goal state can be reached from, which is lst itself or lst with two tiles swapped.
+    """
+    if is_solvable(lst, goal_lst):
+        return lst
+    lst = lst[:]
+    # Swapping two tiles (not the blank tile) changes the permutation's parity
+    i, j = [k for k, tile in enumerate(lst) if tile][:2]
+    lst[i], lst[j] = lst[j], lst[i]
+    return lst
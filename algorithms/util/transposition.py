@@ -0,0 +1,158 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Persistent transposition table of solved states
+
+Every state on an optimal path is itself solved optimally by the rest of that path, so after an optimal solve the exact
+distance to the goal and the best move of each of it's states are known. The table keeps them in a SQLite database in
+CACHE_DIR, keyed by the goal state and the packed state, so later searches towards the same goal can stop as soon as
+they reach a known state. The database holds at most MAX_ENTRIES states, the least recently used ones are evicted
+first.
+
+Entries of a goal state are loaded into a dictionary the first time a table of that goal state is opened in a process
+and the later tables share it, so a process that runs many searches (like the app's search worker) only loads them
+once, and a lookup in the search loop costs a single dictionary access. The table is only a cache, database errors
+(e.g. a locked database while several processes write to it) are ignored.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import os
+import sqlite3
+
+from .packed_state import get_board
+
+# Directory that the database is kept in
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pynpuzzle')
+# Name of the database file
+DATABASE_NAME = 'transposition.sqlite'
+# Maximum number of states in the database (of all goal states)
+MAX_ENTRIES = 500000
+# Number of seconds to wait for a database which is locked by another process
+LOCK_TIMEOUT = 5
+
+# Entries that have been loaded in this process, (database path, goal key) -> entries (See TranspositionTable.entries)
+_loaded_entries = {}
+
+
+class TranspositionTable:
+    """
+    Exact distances to a goal state and best moves of the states that have been solved optimally before.
+    """
+
+    def __init__(self, goal_state, path=None, max_entries=None):
+        """
+        goal_state : Two dimensional goal state.
+        path : Path of the database file, default is DATABASE_NAME in CACHE_DIR.
+        max_entries : Maximum number of states in the database, default is MAX_ENTRIES.
+        """
+        self.board = get_board(len(goal_state))
+        self.goal = self.board.pack_goal(goal_state)
+        self.goal_key = ' '.join(str(tile) for row in goal_state for tile in row)
+        self.max_entries = MAX_ENTRIES if max_entries is None else max_entries
+        # Number of bytes of a packed state
+        self.state_bytes = (self.board.bits * self.board.size + 7) // 8
+        # States that have been looked up successfully and are not in the database's recent history yet
+        self.used = set()
+        self.connection = None
+
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, DATABASE_NAME)
+        # Maps packed states to (distance, next_blank) tuples, next_blank is the blank tile's cell after the best move.
+        # It's shared by the tables of the same database and goal state (See _loaded_entries).
+        self.entries = _loaded_entries.get((path, self.goal_key))
+        try:
+            self.connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+            self.connection.execute('CREATE TABLE IF NOT EXISTS states (goal TEXT NOT NULL, state BLOB NOT NULL, '
+                                    'distance INTEGER NOT NULL, next_blank INTEGER NOT NULL, used INTEGER NOT NULL, '
+                                    'PRIMARY KEY (goal, state))')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS states_used ON states (used)')
+            self.connection.commit()
+            if self.entries is None:
+                entries = {}
+                for state, distance, next_blank in self.connection.execute(
+                        'SELECT state, distance, next_blank FROM states WHERE goal = ?', (self.goal_key,)):
+                    entries[int.from_bytes(state, 'big')] = (distance, next_blank)
+                self.entries = _loaded_entries[(path, self.goal_key)] = entries
+        except sqlite3.Error:
+            self.close()
+        if self.entries is None:
+            self.entries = {}
+
+    def lookup(self, packed):
+        """
+        Returns the (distance, next_blank) tuple of a packed state or None if it has not been solved before.
+        """
+        entry = self.entries.get(packed)
+        if entry is not None:
+            self.used.add(packed)
+        return entry
+
+    def solution(self, packed):
+        """
+        Returns the list of packed states from a known packed state to the goal state by following the best moves.
+
+        Returns None if a state of the solution has been evicted.
+        """
+        board = self.board
+        entries = self.entries
+        output = [packed]
+        blank = board.find_blank(packed)
+        while packed != self.goal:
+            entry = entries.get(packed)
+            if entry is None:
+                return None
+            packed, _ = board.slide(packed, blank, entry[1])
+            blank = entry[1]
+            output.append(packed)
+        # The whole solution is used, so it's states are evicted together
+        self.used.update(output[:-1])
+        return output
+
+    def record(self, path):
+        """
+        Stores the states of an optimal path.
+
+        path : List of packed states from a state to the goal state.
+        """
+        board = self.board
+        for i in range(len(path) - 1):
+            self.entries[path[i]] = (len(path) - 1 - i, board.find_blank(path[i + 1]))
+            self.used.add(path[i])
+        self.flush()
+
+    def flush(self):
+        """
+        Writes the used and recorded states to the database and evicts the least recently used states if there are
+        more than max_entries of them.
+        """
+        if self.connection is None or not self.used:
+            return
+        try:
+            with self.connection:
+                clock = self.connection.execute('SELECT COALESCE(MAX(used), 0) + 1 FROM states').fetchone()[0]
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO states (goal, state, distance, next_blank, used) VALUES (?, ?, ?, ?, ?)',
+                    [(self.goal_key, packed.to_bytes(self.state_bytes, 'big')) + self.entries[packed] + (clock,)
+                     for packed in self.used])
+                count = self.connection.execute('SELECT COUNT(*) FROM states').fetchone()[0]
+                if count > self.max_entries:
+                    self.connection.execute('DELETE FROM states WHERE rowid IN '
+                                            '(SELECT rowid FROM states ORDER BY used LIMIT ?)',
+                                            (count - self.max_entries,))
+            self.used.clear()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """
+        Flushes the table and closes the database.
+        """
+        if self.connection is None:
+            return
+        self.flush()
+        self.connection.close()
+        self.connection = None
@@ -8,7 +8,8 @@ Author : Hamidreza Mahdavipanah
 Repository: http://github.com/mahdavipanah/pynpuzzle
 License : MIT License
 """
-from copy import deepcopy
+from .instrumentation import stats
+from .packed_state import get_board
 
 
 def is_goal_state(state, goal_state):
@@ -33,7 +34,7 @@ def operator(state):
                 break
 
     def add_swap(i, j):
-        new_state = deepcopy(state)
+        new_state = [row[:] for row in state]
         new_state[i][j], new_state[zero_i][zero_j] = new_state[zero_i][zero_j], new_state[i][j]
         states.append(new_state)
 
@@ -53,21 +54,49 @@ def operator(state):
 
 
 class Node:
+    """
+    A search tree node.
+
+    Node's state is kept packed (See packed_state module), state property converts it back to a two dimensional list.
+    """
+
     def __init__(self, state=None, parent=None, cost=0, depth=0, children=[]):
+        self.board = None
+        self.packed = None
+        self.blank = None
         self.state = state
         self.parent = parent
         self.cost = cost
         self.depth = depth
         self.children = children
 
+    @property
+    def state(self):
+        if self.board is None:
+            return None
+        return self.board.unpack(self.packed)
+
+    @state.setter
+    def state(self, state):
+        if state is None:
+            self.board = self.packed = self.blank = None
+            return
+        self.board = get_board(len(state))
+        self.packed, self.blank = self.board.pack(state)
+
     def is_goal(self, goal_state):
-        return is_goal_state(self.state, goal_state)
+        return self.packed == self.board.pack_goal(goal_state)
 
     def expand(self):
-        new_states = operator(self.state)
+        stats.expanded += 1
+        stats.generated += len(self.board.neighbours[self.blank])
         self.children = []
-        for state in new_states:
-            self.children.append(Node(state, self, self.cost + 1, self.depth + 1))
+        for packed, blank, _ in self.board.successors(self.packed, self.blank):
+            child = Node(None, self, self.cost + 1, self.depth + 1)
+            child.board = self.board
+            child.packed = packed
+            child.blank = blank
+            self.children.append(child)
 
     def parents(self):
         current_node = self
@@ -81,3 +110,70 @@ class Node:
             costs += parent.cost
 
         return costs
+
+
+class SearchNode:
+    """
+    A lightweight search tree node.
+
+    Unlike Node it has no children list and keeps the path cost from the root (g), so there is no need to walk the
+    parent chain to compute it. It also keeps it's heuristic value (h) if the search uses a heuristics.Heuristic.
+    Since it doesn't know it's Board, state related methods need it as an argument.
+    """
+    __slots__ = ('packed', 'blank', 'parent', 'g', 'h')
+
+    def __init__(self, packed, blank, parent=None, g=0, h=0):
+        self.packed = packed
+        self.blank = blank
+        self.parent = parent
+        self.g = g
+        self.h = h
+
+    def expand(self, board, heuristic=None):
+        """
+        Returns the list of node's children.
+
+        If heuristic is given, children's h is updated incrementally from this node's h.
+        """
+        stats.expanded += 1
+        stats.generated += len(board.neighbours[self.blank])
+        g = self.g + 1
+        if heuristic is None:
+            return [SearchNode(packed, blank, self, g)
+                    for packed, blank, _ in board.successors(self.packed, self.blank)]
+
+        update = heuristic.update
+        h = self.h
+        to_cell = self.blank
+        return [SearchNode(packed, blank, self, g, update(h, packed, tile, blank, to_cell))
+                for packed, blank, tile in board.successors(self.packed, self.blank)]
+
+    def parents(self):
+        current_node = self.parent
+        while current_node:
+            yield current_node
+            current_node = current_node.parent
+
+    def path(self, board):
+        """
+        Returns the list of two dimensional states from the root node to this node.
+        """
+        output = [board.unpack(self.packed)]
+        for parent in self.parents():
+            output.append(board.unpack(parent.packed))
+        output.reverse()
+
+        return output
+
+
+def root_node(state, heuristic=None):
+    """
+    Packs a two dimensional state and returns a (board, node) tuple which node is a SearchNode for it.
+
+    If heuristic is given, node's h is evaluated by it.
+    """
+    board = get_board(len(state))
+    node = SearchNode(*board.pack(state))
+    if heuristic is not None:
+        node.h = heuristic.evaluate(node.packed)
+    return board, node
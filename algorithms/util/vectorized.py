@@ -0,0 +1,210 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Vectorized evaluation of many states at once with NumPy
+
+Heuristics are updated incrementally for a single child, but algorithms that handle a whole layer at a time (like beam
+search and breadth-first frontier search) can generate the children of the layer and evaluate them together. States
+are kept as a two dimensional array of tiles (a row for every state), so children are made by swapping two columns of
+the rows and a tile heuristic is a single table lookup for every tile. Linear conflicts are looked up by the code of
+every line, which is made from the goal positions of the line's tiles.
+
+NumPy is optional, numpy is None if it's not installed and algorithms should use their pure Python code then.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from array import array
+
+from .heuristics import LinearConflict, TileHeuristic, line_conflicts
+from .instrumentation import stats
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Maximum number of entries of a line conflicts table, bigger boards evaluate linear conflicts state by state
+MAX_LINE_TABLE = 2 ** 20
+
+
+def neighbour_table(board):
+    """
+    Returns a (size, 4) array of every cell's neighbours (See packed_state.Board.neighbours), missing ones are -1.
+    """
+    table = numpy.full((board.size, 4), -1, dtype=numpy.intp)
+    for cell, cells in enumerate(board.neighbours):
+        table[cell, :len(cells)] = cells
+    return table
+
+
+def children(board, tiles, neighbours=None):
+    """
+    Returns a (children, parents) tuple of all states that are reachable from the rows of tiles.
+
+    tiles : Two dimensional array of states, a row of tiles for every state.
+    neighbours : neighbour_table of board.
+
+    parents is the row of tiles that every child has been reached from.
+    """
+    if neighbours is None:
+        neighbours = neighbour_table(board)
+    blanks = (tiles == 0).argmax(axis=1)
+    all_children = []
+    all_parents = []
+    for direction in range(4):
+        cells = neighbours[blanks, direction]
+        parents = numpy.nonzero(cells >= 0)[0]
+        cells = cells[parents]
+        rows = numpy.arange(len(parents))
+        child_tiles = tiles[parents]
+        child_tiles[rows, blanks[parents]] = child_tiles[rows, cells]
+        child_tiles[rows, cells] = 0
+        all_children.append(child_tiles)
+        all_parents.append(parents)
+    return numpy.concatenate(all_children), numpy.concatenate(all_parents)
+
+
+def _line_table(n):
+    """
+    Returns conflicts of every line code.
+
+    A line's code is the sum of (position + 1) * (n + 1) ** i for the tile in the line's ith cell, position is the
+    tile's goal position inside the line if the line is it's goal line, otherwise the tile counts as 0.
+    """
+    table = numpy.zeros((n + 1) ** n, dtype=numpy.int64)
+    for code in range(len(table)):
+        positions = []
+        rest = code
+        for _ in range(n):
+            rest, digit = divmod(rest, n + 1)
+            if digit:
+                positions.append(digit - 1)
+        table[code] = line_conflicts(positions)
+    return table
+
+
+def evaluator(heuristic):
+    """
+    Returns a function that returns the heuristic's values of the rows of a two dimensional array of tiles.
+
+    Tile heuristics and linear conflict are vectorized, other heuristics evaluate the states one by one.
+    """
+    board = heuristic.board
+    n = board.n
+    cells = numpy.arange(board.size)
+    if isinstance(heuristic, TileHeuristic) and heuristic.table is not None:
+        # table[tile, cell] is the cost of tile in cell
+        table = numpy.array(heuristic.table, dtype=numpy.int64)
+
+        def tile_costs(tiles):
+            return table[tiles, cells].sum(axis=1)
+    else:
+        tile_costs = None
+
+    if isinstance(heuristic, LinearConflict) and (n + 1) ** n <= MAX_LINE_TABLE:
+        goal = heuristic.goal
+        line_table = _line_table(n)
+        powers = (n + 1) ** numpy.arange(n)
+        # row_codes[row, tile] is the code of tile in it's row (without the cell's power), the same for columns
+        row_codes = numpy.zeros((n, board.size), dtype=numpy.int64)
+        col_codes = numpy.zeros((n, board.size), dtype=numpy.int64)
+        for tile in range(1, board.size):
+            row_codes[goal.rows[tile], tile] = goal.cols[tile] + 1
+            col_codes[goal.cols[tile], tile] = goal.rows[tile] + 1
+        row_cells = [numpy.array(line_cells) for line_cells in heuristic.row_cells]
+        col_cells = [numpy.array(line_cells) for line_cells in heuristic.col_cells]
+
+        def evaluate(tiles):
+            conflicts = numpy.zeros(len(tiles), dtype=numpy.int64)
+            for line in range(n):
+                conflicts += line_table[row_codes[line][tiles[:, row_cells[line]]] @ powers]
+                conflicts += line_table[col_codes[line][tiles[:, col_cells[line]]] @ powers]
+            return tile_costs(tiles) + 2 * conflicts
+        return evaluate
+
+    if tile_costs is not None and type(heuristic).evaluate is TileHeuristic.evaluate:
+        return tile_costs
+
+    def evaluate(tiles):
+        return numpy.array([heuristic.evaluate(pack(board, row)) for row in tiles.tolist()], dtype=numpy.int64)
+    return evaluate
+
+
+def pack(board, tiles):
+    """
+    Packs a row of tiles (as a list) into a packed state.
+    """
+    packed = 0
+    for shift, tile in zip(board.shifts, tiles):
+        packed |= tile << shift
+    return packed
+
+
+def expand(board, states):
+    """
+    Same as frontier_search.expand, states are packed into unsigned 64 bit integers (an array or a memoryview).
+    """
+    packed = numpy.frombuffer(states, dtype=numpy.uint64)
+    shifts = numpy.array(board.shifts, dtype=numpy.uint64)
+    tiles = (packed[:, None] >> shifts) & numpy.uint64(board.mask)
+    child_tiles, parents = children(board, tiles.astype(numpy.uint8))
+    # Children only differ from their parents in two cells, but packing them again is simpler and as fast
+    child_packed = numpy.bitwise_or.reduce(child_tiles.astype(numpy.uint64) << shifts, axis=1)
+    return array('Q', numpy.unique(child_packed).tobytes())
+
+
+def beam_search(state, goal_state, heuristic, width):
+    """
+    Beam search, the same as best_first_seach.beam_search but every level is generated and evaluated at once.
+    """
+    board = heuristic.board
+    evaluate = evaluator(heuristic)
+    neighbours = neighbour_table(board)
+    dtype = numpy.uint8 if board.size <= 256 else numpy.uint16
+    goal = numpy.array([tile for row in goal_state for tile in row], dtype=dtype)
+    beam = numpy.array([[tile for row in state for tile in row]], dtype=dtype)
+    stats.lower_bound = int(evaluate(beam)[0])
+    # Beams and the row of the previous beam that every row has been reached from
+    levels = [(beam, None)]
+    # States that have been in a beam, as bytes
+    visited = {beam[0].tobytes()}
+    stats.track(depth=lambda: len(levels) - 1)
+
+    def path(level, row):
+        output = []
+        for tiles, parents in reversed(levels[:level + 1]):
+            output.append(board.unpack(pack(board, tiles[row].tolist())))
+            if parents is not None:
+                row = parents[row]
+        output.reverse()
+        return output
+
+    while len(beam):
+        if stats.stopped:
+            return stats.partial(path(len(levels) - 1, int(evaluate(beam).argmin())))
+        found = numpy.nonzero((beam == goal).all(axis=1))[0]
+        if len(found):
+            return path(len(levels) - 1, found[0])
+
+        child_tiles, parents = children(board, beam, neighbours)
+        stats.expanded += len(beam)
+        stats.generated += len(child_tiles)
+        # A state is only kept once and only if it has not been in a beam
+        keys = numpy.ascontiguousarray(child_tiles).view(numpy.dtype((numpy.void, child_tiles.shape[1] *
+                                                                      child_tiles.itemsize))).ravel()
+        keys, unique = numpy.unique(keys, return_index=True)
+        keep = unique[[key not in visited for key in keys.tolist()]] if len(keys) else unique
+        child_tiles = child_tiles[keep]
+        parents = parents[keep]
+        if len(child_tiles) > width:
+            best = numpy.argpartition(evaluate(child_tiles), width)[:width]
+            child_tiles = child_tiles[best]
+            parents = parents[best]
+        visited.update(map(bytes, child_tiles))
+        beam = child_tiles
+        levels.append((beam, parents))
+
+    return None
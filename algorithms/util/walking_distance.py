@@ -0,0 +1,148 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Walking distance heuristic
+
+Vertical walking distance only looks at rows: for every row, how many of it's tiles belong to each goal row. A move
+moves the blank to the row above or below by swapping it with one of that row's tiles, and the vertical walking
+distance is the minimum number of such moves that brings every tile to it's goal row. Horizontal walking distance is
+the same for columns and the heuristic is the sum of both.
+
+Distances of all row configurations are precomputed by a breadth-first search from the goal configuration, which is
+only feasible up to 15-puzzle (See MAX_DIMENSION).
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+from functools import lru_cache
+
+from .heuristics import Heuristic
+
+# Biggest dimension of the boards that distance tables are built for, 24-puzzle has too many configurations to be
+# searched in a reasonable time
+MAX_DIMENSION = 4
+
+
+@lru_cache(maxsize=None)
+def distance_table(n, blank_line):
+    """
+    Returns the table of walking distances of an n * n board which it's blank tile's goal line is blank_line.
+
+    Keys are configurations made by configuration_key and values are walking distances.
+
+    Raises ValueError if n is bigger than MAX_DIMENSION.
+    """
+    if n > MAX_DIMENSION:
+        raise ValueError('Walking distance is not supported for ' + str(n * n - 1) + '-puzzle, the biggest '
+                         'supported puzzle is ' + str(MAX_DIMENSION * MAX_DIMENSION - 1) + '-puzzle')
+    # counts[i * n + r] is the number of tiles in line i that their goal line is r
+    counts = [0] * (n * n)
+    for i in range(n):
+        counts[i * n + i] = n - 1 if i == blank_line else n
+    goal = tuple(counts) + (blank_line,)
+
+    table = {goal: 0}
+    layer = [goal]
+    distance = 0
+    while layer:
+        distance += 1
+        next_layer = []
+        for key in layer:
+            blank = key[-1]
+            for line in (blank - 1, blank + 1):
+                if not 0 <= line < n:
+                    continue
+                # Move one tile of each goal line from line to the blank's line
+                for r in range(n):
+                    if not key[line * n + r]:
+                        continue
+                    counts = list(key)
+                    counts[line * n + r] -= 1
+                    counts[blank * n + r] += 1
+                    counts[-1] = line
+                    child = tuple(counts)
+                    if child not in table:
+                        table[child] = distance
+                        next_layer.append(child)
+        layer = next_layer
+
+    return table
+
+
+def configuration_key(n, tiles, goal_lines, line_of_cell):
+    """
+    Returns the table key of a one dimensional state.
+
+    goal_lines : Goal line (row or column) of every tile.
+    line_of_cell : Line of every cell.
+    """
+    counts = [0] * (n * n + 1)
+    for cell, tile in enumerate(tiles):
+        if tile:
+            counts[line_of_cell[cell] * n + goal_lines[tile]] += 1
+        else:
+            counts[-1] = line_of_cell[cell]
+    return tuple(counts)
+
+
+class WalkingDistance(Heuristic):
+    """
+    Sum of vertical and horizontal walking distances
+    """
+
+    def __init__(self, goal_state):
+        super().__init__(goal_state)
+        n = self.board.n
+        blank_cell = self.goal.cells[0]
+        self.row_table = distance_table(n, blank_cell // n)
+        self.col_table = distance_table(n, blank_cell % n)
+        self.row_of_cell = [cell // n for cell in range(self.board.size)]
+        self.col_of_cell = [cell % n for cell in range(self.board.size)]
+        # (row key, column key) of states that have been evaluated or updated (See update), the cache is cleared when
+        # it gets too big
+        self.keys_cache = {}
+        self.keys_cache_size = 100000
+
+    def keys(self, packed):
+        """
+        Returns (row key, column key) of a packed state.
+        """
+        n = self.board.n
+        tiles = self.board.unpack_list(packed)
+        return (configuration_key(n, tiles, self.goal.rows, self.row_of_cell),
+                configuration_key(n, tiles, self.goal.cols, self.col_of_cell))
+
+    def evaluate(self, packed):
+        row_key, col_key = self.keys(packed)
+        if len(self.keys_cache) >= self.keys_cache_size:
+            self.keys_cache.clear()
+        self.keys_cache[packed] = (row_key, col_key)
+        return self.row_table[row_key] + self.col_table[col_key]
+
+    def update(self, h, packed, tile, from_cell, to_cell):
+        # The state before the move is usually in the cache, so only the counts of the two lines that tile has left
+        # and entered change. A vertical move only changes the vertical walking distance and a horizontal move only
+        # the horizontal one.
+        n = self.board.n
+        shifts = self.board.shifts
+        parent = packed - (tile << shifts[to_cell]) + (tile << shifts[from_cell])
+        keys_cache = self.keys_cache
+        keys = keys_cache.get(parent)
+        if keys is None:
+            keys = self.keys(parent)
+        is_row = from_cell % n == to_cell % n
+        if is_row:
+            table, goal_lines, line_of_cell, key = self.row_table, self.goal.rows, self.row_of_cell, keys[0]
+        else:
+            table, goal_lines, line_of_cell, key = self.col_table, self.goal.cols, self.col_of_cell, keys[1]
+        counts = list(key)
+        counts[line_of_cell[from_cell] * n + goal_lines[tile]] -= 1
+        counts[line_of_cell[to_cell] * n + goal_lines[tile]] += 1
+        counts[-1] = line_of_cell[from_cell]
+        child_key = tuple(counts)
+        if len(keys_cache) >= self.keys_cache_size:
+            keys_cache.clear()
+        keys_cache[packed] = (child_key, keys[1]) if is_row else (keys[0], child_key)
+        return h - table[key] + table[child_key]
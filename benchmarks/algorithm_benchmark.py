@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Runs every algorithm of algorithms folder on fixed, seeded puzzle corpora and reports expanded nodes, time, peak
+memory and optimality of the paths as JSON or CSV. Algorithms are prepared for every corpus before their puzzles are
+timed (See pynpuzzle_core.Algorithm.prepare), building pattern databases can take a long time on the first run.
+
+Startup time (finding the algorithms, with and without the metadata cache, importing all of them and starting the app's
+window) is measured in fresh interpreters and reported as the 'startup' corpus. Starting the window needs a display,
+it's reported as 'failed' without one.
+
+A report can be compared with a previous one (--compare) to find regressions: algorithms that expand more nodes,
+find longer paths, stop solving puzzles or become slower.
+
+Usage: python3 benchmarks/algorithm_benchmark.py [-a ALGORITHM] [-c CORPUS] [-o FILE] [--format json|csv]
+                                                 [--compare BASELINE] [-j JOBS] [--timeout SECONDS] [--no-startup]
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import argparse
+import csv
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from algorithms.util import heuristics
+from algorithms.util import ida_star
+from algorithms.util.packed_state import get_board
+from pynpuzzle_core import discover_algorithms, list_to_puzzle
+from pynpuzzle_pool import SolvePool
+
+# Corpora: name -> (puzzle's dimension, number of random moves from the goal state, number of puzzles)
+CORPORA = OrderedDict([
+    ('8-puzzle-10', (3, 10, 5)),
+    ('8-puzzle-20', (3, 20, 5)),
+    ('8-puzzle-40', (3, 40, 5)),
+    ('15-puzzle-20', (4, 20, 5)),
+    ('15-puzzle-40', (4, 40, 3)),
+])
+# Seed of corpora's random moves
+SEED = 0
+# Default maximum seconds of a puzzle
+TIMEOUT = 10
+# Startup phases: name -> code that is timed in a fresh interpreter, CACHE is the metadata cache's path
+STARTUP_PHASES = OrderedDict([
+    ('discover algorithms (no cache)', 'discover_algorithms(cache_path=None)'),
+    ('discover algorithms (cached)', 'discover_algorithms(cache_path=CACHE)'),
+    ('import all algorithms', '[algorithm.load() for algorithm in discover_algorithms(cache_path=CACHE)[0]]'),
+    ('start GUI', 'import pynpuzzle\npynpuzzle.main_window.update()'),
+])
+# Number of times every startup phase is timed, the fastest one is reported
+STARTUP_RUNS = 3
+# Columns of reports
+FIELDS = ('corpus', 'puzzle', 'algorithm', 'status', 'moves', 'optimal_moves', 'optimal', 'expanded', 'wall_time',
+          'cpu_time', 'peak_rss')
+
+
+def goal_state(n):
+    """
+    Returns the app's default goal state of an n * n board.
+    """
+    return [i for i in range(n * n)]
+
+
+def corpus_puzzles(name):
+    """
+    Returns the one dimensional puzzles of a corpus.
+
+    Every puzzle is made by random moves from the goal state which never undo the previous move.
+    """
+    n, moves, count = CORPORA[name]
+    board = get_board(n)
+    rand = random.Random(name + ':' + str(SEED))
+    puzzles = []
+    for _ in range(count):
+        packed, blank = board.pack(list_to_puzzle(goal_state(n)))
+        previous = None
+        for _ in range(moves):
+            cell = rand.choice([cell for cell in board.neighbours[blank] if cell != previous])
+            previous = blank
+            packed, _ = board.slide(packed, blank, cell)
+            blank = cell
+        puzzles.append(board.unpack_list(packed))
+    return puzzles
+
+
+def optimal_moves(lst):
+    """
+    Returns the number of moves of the optimal solution of a puzzle, found by IDA* using manhattan distance heuristic.
+    """
+    goal = list_to_puzzle(goal_state(int(len(lst) ** 0.5)))
+    return len(ida_star.search(list_to_puzzle(lst), goal, heuristics.ManhattanDistance(goal))) - 1
+
+
+def run(algorithms, corpora, processes, timeout):
+    """
+    Runs algorithms on corpora and returns the records of the report.
+    """
+    records = []
+    for corpus in corpora:
+        n = CORPORA[corpus][0]
+        puzzles = corpus_puzzles(corpus)
+        optimal = [optimal_moves(lst) for lst in puzzles]
+        for algorithm in algorithms:
+            sys.stderr.write(corpus + ' : ' + algorithm + '\n')
+            tasks = [(index, lst) for index, lst in enumerate(puzzles)]
+            with SolvePool(algorithm, goal_state(n), processes, timeout) as pool:
+                results = sorted(pool.imap_unordered(tasks), key=lambda result: result['name'])
+            for result in results:
+                index = result['name']
+                records.append(OrderedDict([
+                    ('corpus', corpus),
+                    ('puzzle', index),
+                    ('algorithm', algorithm),
+                    ('status', result['status']),
+                    ('moves', result['moves']),
+                    ('optimal_moves', optimal[index]),
+                    ('optimal', result['moves'] == optimal[index] if result['moves'] is not None else None),
+                    ('expanded', result['expanded']),
+                    ('wall_time', result['wall_time']),
+                    ('cpu_time', result['cpu_time']),
+                    ('peak_rss', result['peak_rss']),
+                ]))
+    return records
+
+
+def startup_records():
+    """
+    Times startup phases (See STARTUP_PHASES) and returns their records.
+    """
+    root = dirname(dirname(abspath(__file__)))
+    records = []
+    with tempfile.TemporaryDirectory() as directory:
+        cache = join(directory, 'algorithms.json')
+        discover_algorithms(cache_path=cache)
+        for index, (phase, code) in enumerate(STARTUP_PHASES.items()):
+            sys.stderr.write('startup : ' + phase + '\n')
+            script = ('import sys, time\n'
+                      'start = time.perf_counter()\n'
+                      'sys.path.insert(0, ' + repr(root) + ')\n'
+                      'from pynpuzzle_core import discover_algorithms\n'
+                      'CACHE = ' + repr(cache) + '\n' +
+                      code + '\n'
+                      'print(time.perf_counter() - start)\n')
+            times = []
+            try:
+                for _ in range(STARTUP_RUNS):
+                    output = subprocess.check_output([sys.executable, '-c', script], cwd=root, universal_newlines=True,
+                                                     stderr=subprocess.DEVNULL)
+                    times.append(float(output.split()[-1]))
+            except subprocess.CalledProcessError:
+                sys.stderr.write('startup : ' + phase + ' failed\n')
+            records.append(OrderedDict([
+                ('corpus', 'startup'),
+                ('puzzle', index),
+                ('algorithm', phase),
+                ('status', 'measured' if times else 'failed'),
+                ('moves', None),
+                ('optimal_moves', None),
+                ('optimal', None),
+                ('expanded', None),
+                ('wall_time', min(times) if times else None),
+                ('cpu_time', None),
+                ('peak_rss', None),
+            ]))
+    return records
+
+
+def write_report(records, file, report_format):
+    if report_format == 'csv':
+        writer = csv.DictWriter(file, FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    else:
+        json.dump(records, file, indent=2)
+        file.write('\n')
+
+
+def read_report(file_name):
+    """
+    Reads a JSON or CSV report and returns it's records.
+    """
+    with open(file_name) as file:
+        if file_name.endswith('.csv'):
+            records = list(csv.DictReader(file))
+            for record in records:
+                for field in ('puzzle', 'moves', 'optimal_moves', 'expanded'):
+                    record[field] = int(record[field]) if record[field] else None
+                for field in ('wall_time', 'cpu_time', 'peak_rss'):
+                    record[field] = float(record[field]) if record[field] else None
+            return records
+        return json.load(file)
+
+
+def compare(records, baseline, time_tolerance):
+    """
+    Compares records with baseline's records and returns the list of regressions' descriptions.
+
+    time_tolerance : Maximum ratio of a record's wall time to it's baseline's wall time that isn't a regression.
+    """
+    baseline = {(record['corpus'], record['puzzle'], record['algorithm']): record for record in baseline}
+    regressions = []
+    for record in records:
+        old = baseline.get((record['corpus'], record['puzzle'], record['algorithm']))
+        if old is None:
+            continue
+        name = record['algorithm'] + ' on ' + record['corpus'] + ' #' + str(record['puzzle']) + ' : '
+        if old['status'] == 'solved' and record['status'] != 'solved':
+            regressions.append(name + 'status ' + old['status'] + ' -> ' + record['status'])
+            continue
+        if record['status'] != old['status'] or record['status'] not in ('solved', 'measured'):
+            continue
+        if record['status'] == 'solved':
+            if record['moves'] > old['moves']:
+                regressions.append(name + 'moves ' + str(old['moves']) + ' -> ' + str(record['moves']))
+            if record['expanded'] > old['expanded']:
+                regressions.append(name + 'expanded ' + str(old['expanded']) + ' -> ' + str(record['expanded']))
+        # Very short runs are too noisy to compare
+        min_wall_time = 0.01 if record['status'] == 'measured' else 0.1
+        if old['wall_time'] >= min_wall_time and record['wall_time'] > old['wall_time'] * time_tolerance:
+            regressions.append(name + 'wall time ' + str(round(old['wall_time'], 3)) + ' s -> ' +
+                               str(round(record['wall_time'], 3)) + ' s')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark algorithms on fixed puzzle corpora.')
+    parser.add_argument('-a', '--algorithm', action='append',
+                        help="algorithm's module name, can be repeated (default: all algorithms)")
+    parser.add_argument('-c', '--corpus', action='append', choices=list(CORPORA),
+                        help='corpus name, can be repeated (default: all corpora)')
+    parser.add_argument('-o', '--output', help='report file (default: standard output)')
+    parser.add_argument('--format', choices=('json', 'csv'),
+                        help="report's format (default: output's extension or json)")
+    parser.add_argument('--compare', metavar='BASELINE', help='previous report to compare with')
+    parser.add_argument('--time-tolerance', type=float, default=1.5,
+                        help='slowdown ratio that is reported as a regression (default: 1.5)')
+    parser.add_argument('-j', '--jobs', type=int, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--timeout', type=float, default=TIMEOUT,
+                        help='maximum seconds of a puzzle (default: ' + str(TIMEOUT) + ')')
+    parser.add_argument('--no-startup', action='store_true', help="don't measure startup time")
+    args = parser.parse_args()
+
+    discovered, _ = discover_algorithms()
+    names = [algorithm.module_name for algorithm in discovered]
+    algorithms = args.algorithm or names
+    for algorithm in algorithms:
+        if algorithm not in names:
+            parser.error('algorithm not found: ' + algorithm)
+
+    records = run(algorithms, args.corpus or list(CORPORA), args.jobs, args.timeout)
+    if not args.no_startup:
+        records.extend(startup_records())
+
+    report_format = args.format or ('csv' if args.output and args.output.endswith('.csv') else 'json')
+    if args.output:
+        with open(args.output, 'w', newline='') as file:
+            write_report(records, file, report_format)
+    else:
+        write_report(records, sys.stdout, report_format)
+
+    if args.compare:
+        regressions = compare(records, read_report(args.compare), args.time_tolerance)
+        for regression in regressions:
+            sys.stderr.write('Regression : ' + regression + '\n')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
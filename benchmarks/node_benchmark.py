@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Compares tree_search.Node and tree_search.SearchNode by solving the same 8-puzzle instances (20 to 21 moves) with
+A* tree search using manhattan distance heuristic.
+
+Usage: python3 benchmarks/node_benchmark.py [number of instances]
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import heapq
+import random
+import sys
+import time
+import tracemalloc
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from algorithms.util.tree_search import Node, root_node
+
+GOAL_STATE = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+# Minimum and maximum number of moves of the benchmark instances
+MIN_MOVES = 20
+MAX_MOVES = 21
+
+
+def manhattan_distance(board, packed):
+    cost = 0
+    for cell in range(board.size):
+        tile = board.tile_at(packed, cell)
+        if tile:
+            cost += abs(tile // board.n - cell // board.n) + abs(tile % board.n - cell % board.n)
+    return cost
+
+
+def solve_with_node(state):
+    """
+    A* using Node, the way it was done before SearchNode
+
+    Path cost is computed by walking the parent chain like Node.gn does. Node.gn itself is not used since it sums the
+    cumulative costs of all of the parents which makes the search expand a different set of nodes.
+    """
+    queue = []
+    entrance = 0
+    node = Node(state)
+    expanded = 0
+    while not node.is_goal(GOAL_STATE):
+        node.expand()
+        expanded += 1
+        for child in node.children:
+            gn = sum(1 for _ in child.parents())
+            heapq.heappush(queue, (gn + manhattan_distance(child.board, child.packed), entrance, child))
+            entrance += 1
+        node = heapq.heappop(queue)[2]
+    return node.depth, expanded
+
+
+def solve_with_search_node(state):
+    """
+    A* using SearchNode
+    """
+    queue = []
+    entrance = 0
+    board, node = root_node(state)
+    goal = board.pack_goal(GOAL_STATE)
+    expanded = 0
+    while node.packed != goal:
+        expanded += 1
+        for child in node.expand(board):
+            heapq.heappush(queue, (child.g + manhattan_distance(board, child.packed), entrance, child))
+            entrance += 1
+        node = heapq.heappop(queue)[2]
+    return node.g, expanded
+
+
+def random_instances(count, seed=0):
+    """
+    Returns count seeded random 8-puzzles which their optimal solutions have MIN_MOVES to MAX_MOVES moves.
+
+    Distances are found by a breadth-first search from the goal state.
+    """
+    board, root = root_node(GOAL_STATE)
+    distances = {root.packed: 0}
+    layer = [(root.packed, root.blank)]
+    candidates = []
+    depth = 0
+    while layer and depth < MAX_MOVES:
+        depth += 1
+        next_layer = []
+        for packed, blank in layer:
+            for child, child_blank, _ in board.successors(packed, blank):
+                if child not in distances:
+                    distances[child] = depth
+                    next_layer.append((child, child_blank))
+        if depth >= MIN_MOVES:
+            candidates.extend(packed for packed, _ in next_layer)
+        layer = next_layer
+
+    candidates.sort()
+    rand = random.Random(seed)
+    return [board.unpack(packed) for packed in rand.sample(candidates, count)]
+
+
+def measure(solver, state):
+    """
+    Solves state twice, once for timing and once for tracing memory allocations, since tracing slows it down.
+    """
+    start = time.perf_counter()
+    moves, expanded = solver(state)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    solver(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return moves, expanded, elapsed, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    instances = random_instances(count)
+
+    print('{:>5} {:>9} | {:>9} {:>11} {:>8} | {:>9} {:>11} {:>8}'.format(
+        'moves', 'expanded', 'Node(s)', 'Node(MB)', 'us/exp', 'Search(s)', 'Search(MB)', 'us/exp'))
+    totals = [0, 0, 0, 0]
+    for state in instances:
+        moves, expanded, node_time, node_peak = measure(solve_with_node, state)
+        _, _, search_time, search_peak = measure(solve_with_search_node, state)
+        print('{:>5} {:>9} | {:>9.3f} {:>11.3f} {:>8.2f} | {:>9.3f} {:>11.3f} {:>8.2f}'.format(
+            moves, expanded,
+            node_time, node_peak / 2 ** 20, node_time / expanded * 1e6,
+            search_time, search_peak / 2 ** 20, search_time / expanded * 1e6))
+        totals = [totals[0] + node_time, totals[1] + node_peak, totals[2] + search_time, totals[3] + search_peak]
+
+    print('SearchNode speedup: {:.2f}x, memory: {:.2f}x less'.format(totals[0] / totals[2], totals[1] / totals[3]))
+
+
+if __name__ == '__main__':
+    main()
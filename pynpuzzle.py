@@ -9,14 +9,7 @@ License : MIT License
 """
 import math
 import random
-import re
 import webbrowser
-import sys
-import traceback
-from os import listdir
-from os.path import isfile, join
-import datetime
-from importlib import import_module
 import multiprocessing
 import threading
 import time
@@ -28,26 +21,49 @@ from tkinter import messagebox
 from tkinter import simpledialog
 from tkinter import filedialog, scrolledtext
 
-import psutil
+from algorithms.util.instrumentation import Improvement, PartialResult, progress_text
+from algorithms.util.solvability import is_solvable, make_solvable
+from pynpuzzle_core import (ProcessSampler, PuzzleFileError, check_puzzle_list, discover_algorithms, expand_output,
+                            expand_partial, improvement_text, list_to_puzzle, log_datetime, puzzle_to_list,
+                            read_puzzle_file)
+from pynpuzzle_pool import LoadError, WarmWorker
 
 # Global variables
 #
 # Stores app logs
 LOGS = []
-# Loaded algorithms modules from ./algorithm/ folder
-algorithms_modules = []
-# Process that runs the algorithm
-# If it's None it means app is not calculating
-# If it's not None it contains multiprocessing.Process object and app is calculating
-search_process = None
-# An event object that tells the timer thread to stop
-timer_event = multiprocessing.Event()
-# The thread that updates execution time, max ram usage and ram usage information
-timer_thread = None
+# Algorithms of ./algorithm/ folder, their modules are only imported when they are started
+discovered_algorithms = []
+# Process that runs the algorithms (See pynpuzzle_pool.WarmWorker)
+# It's started with the first search and kept between searches, so algorithms' modules and their precomputed data stay
+# loaded. If it's None or not alive a new one is started by the next search.
+search_worker = None
+# Milliseconds between two samples of search process's RAM and CPU usage
+SAMPLE_INTERVAL = 100
+# Number of samples between two measurements of search process's unique set size, which is much slower than the others
+USS_SAMPLES = 10
+# Milliseconds between two updates of available RAM
+AVAILABLE_RAM_INTERVAL = 1000
+# Milliseconds that a stopped search has to send it's partial result, before it's process is terminated
+STOP_TIMEOUT = 2000
+# An event object that tells the timer to stop
+timer_event = threading.Event()
+# Id of the timer's next scheduled sample (See start_timer)
+timer_after_id = None
+# Id of available RAM's next scheduled update (See available_ram_display)
+available_ram_after_id = None
 # The thread that is waiting for the algorithm to send it's result
 pipe_thread = None
 # A pipe which algorithm can send it's result to app through it
 output_pipe = None
+# The thread that is waiting for the algorithm's progress snapshots
+progress_thread = None
+# A pipe which algorithm's process sends search's progress snapshots to app through it
+progress_pipe = None
+# Last progress snapshot that has been received, the timer shows it in status bar
+progress_snapshot = None
+# Last solution that an anytime algorithm has found (See instrumentation.Improvement), it's shown next to the progress
+progress_improvement = None
 # A list containing current output steps's statuses
 OUTPUT_LST = []
 # Number of current output's step
@@ -87,6 +103,7 @@ max_ram_var = tkinter.StringVar()
 cpu_var = tkinter.StringVar()
 ram_var = tkinter.StringVar()
 available_ram_var = tkinter.StringVar()
+progress_var = tkinter.StringVar()
 
 
 def return_false_validate():
@@ -206,69 +223,6 @@ def fill_puzzle_frame(puzzle_frame, lst):
     OUTPUT_EDITABLE = False
 
 
-def list_to_puzzle(lst):
-    """
-    Converts a one dimensional puzzle list and returns it's two dimensional representation.
-
-    [1, 2, 3, 4, 5, 6, 7, 8, 0] --> [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-    """
-    n_sqrt = int(math.sqrt(len(lst)))
-
-    puzzle = []
-    for i in range(0, len(lst), n_sqrt):
-        line = []
-        for j in range(0, n_sqrt):
-            line.append(lst[i + j])
-        puzzle.append(line)
-
-    return puzzle
-
-
-def puzzle_to_list(puzzle):
-    """
-    Converts a two dimensional puzzle to a one dimensional puzzle.
-
-    [[1, 2, 3], [4, 5, 6], [7, 8, 9]] --> [1, 2, 3, 4, 5, 6, 7, 8, 0]
-    """
-    lst = []
-    for row in puzzle:
-        lst.extend(row)
-
-    return lst
-
-
-def check_puzzle_list(lst, n):
-    """
-    Checks a puzzle one dimensional list and validates it.
-
-    lst : The list to be validated.
-    n : Puzzle type (n-puzzle).
-
-     Returns True of it's fine and False if it's not valid.
-    """
-    # Check list's length
-    if len(lst) != n + 1:
-        return False
-
-    lst = lst[:]
-
-    lst = [0 if x == '' else x for x in lst]
-
-    # Generate a new list containing numbers from 0 to n
-    #   and then check if the list has all of those numbers in it
-    new_lst = [i for i in range(0, n + 1)]
-    for lst_item in new_lst:
-        try:
-            lst.remove(lst_item)
-        except ValueError:
-            return False
-
-    if len(lst) != 0:
-        return False
-
-    return True
-
-
 def get_puzzle_frame_list(puzzle_frame):
     """
     Returns a one dimensional puzzle list that is inside a frame widget.
@@ -283,44 +237,75 @@ def get_puzzle_frame_list(puzzle_frame):
     return lst
 
 
+def clear_status_bar():
+    """
+    Clears search's labels of status bar.
+    """
+    cpu_var.set('')
+    max_ram_var.set('')
+    ram_var.set('')
+    progress_var.set('')
+
+
 def start_timer():
     """
     Starts the timer for updating status bar.
+
+    Search process is sampled every SAMPLE_INTERVAL milliseconds in Tk's main loop (using after), until timer_event is
+    set.
     """
-    global timer_thread
-    global timer_event
+    # psutil is only imported when it's needed, which makes app's startup faster
+    import psutil
+
     global timer_clear_status_bar
 
     max_ram_var.set('0')
     cpu_var.set('0')
 
-    search_process_psutil = psutil.Process(search_process.pid)
+    sampler = ProcessSampler(search_worker.pid, USS_SAMPLES)
+    max_rss = 0
 
     def timing():
-        while not timer_event.is_set():
-            prev_val = float(max_ram_var.get())
-            new_val = round(search_process_psutil.memory_full_info().uss / (2 ** 20), 3)
-
-            ram_var.set(new_val)
-
-            if new_val > prev_val:
-                max_ram_var.set(new_val)
-
-            cpu_times = search_process_psutil.cpu_times()
-            cpu_var.set(round(cpu_times.user + cpu_times.system, 3))
-
-            timer_event.wait(0.001)
+        global timer_after_id
+        nonlocal max_rss
+
+        if timer_event.is_set():
+            timer_after_id = None
+            stop_available_ram_display()
+            if timer_clear_status_bar:
+                clear_status_bar()
+            else:
+                show_progress()
+            return
 
-        if timer_clear_status_bar:
-            cpu_var.set('')
-            max_ram_var.set('')
-            ram_var.set('')
+        show_progress()
 
+        try:
+            rss, uss, cpu_time = sampler.sample()
+        except psutil.Error:
+            # Search process has finished, piper stops the timer
+            pass
+        else:
+            ram = str(round(rss, 3))
+            if uss is not None:
+                ram += ' (USS ' + str(round(uss, 3)) + ')'
+            ram_var.set(ram)
+            if rss > max_rss:
+                max_rss = rss
+                max_ram_var.set(round(max_rss, 3))
+            cpu_var.set(round(cpu_time, 3))
+
+        timer_after_id = main_window.after(SAMPLE_INTERVAL, timing)
+
+    # The previous search's timer may have not noticed that it's stopped yet
+    if timer_after_id is not None:
+        main_window.after_cancel(timer_after_id)
+    stop_available_ram_display()
     timer_event.clear()
 
     timer_clear_status_bar = False
-    timer_thread = threading.Thread(target=timing, daemon=True)
-    timer_thread.start()
+    available_ram_display()
+    timing()
 
 
 def load_output_step(n):
@@ -353,47 +338,32 @@ def piper():
 
         output_error = False
         output_exception = False
+        output_partial = None
 
         # If the returned value is a string, Some exception has have happened
         if type(OUTPUT_LST) is str:
             output_exception = True
+        elif isinstance(OUTPUT_LST, LoadError):
+            # Algorithm's module can't be imported, it's logged like the errors of finding the algorithms
+            LOGS.append(log_datetime() + " : Error : Exception raised : " + OUTPUT_LST.module_name + ".py\n" +
+                        OUTPUT_LST.message)
+            update_logs_text_if_visible()
+            OUTPUT_LST = OUTPUT_LST.message
+            output_exception = True
+        elif isinstance(OUTPUT_LST, PartialResult):
+            # Search has been stopped by stop button
+            output_partial = expand_partial(OUTPUT_LST, int(n_spinbox.get()))
+            OUTPUT_LST = output_partial.path or []
         else:
-            # Validate algorithm's output
-            if not OUTPUT_LST:
-                output_error = True
-            elif type(OUTPUT_LST) is not list:
+            # Replay algorithm's moves (None means the search process has found it's output not valid)
+            steps = expand_output(OUTPUT_LST, int(n_spinbox.get()), GOAL_STATE)
+            if steps is None:
                 output_error = True
             else:
-                try:
-                    n = int(n_spinbox.get())
-                    sqrt_n = math.sqrt(n + 1)
-                    for output_step in OUTPUT_LST:
-                        if type(output_step) is not list:
-                            raise BaseException()
-                        if len(output_step) != sqrt_n:
-                            raise BaseException()
-                        for step_row in output_step:
-                            if type(step_row) is not list:
-                                raise BaseException()
-                            if len(step_row) != sqrt_n:
-                                raise BaseException()
-                        if not check_puzzle_list([int(output_step[i][j])
-                                                  for i in range(len(output_step))
-                                                  for j in range(len(output_step))],
-                                                 n):
-                            raise BaseException()
-                except:
-                    output_error = True
-
-            if not output_error:
-                # Converts output's puzzles to one dimensional representation of them
-                tmp_lst = []
-                for result in OUTPUT_LST:
-                    tmp_lst.append(puzzle_to_list(result))
-                OUTPUT_LST = tmp_lst
-
-    except EOFError:
-        # Stop button pressed
+                OUTPUT_LST = steps
+
+    except (EOFError, OSError):
+        # Search process has been terminated by stop button
         pass
     else:
         # Calculation successfully done!
@@ -423,6 +393,17 @@ def piper():
 
             return
 
+        if output_partial is not None:
+            bound = output_partial.bound
+            message = "Search has been stopped.\n\nLower bound of moves: " + (str(bound) if bound is not None
+                                                                              else 'unknown')
+            if OUTPUT_LST:
+                message += "\n\nOutput shows the best partial path that algorithm has found."
+            messagebox.showinfo("Search stopped", message, parent=main_window)
+            if not OUTPUT_LST:
+                OUTPUT_STEP = 0
+                return
+
         # Enable output's action frame
         config_frame_state(output_action_frame, tkinter.NORMAL)
         output_to_label['text'] = len(OUTPUT_LST) - 1
@@ -432,28 +413,63 @@ def piper():
         load_output_step(0)
 
 
+def progress_reader():
+    """
+    A thread target that listens for algorithm's progress snapshots and improvements through a pipe and keeps the last
+    ones for the timer.
+    """
+    global progress_snapshot
+    global progress_improvement
+
+    while True:
+        try:
+            message = progress_pipe.recv()
+        except (EOFError, OSError):
+            # Algorithm's process has finished or stop button pressed
+            return
+        if isinstance(message, Improvement):
+            progress_improvement = message
+        else:
+            progress_snapshot = message
+
+
+def show_progress():
+    """
+    Shows the last progress snapshot and improvement in status bar.
+    """
+    parts = []
+    if progress_snapshot is not None:
+        parts.append(progress_text(progress_snapshot))
+    if progress_improvement is not None:
+        parts.append(improvement_text(progress_improvement))
+    if parts:
+        progress_var.set('  '.join(parts))
+
+
 def start_piping():
     """
-    Starts the piper thread to listen to algorithm's output.
+    Starts the piper thread to listen to algorithm's output and the progress_reader thread to listen to it's progress.
     """
     global pipe_thread
     global output_pipe
+    global progress_thread
+    global progress_pipe
+    global progress_snapshot
+    global progress_improvement
 
     output_pipe, process_pipe = multiprocessing.Pipe()
+    progress_pipe, process_progress_pipe = multiprocessing.Pipe(False)
 
     pipe_thread = threading.Thread(target=piper, daemon=True)
     pipe_thread.start()
+    progress_var.set('')
+    progress_snapshot = None
+    progress_improvement = None
+    progress_thread = threading.Thread(target=progress_reader, daemon=True)
+    progress_thread.start()
 
-    # Return the sender pipe
-    return process_pipe
-
-
-def log_datetime():
-    """
-    Returns the datetime for logging.
-    """
-    now = datetime.datetime.now()
-    return now.strftime("%Y-%m-%d %H:%M")
+    # Return the sender pipes
+    return process_pipe, process_progress_pipe
 
 
 def update_logs_text_if_visible():
@@ -472,87 +488,15 @@ def update_logs_text_if_visible():
 
 def load_algorithms():
     """
-    Load algorithm's modules from ./algorithm/ folder.
-    It assumes all python files as algorithms and tries to load them.
+    Finds the algorithms of ./algorithm/ folder (See discover_algorithms).
     """
-    global algorithms_modules
+    global discovered_algorithms
     global LOGS
 
-    # Get list of all files' names
-    algorithms_files = [f for f in listdir('./algorithms/') if isfile(join('./algorithms/', f))]
-    # Keep all python files's names
-    algorithms_files = [f for f in algorithms_files if f.endswith('.py')]
-    # Remove .py extension from their file's names
-    algorithms_files = [f.rstrip('.py') for f in algorithms_files]
-
-    for module in algorithms_modules:
-        try:
-            # If the module is already loaded remove it, so it can be reloaded.
-            # This happens in algorithm's reloading process.
-            del sys.modules[module.__name__]
-        except:
-            pass
-
-    algorithms_modules = []
-
-    for file in algorithms_files:
-        try:
-            # Try to import the module and add it to algorithms modules list
-            algorithms_modules.append(import_module('algorithms.' + file))
-        # If some problem happened when importing the module (For example if the module has some syntax errors).
-        except:
-            LOGS.append(log_datetime() + " : Error : Exception raised : " + file + ".py\n")
+    discovered_algorithms, logs = discover_algorithms(discovered_algorithms)
+    LOGS.extend(logs)
 
-    for module in algorithms_modules:
-        LOGS.append(log_datetime() + " : OK : Loaded : " + module.__name__[11:] + ".py\n")
-
-    def check_search_function(module):
-        """
-        Checks if the module has a search function.
-        """
-        global LOGS
-
-        if not getattr(module, 'search', None):
-            LOGS.append(log_datetime() +
-                        " : Error : Algorithm's search not defined : " +
-                        module.__name__[11:] +
-                        '.py\n')
-
-            return False
-
-        return True
-
-    algorithms_modules = list(filter(check_search_function, algorithms_modules))
-
-    def check_search_function_arguments(module):
-        """
-        Checks if the module's search function's arguments are proper.
-        """
-        global LOGS
-
-        if getattr(module, 'search').__code__.co_argcount != 2:
-            LOGS.append(log_datetime() +
-                        " : Error : Search function should only accept 2 positional arguments : "
-                        + module.__name__[11:] + '.py\n')
-
-            return False
-
-        return True
-
-    algorithms_modules = list(filter(check_search_function_arguments, algorithms_modules))
-
-    algorithms_names = []
-    for module in algorithms_modules:
-        search_name = module.search.__doc__
-        # If algorithm's name is not defined in search function's docstring
-        if not search_name:
-            LOGS.append(
-                log_datetime() + " : Warning : Algorithm's name not defined : " + module.__name__[11:] + '.py\n')
-
-            search_name = module.__name__[11:]
-
-        module.search.__doc__ = search_name.strip()
-        algorithms_names.append(module.search.__doc__)
+    algorithms_names = [algorithm.name for algorithm in discovered_algorithms]
 
     update_logs_text_if_visible()
 
@@ -801,9 +745,7 @@ def change_app_n(n):
     # Regenerate goal state
     GOAL_STATE = [i for i in range(n + 1)]
     # Clear status bar
-    ram_var.set('')
-    max_ram_var.set('')
-    cpu_var.set('')
+    clear_status_bar()
 
 
 # n spinbox
@@ -872,18 +814,37 @@ def calculation_stop():
 def stop_button_cmd():
     """
     Stop button click handler
+
+    Asks the search to stop, so it sends it's partial result (See instrumentation.BudgetWatcher) and the search worker
+    is kept. If it doesn't in STOP_TIMEOUT milliseconds, it's process is terminated.
+    """
+    stop_button['state'] = tkinter.DISABLED
+    try:
+        output_pipe.send('cancel')
+    except OSError:
+        pass
+    main_window.after(STOP_TIMEOUT, terminate_search, pipe_thread)
+
+
+def terminate_search(search_pipe_thread):
+    """
+    Terminates the search worker if the search that search_pipe_thread is waiting for has not sent it's result.
     """
+    if search_pipe_thread is not pipe_thread or not search_pipe_thread.is_alive():
+        return
     # Do some routines for stopping calculation
     calculation_stop()
-    # Stop algorithm's process
-    search_process.terminate()
+    # Stop algorithm's process, the next search starts a new one
+    search_worker.terminate()
     output_pipe.close()
-    # Stop timer thread and stop refreshing status bar
+    progress_pipe.close()
+    # Stop timer and clear status labels
     timer_event.set()
-    # Clear status labels
-    threading.Timer(0.1, max_ram_var.set, args=('',)).start()
-    threading.Timer(0.1, cpu_var.set, args=('',)).start()
-    threading.Timer(0.1, ram_var.set, args=('',)).start()
+    if timer_after_id is not None:
+        main_window.after_cancel(timer_after_id)
+    stop_available_ram_display()
+    # progress_reader may still be showing the last snapshot
+    main_window.after(100, clear_status_bar)
 
 
 # Action buttons
@@ -912,29 +873,15 @@ def is_input_puzzle_valid(puzzle_frame):
         return None
 
 
-def search_runner(func, pipe, lst, goal_state):
-    """
-    This function invokes the given func with lst and goal_state arguments and sends func's returned value to pipe.
-    If some exception happened in func, sends print ready exception's string to show to user.
-    """
-    try:
-        ret_val = func(lst, goal_state)
-        pipe.send(ret_val)
-    except BaseException as e:
-        exception_message = traceback.format_exception(type(e), e, e.__traceback__)
-        del exception_message[1]
-        pipe.send(''.join(exception_message))
-
-
 def start_button_cmd():
     """
     Start button click handler
     """
     global output_puzzle_frame
-    global search_process
+    global search_worker
     global OUTPUT_EDITABLE
 
-    if not len(algorithms_modules):
+    if not len(discovered_algorithms):
         return
 
     # Check if input puzzle has a valid input
@@ -942,6 +889,19 @@ def start_button_cmd():
     if not lst:
         messagebox.showerror("Input error", "Inputs are not valid!", parent=main_window)
         return
+    # Searching for an unreachable goal state would never end
+    if not is_solvable(lst, GOAL_STATE):
+        messagebox.showerror("Input error", "Puzzle can't be solved, goal state is not reachable from it.",
+                             parent=main_window)
+        return
+    # Selected algorithm's module is imported (or reloaded if it has changed) by the search worker
+    for algorithm in discovered_algorithms:
+        if algorithm.name == algorithm_name.get():
+            break
+    else:
+        messagebox.showerror("Algorithm error", "Selected algorithm has not been found, reload algorithms and try "
+                                                "again.", parent=main_window)
+        return
     # Change widgets's looks
     start_button.grid_remove()
     start_button_border_frame.grid_remove()
@@ -963,18 +923,16 @@ def start_button_cmd():
             child['highlightbackground'] = output_step_text['highlightbackground']
         child.delete(0, tkinter.END)
     OUTPUT_EDITABLE = False
-    # Find the search function of the selected algorithm
-    for module in algorithms_modules:
-        if module.search.__doc__ == algorithm_name.get():
-            search_function = module.search
     # Algorithm's search process
-    search_process = multiprocessing.Process(target=search_runner,
-                                             args=(search_function,
-                                                   start_piping(),
-                                                   list_to_puzzle(lst),
-                                                   list_to_puzzle(GOAL_STATE)))
-    search_process.daemon = True
-    search_process.start()
+    process_pipe, process_progress_pipe = start_piping()
+    if search_worker is None or not search_worker.is_alive():
+        # Search worker is not daemonic, so algorithms can use a pool of processes (See on_main_window_close)
+        search_worker = WarmWorker()
+    search_worker.search(algorithm.module_name, process_pipe, list_to_puzzle(lst), list_to_puzzle(GOAL_STATE),
+                         process_progress_pipe)
+    # Only the search worker should have the sending ends, so piper and progress_reader notice when it finishes
+    process_pipe.close()
+    process_progress_pipe.close()
     start_timer()
 
 
@@ -1213,51 +1171,26 @@ def read_file_cmd(puzzle_frame, parent):
     # Check if user has selected a file
     if not file_name:
         return
-    # Try to open the input file
+    # Try to read the input file
     try:
-        with open(file_name) as file:
-            lines = []
-            pattern = re.compile(r'\s+')
-
-            for line in file:
-                # Check if line is empty
-                if re.sub(pattern, '', line) == '':
-                    # Stop reading from input file
-                    break
-
-                lines.append(line.rstrip())
-
-            lst = []
-
-            try:
-                for line in lines:
-                    line_split = line.split(' ')
-                    lst.extend([int(i) for i in line_split])
-
-                    if len(line_split) != len(lines):
-                        messagebox.showerror("Input error", "Puzzle dimension is not valid.", parent=parent)
-                        return
-
-            except ValueError:
-                messagebox.showerror("Input error", "Input must non-number values.", parent=parent)
-
-            input_puzzle_n = len(lines) ** 2 - 1
-            if not check_puzzle_list(lst, input_puzzle_n):
-                messagebox.showerror("Input error", "Puzzle numbers are not valid.", parent=parent)
-                return
-
-            if input_puzzle_n != int(n_spinbox.get()):
-                n_spinbox.delete(0, tkinter.END)
-                n_spinbox.insert(0, input_puzzle_n)
-
-                change_app_n(input_puzzle_n)
-
-            fill_puzzle_frame(puzzle_frame, lst)
-
+        lst = read_puzzle_file(file_name)
+    except PuzzleFileError as e:
+        messagebox.showerror("Input error", str(e), parent=parent)
+        return
     except:
         messagebox.showerror("Error opening input file",
                              "Some problem happened while opening input file.",
                              parent=parent)
+        return
+
+    input_puzzle_n = len(lst) - 1
+    if input_puzzle_n != int(n_spinbox.get()):
+        n_spinbox.delete(0, tkinter.END)
+        n_spinbox.insert(0, input_puzzle_n)
+
+        change_app_n(input_puzzle_n)
+
+    fill_puzzle_frame(puzzle_frame, lst)
 
 
 tkinter.Button(input_action_frame, text="Read from file",
@@ -1274,30 +1207,7 @@ def random_button_command(puzzle_frame):
     lst = [i for i in range(0, n + 1)]
     random.shuffle(lst)
 
-    sum_inversions = 0
-    for tile in [x for x in lst if x != 0]:
-        before_tiles = GOAL_STATE[:GOAL_STATE.index(tile)]
-        for after_tile in [x for x in lst[lst.index(tile):] if x != 0]:
-            if before_tiles.count(after_tile):
-                sum_inversions += 1
-
-    sqrt_n = math.sqrt(n + 1)
-
-    def row_number(i):
-        return math.ceil((i + 1) / sqrt_n)
-
-    if sqrt_n % 2 == 1:
-        solvable = sum_inversions % 2 == 0
-    else:
-        solvable = (sum_inversions + abs(row_number(lst.index(0)) - row_number(GOAL_STATE.index(0)))) % 2 == 0
-
-    if not solvable:
-        if lst[0] != 0 and lst[1] != 0:
-            lst[0], lst[1] = lst[1], lst[0]
-        else:
-            lst[len(lst) - 1], lst[len(lst) - 2] = lst[len(lst) - 2], lst[len(lst) - 1]
-
-    fill_puzzle_frame(puzzle_frame, lst)
+    fill_puzzle_frame(puzzle_frame, make_solvable(lst, GOAL_STATE))
 
 
 # Input's random button widget
@@ -1408,6 +1318,11 @@ tkinter.Label(status_frame_4, text="Available RAM(MB): ").grid(row=0, column=0,
 tkinter.Label(status_frame_4, textvariable=available_ram_var).grid(row=0, column=1, sticky='W')
 status_frame_4.grid_columnconfigure(1, weight=1)
 status_frame_4.grid(row=0, column=3, sticky='WENS')
+status_frame_5 = tkinter.Frame(status_frame, bd=1, relief=tkinter.GROOVE)
+tkinter.Label(status_frame_5, text="Search progress: ").grid(row=0, column=0, sticky='WENS', padx=2)
+tkinter.Label(status_frame_5, textvariable=progress_var).grid(row=0, column=1, sticky='W')
+status_frame_5.grid_columnconfigure(1, weight=1)
+status_frame_5.grid(row=1, column=0, sticky='WENS', columnspan=4)
 status_frame.grid(row=3, column=0, sticky='WENS', columnspan=2)
 status_frame.columnconfigure(0, weight=1, uniform=1)
 status_frame.columnconfigure(1, weight=1, uniform=1)
@@ -1419,15 +1334,44 @@ load_algorithms()
 
 def available_ram_display():
     """
-    A thread target that updates available ram status label every 1 millisecond
+    Updates available ram status label every AVAILABLE_RAM_INTERVAL milliseconds, until stop_available_ram_display is
+    called.
+
+    It's only updated while a search is running (See start_timer).
     """
-    while True:
-        available_ram_var.set(round(psutil.virtual_memory().available / (2 ** 20), 3))
-        time.sleep(0.001)
+    import psutil
 
-if __name__ == '__main__':
-    threading.Thread(target=available_ram_display, daemon=True).start()
+    global available_ram_after_id
+
+    available_ram_var.set(round(psutil.virtual_memory().available / (2 ** 20), 3))
+    available_ram_after_id = main_window.after(AVAILABLE_RAM_INTERVAL, available_ram_display)
+
+
+def stop_available_ram_display():
+    """
+    Stops updating available ram status label.
+    """
+    global available_ram_after_id
+
+    if available_ram_after_id is not None:
+        main_window.after_cancel(available_ram_after_id)
+        available_ram_after_id = None
+
+
+def on_main_window_close():
+    """
+    Main window's close handler
 
+    Stops the search worker, since the app waits for it's non-daemonic process before exiting.
+    """
+    if search_worker is not None and search_worker.is_alive():
+        search_worker.terminate()
+    main_window.destroy()
+
+
+main_window.protocol('WM_DELETE_WINDOW', on_main_window_close)
+
+if __name__ == '__main__':
     # Support windows binary freezing
     multiprocessing.freeze_support()
     # Show the main window
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Command-line solver that runs algorithms without a display
+
+Usage: pynpuzzle_cli.py [-a ALGORITHM] [-g GOAL_FILE] [--no-path] [--progress] [BUDGET] PUZZLE_FILE
+       pynpuzzle_cli.py --batch [-j JOBS] [--timeout SECONDS] [--memory-limit MB] [BUDGET] [...]
+                        PUZZLES_FILE_OR_DIRECTORY
+       pynpuzzle_cli.py --list
+
+BUDGET is any of --max-nodes NODES, --max-seconds SECONDS and --max-memory MB.
+
+Puzzle files have the same format as the app's input files. ALGORITHM is either the name of an algorithm's module or
+the algorithm's name (search function's docstring).
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import argparse
+import json
+import sys
+import traceback
+
+from algorithms.util.instrumentation import Budget, Improvement, progress_text
+from pynpuzzle_core import (PuzzleFileError, discover_algorithms, improvement_text, list_to_puzzle, read_puzzle_file,
+                            read_puzzles, solve_puzzle)
+from pynpuzzle_pool import SolvePool
+
+# Algorithm that is used when no algorithm is given
+DEFAULT_ALGORITHM = 'ida_star_manhattan_distance'
+
+
+def find_algorithm(algorithms, name):
+    """
+    Returns the algorithm which it's module name or algorithm name is name, or None if there isn't one.
+    """
+    for algorithm in algorithms:
+        if algorithm.module_name == name or algorithm.name == name:
+            return algorithm
+    return None
+
+
+def format_puzzle(lst):
+    """
+    Returns the text representation of a one dimensional puzzle, the same as the app's saved files.
+    """
+    return '\n'.join(' '.join(str(tile) for tile in row) for row in list_to_puzzle(lst))
+
+
+def default_goal_state(n):
+    """
+    Returns the app's default goal state of an n-puzzle: the blank tile first and then the other tiles in order.
+    """
+    return [i for i in range(n + 1)]
+
+
+def print_result(result, print_path):
+    """
+    Prints a single puzzle's result for humans.
+    """
+    if print_path:
+        for i, step in enumerate(result['path']):
+            print('Step ' + str(i) + ':')
+            print(format_puzzle(step))
+            print()
+
+    rss = result['peak_rss']
+    bound = result['bound']
+    print('Moves : ' + str(result['moves']))
+    if bound:
+        # Algorithm is not optimal, but it knows how far from the optimal solution it can be
+        print('Moves lower bound : ' + str(bound))
+        print('Quality : at most ' + str(round(result['moves'] / bound, 3)) + ' times the optimal')
+    print('Expanded nodes : ' + str(result['expanded']))
+    print('Wall time : ' + str(round(result['wall_time'], 3)) + ' s')
+    print('CPU time : ' + str(round(result['cpu_time'], 3)) + ' s')
+    print('Peak RSS : ' + (str(round(rss, 3)) + ' MB' if rss is not None else 'unknown'))
+
+
+def print_progress(snapshot):
+    """
+    Shows a search's progress snapshot on a single line of standard error, improvements of anytime algorithms are
+    kept on their own lines.
+    """
+    if isinstance(snapshot, Improvement):
+        sys.stderr.write('\r' + improvement_text(snapshot) + '\033[K\n')
+        sys.stderr.flush()
+        return
+    sys.stderr.write('\r' + progress_text(snapshot) + '\033[K')
+    sys.stderr.flush()
+
+
+def print_stopped_result(result, print_path):
+    """
+    Prints the partial result of a search that has exceeded it's budget.
+    """
+    sys.stderr.write("Search stopped : " + result['stop_reason'] + " budget exceeded.\n")
+    if print_path and result['path'] is not None:
+        print('Best partial path:')
+        print()
+        for i, step in enumerate(result['path']):
+            print('Step ' + str(i) + ':')
+            print(format_puzzle(step))
+            print()
+    bound = result['bound']
+    rss = result['peak_rss']
+    print('Moves lower bound : ' + (str(bound) if bound is not None else 'unknown'))
+    print('Expanded nodes : ' + str(result['expanded']))
+    print('Wall time : ' + str(round(result['wall_time'], 3)) + ' s')
+    print('CPU time : ' + str(round(result['cpu_time'], 3)) + ' s')
+    print('Peak RSS : ' + (str(round(rss, 3)) + ' MB' if rss is not None else 'unknown'))
+
+
+def solve_one(algorithm, lst, goal_lst, print_path, show_progress, budget=None):
+    """
+    Solves a single puzzle in this process and prints it's result. Returns program's exit code.
+    """
+    try:
+        search = algorithm.load()
+    except Exception as e:
+        exception_message = traceback.format_exception(type(e), e, e.__traceback__)
+        sys.stderr.write("Algorithm's module can't be loaded:\n\n" + ''.join(exception_message))
+        return 1
+    result = solve_puzzle(search, lst, goal_lst, print_progress if show_progress else None, budget)
+    if show_progress and result['status'] != 'unsolvable':
+        sys.stderr.write('\n')
+    if result['status'] == 'unsolvable':
+        sys.stderr.write("Input error : Goal state can't be reached from the puzzle.\n")
+        return 2
+    if result['status'] == 'error':
+        sys.stderr.write("Some exception happened in algorithm's source code:\n\n" + result['error'])
+        return 1
+    if result['status'] == 'memory':
+        sys.stderr.write("Algorithm ran out of memory.\n")
+        return 1
+    if result['status'] == 'invalid':
+        sys.stderr.write("Algorithm's output is not valid.\n")
+        return 1
+    if result['status'] == 'stopped':
+        print('Algorithm : ' + algorithm.name)
+        print_stopped_result(result, print_path)
+        return 1
+
+    print('Algorithm : ' + algorithm.name)
+    print_result(result, print_path)
+    return 0
+
+
+def solve_batch(algorithm, puzzles, goal_lst, args, budget=None):
+    """
+    Solves puzzles with a pool of worker processes and prints every result as a JSON line as soon as it's finished.
+    Returns program's exit code.
+    """
+    exit_code = 0
+    with SolvePool(algorithm.module_name, goal_lst, args.jobs, args.timeout, args.memory_limit, budget) as pool:
+        for result in pool.imap_unordered(puzzles):
+            if result['status'] != 'solved':
+                exit_code = 1
+            if args.no_path:
+                del result['path']
+            print(json.dumps(result), flush=True)
+    return exit_code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Solve n-puzzle without a display.')
+    parser.add_argument('puzzle', nargs='?', help="puzzle's file, or with --batch a file or directory of puzzles")
+    parser.add_argument('-a', '--algorithm', default=DEFAULT_ALGORITHM,
+                        help="algorithm's module name or algorithm's name (default: " + DEFAULT_ALGORITHM + ")")
+    parser.add_argument('-g', '--goal', help="goal state's file (default: blank tile and then tiles in order)")
+    parser.add_argument('--list', action='store_true', help='list loaded algorithms and exit')
+    parser.add_argument('--no-path', action='store_true', help="don't print path's states")
+    parser.add_argument('--progress', action='store_true', help="show search's progress on standard error")
+    budget_group = parser.add_argument_group('budget',
+                                             "Stop a puzzle's search when it exceeds a limit and report the best "
+                                             "partial path and lower bound of moves that it has found.")
+    budget_group.add_argument('--max-nodes', type=int, help='maximum number of expanded nodes')
+    budget_group.add_argument('--max-seconds', type=float, help='maximum seconds of a search')
+    budget_group.add_argument('--max-memory', type=float, help='maximum memory of a search in MB')
+    batch_group = parser.add_argument_group('batch mode',
+                                            'Solve every puzzle of a file (separated by empty lines) or a directory '
+                                            'with a pool of worker processes and print results as JSON lines.')
+    batch_group.add_argument('--batch', action='store_true', help='enable batch mode')
+    batch_group.add_argument('-j', '--jobs', type=int, help='number of worker processes (default: number of CPUs)')
+    batch_group.add_argument('--timeout', type=float, help='maximum seconds of a puzzle')
+    batch_group.add_argument('--memory-limit', type=float, help='maximum memory of a worker process in MB')
+    args = parser.parse_args(argv)
+
+    algorithms, logs = discover_algorithms()
+    for log in logs:
+        if ' : OK : ' not in log:
+            sys.stderr.write(log)
+
+    if args.list:
+        for algorithm in algorithms:
+            print(algorithm.module_name + ' : ' + algorithm.name)
+        return 0
+
+    if not args.puzzle:
+        parser.error('the following arguments are required: puzzle')
+
+    algorithm = find_algorithm(algorithms, args.algorithm)
+    if algorithm is None:
+        sys.stderr.write("Algorithm not found : " + args.algorithm + '\n')
+        return 2
+
+    try:
+        if args.batch:
+            puzzles = list(read_puzzles(args.puzzle))
+        else:
+            puzzles = [(args.puzzle, read_puzzle_file(args.puzzle))]
+        if not puzzles:
+            raise PuzzleFileError("There is no puzzle.")
+        n = len(puzzles[0][1]) - 1
+        goal_lst = read_puzzle_file(args.goal) if args.goal else default_goal_state(n)
+    except (PuzzleFileError, OSError) as e:
+        sys.stderr.write("Input error : " + str(e) + '\n')
+        return 2
+    for name, lst in puzzles + [('goal state', goal_lst)]:
+        if len(lst) != n + 1:
+            sys.stderr.write("Input error : " + name + " : Puzzle's dimension is not the same as other puzzles.\n")
+            return 2
+
+    budget = None
+    if args.max_nodes is not None or args.max_seconds is not None or args.max_memory is not None:
+        budget = Budget(args.max_nodes, args.max_seconds, args.max_memory)
+
+    if args.batch:
+        return solve_batch(algorithm, puzzles, goal_lst, args, budget)
+    return solve_one(algorithm, puzzles[0][1], goal_lst, not args.no_path, args.progress, budget)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
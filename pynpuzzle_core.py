@@ -0,0 +1,753 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Functions that are shared between the graphical app and the command-line solver and don't need a display
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import ast
+import datetime
+import gc
+import json
+import math
+import os
+import re
+import signal
+import sys
+import threading
+import time
+import traceback
+from importlib import import_module
+from os import listdir
+from os.path import abspath, dirname, expanduser, isdir, isfile, join
+
+from algorithms.util.instrumentation import BudgetWatcher, Improvement, PartialResult, ProgressReporter, stats
+from algorithms.util.moves import MovePath, replay, steps_to_moves
+from algorithms.util.solvability import is_solvable
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Folder that algorithms are loaded from
+ALGORITHMS_DIR = join(dirname(abspath(__file__)), 'algorithms')
+# File that algorithms' metadata is cached in (See discover_algorithms)
+ALGORITHMS_CACHE = join(expanduser('~'), '.cache', 'pynpuzzle', 'algorithms.json')
+
+
+class PuzzleFileError(Exception):
+    """
+    Raised when a puzzle file's content is not valid.
+    """
+    pass
+
+
+def log_datetime():
+    """
+    Returns the datetime for logging.
+    """
+    now = datetime.datetime.now()
+    return now.strftime("%Y-%m-%d %H:%M")
+
+
+def list_to_puzzle(lst):
+    """
+    Converts a one dimensional puzzle list and returns it's two dimensional representation.
+
+    [1, 2, 3, 4, 5, 6, 7, 8, 0] --> [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    """
+    n_sqrt = int(math.sqrt(len(lst)))
+
+    puzzle = []
+    for i in range(0, len(lst), n_sqrt):
+        line = []
+        for j in range(0, n_sqrt):
+            line.append(lst[i + j])
+        puzzle.append(line)
+
+    return puzzle
+
+
+def puzzle_to_list(puzzle):
+    """
+    Converts a two dimensional puzzle to a one dimensional puzzle.
+
+    [[1, 2, 3], [4, 5, 6], [7, 8, 9]] --> [1, 2, 3, 4, 5, 6, 7, 8, 0]
+    """
+    lst = []
+    for row in puzzle:
+        lst.extend(row)
+
+    return lst
+
+
+def check_puzzle_list(lst, n):
+    """
+    Checks a puzzle one dimensional list and validates it.
+
+    lst : The list to be validated.
+    n : Puzzle type (n-puzzle).
+
+     Returns True of it's fine and False if it's not valid.
+    """
+    # Check list's length
+    if len(lst) != n + 1:
+        return False
+
+    lst = lst[:]
+
+    lst = [0 if x == '' else x for x in lst]
+
+    # Generate a new list containing numbers from 0 to n
+    #   and then check if the list has all of those numbers in it
+    new_lst = [i for i in range(0, n + 1)]
+    for lst_item in new_lst:
+        try:
+            lst.remove(lst_item)
+        except ValueError:
+            return False
+
+    if len(lst) != 0:
+        return False
+
+    return True
+
+
+def parse_puzzle(lines):
+    """
+    Parses a puzzle's lines and returns it's one dimensional list.
+
+    Every line is a row of the puzzle which it's numbers are separated by spaces (0 is the blank tile).
+
+    Raises PuzzleFileError if lines are not a valid puzzle.
+    """
+    lst = []
+
+    try:
+        for line in lines:
+            line_split = line.split()
+            lst.extend([int(i) for i in line_split])
+
+            if len(line_split) != len(lines):
+                raise PuzzleFileError("Puzzle dimension is not valid.")
+
+    except ValueError:
+        raise PuzzleFileError("Input must not have non-number values.")
+
+    if not check_puzzle_list(lst, len(lines) ** 2 - 1):
+        raise PuzzleFileError("Puzzle numbers are not valid.")
+
+    return lst
+
+
+def read_puzzle_file(file_name):
+    """
+    Reads a puzzle from a file and returns it's one dimensional list.
+
+    Reading stops at the first empty line (See parse_puzzle for the format).
+
+    Raises PuzzleFileError if file's content is not a valid puzzle and OSError if file can't be read.
+    """
+    with open(file_name) as file:
+        lines = []
+        pattern = re.compile(r'\s+')
+
+        for line in file:
+            # Check if line is empty
+            if re.sub(pattern, '', line) == '':
+                # Stop reading from input file
+                break
+
+            lines.append(line.rstrip())
+
+    return parse_puzzle(lines)
+
+
+def read_puzzles(path):
+    """
+    Reads all puzzles of a file or a directory and yields (name, lst) tuples which lst is the puzzle's one dimensional
+    list.
+
+    Puzzles of a file are separated by empty lines. Files of a directory are read in order of their names. A puzzle's
+    name is it's file's path, followed by #index if it's file has more than one puzzle.
+
+    Raises PuzzleFileError (with the puzzle's name) if a puzzle is not valid and OSError if a file can't be read.
+    """
+    if isdir(path):
+        files = sorted(join(path, f) for f in listdir(path) if isfile(join(path, f)))
+    else:
+        files = [path]
+
+    pattern = re.compile(r'\s+')
+    for file_name in files:
+        puzzles = [[]]
+        with open(file_name) as file:
+            for line in file:
+                if re.sub(pattern, '', line) == '':
+                    if puzzles[-1]:
+                        puzzles.append([])
+                else:
+                    puzzles[-1].append(line.rstrip())
+        if not puzzles[-1]:
+            puzzles.pop()
+
+        for index, lines in enumerate(puzzles):
+            name = file_name if len(puzzles) == 1 else file_name + '#' + str(index)
+            try:
+                yield name, parse_puzzle(lines)
+            except PuzzleFileError as e:
+                raise PuzzleFileError(name + ' : ' + str(e))
+
+
+def validate_output(output, n):
+    """
+    Validates an algorithm's output.
+
+    output : Value that algorithm's search function has returned.
+    n : Puzzle type (n-puzzle).
+
+    Returns output's steps as one dimensional lists or None if output is not valid.
+    """
+    if not output:
+        return None
+    if type(output) is not list:
+        return None
+
+    sqrt_n = math.sqrt(n + 1)
+    steps = []
+    try:
+        for output_step in output:
+            if type(output_step) is not list:
+                return None
+            if len(output_step) != sqrt_n:
+                return None
+            for step_row in output_step:
+                if type(step_row) is not list:
+                    return None
+                if len(step_row) != sqrt_n:
+                    return None
+            step = [int(output_step[i][j]) for i in range(len(output_step)) for j in range(len(output_step))]
+            if not check_puzzle_list(step, n):
+                return None
+            steps.append(step)
+    except (TypeError, ValueError):
+        return None
+
+    return steps
+
+
+def compact_output(output, n):
+    """
+    Converts an algorithm's output to a MovePath (See algorithms/util/moves.py), which is much smaller to send to
+    another process than a list of states.
+
+    output : Value that algorithm's search function has returned, a MovePath or a list of two dimensional states.
+    n : Puzzle type (n-puzzle).
+
+    Returns None if output is not valid. A PartialResult or an Improvement is returned as the same type which it's path
+    is converted (See expand_partial).
+    """
+    if isinstance(output, Improvement):
+        return Improvement(compact_output(output.path, n), output.bound)
+    if isinstance(output, PartialResult):
+        path = compact_output(output.path, n) if output.path else None
+        try:
+            bound = int(output.bound) if output.bound is not None else None
+        except (TypeError, ValueError):
+            bound = None
+        return PartialResult(path, bound, output.reason)
+    if isinstance(output, MovePath):
+        return output
+    steps = validate_output(output, n)
+    if steps is None:
+        return None
+    moves = steps_to_moves(steps)
+    if moves is None:
+        return None
+    return MovePath(steps[0], moves)
+
+
+def expand_output(move_path, n, goal_lst):
+    """
+    Replays a MovePath's moves.
+
+    n : Puzzle type (n-puzzle).
+    goal_lst : One dimensional list of the goal state.
+
+    Returns path's steps as one dimensional lists or None if it's not a valid path to goal_lst.
+    """
+    if not isinstance(move_path, MovePath):
+        return None
+    start, moves = move_path
+    try:
+        start = [int(tile) for tile in start]
+    except (TypeError, ValueError):
+        return None
+    if not check_puzzle_list(start, n) or not isinstance(moves, str):
+        return None
+    steps = replay(start, moves)
+    if steps is None or (goal_lst is not None and steps[-1] != list(goal_lst)):
+        return None
+    return steps
+
+
+def expand_partial(partial, n):
+    """
+    Replays the moves of a compacted PartialResult's path (See compact_output).
+
+    Returns a PartialResult which it's path is a list of one dimensional steps, or None if the path is not valid.
+    """
+    path = expand_output(partial.path, n, None) if partial.path is not None else None
+    return PartialResult(path, partial.bound, partial.reason)
+
+
+def improvement_text(improvement):
+    """
+    Returns the text representation of a compacted Improvement (See compact_output).
+    """
+    if improvement.path is None:
+        return ''
+    moves = len(improvement.path.moves)
+    text = 'Best solution: ' + str(moves) + ' moves'
+    if improvement.bound:
+        text += ' (lower bound: ' + str(improvement.bound) + ', at most ' + str(round(moves / improvement.bound, 3)) + \
+                ' times the optimal)'
+    return text
+
+
+def reset_peak_rss():
+    """
+    Resets peak resident set size of the process, so peak_rss only reports what is used after this.
+
+    It's only supported on Linux, returns False if it's not supported.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as file:
+            file.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss():
+    """
+    Returns peak resident set size of the process in MB or None if it's not available.
+    """
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / (2 ** 10)
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on other systems
+        if sys.platform == 'darwin':
+            return max_rss / (2 ** 20)
+        return max_rss / (2 ** 10)
+    try:
+        import psutil
+    except ImportError:
+        return None
+    memory_info = psutil.Process().memory_info()
+    return getattr(memory_info, 'peak_wset', memory_info.rss) / (2 ** 20)
+
+
+class ProcessSampler:
+    """
+    Samples RAM and CPU usage of a process and it's children (like the pools of parallel algorithms). Needs psutil,
+    which is imported when a sampler is made, so the app starts without importing it.
+
+    Resident set size and CPU times are cheap to read, so they are read on every sample. Unique set size needs the
+    process's whole memory map to be read, so it's only measured (and the list of children is only refreshed) every
+    uss_samples samples.
+    """
+
+    def __init__(self, pid, uss_samples=10):
+        """
+        pid : Process id of the sampled process.
+        uss_samples : Number of samples between two unique set size measurements.
+        """
+        import psutil
+
+        self.process = psutil.Process(pid)
+        self.uss_samples = uss_samples
+        self.count = 0
+        self.children = []
+        self.uss = None
+        # CPU time of every process that has been sampled, so finished children are still counted
+        self.cpu_times = {}
+        # A warm worker has used some CPU time for the previous searches, it's not counted
+        cpu_times = self.process.cpu_times()
+        self.cpu_baseline = cpu_times.user + cpu_times.system
+
+    def sample(self):
+        """
+        Returns a (rss, uss, cpu_time) tuple, rss and uss are in MB and cpu_time is in seconds. uss is the last
+        measured unique set size (None if it has not been measured yet).
+
+        Raises psutil.NoSuchProcess if the process has finished.
+        """
+        import psutil
+
+        refresh = self.count % self.uss_samples == 0
+        self.count += 1
+        if refresh:
+            try:
+                self.children = self.process.children(recursive=True)
+            except psutil.Error:
+                self.children = []
+        rss = 0
+        uss = 0
+        for process in [self.process] + self.children:
+            try:
+                rss += process.memory_info().rss
+                cpu_times = process.cpu_times()
+                self.cpu_times[process.pid] = cpu_times.user + cpu_times.system
+            except psutil.Error:
+                if process is self.process:
+                    raise
+                continue
+            if refresh and uss is not None:
+                try:
+                    uss += process.memory_full_info().uss
+                except psutil.AccessDenied:
+                    # It's not allowed on some systems (e.g. macOS)
+                    uss = None
+                except psutil.Error:
+                    pass
+        if refresh:
+            self.uss = uss / (2 ** 20) if uss is not None else None
+        return rss / (2 ** 20), self.uss, sum(self.cpu_times.values()) - self.cpu_baseline
+
+
+def solve_puzzle(search, lst, goal_lst, progress=None, budget=None):
+    """
+    Runs an algorithm's search function on a puzzle and measures it.
+
+    search : Algorithm's search function.
+    lst : One dimensional list of the puzzle.
+    goal_lst : One dimensional list of the goal state.
+    progress : A function that search's progress snapshots and it's compacted improvements are passed to while it's
+               running (See instrumentation).
+    budget : An instrumentation.Budget, search is stopped when it exceeds it.
+
+    Returns a dictionary with these keys:
+        status : 'solved', 'unsolvable' (goal state can't be reached from the puzzle, search is not run), 'stopped'
+                 (search has exceeded it's budget), 'invalid' (algorithm's output is not valid), 'memory' (algorithm
+                 ran out of memory) or 'error' (some exception happened in algorithm's source code).
+        moves : Number of moves of the path, None if it's not solved.
+        path : Path's steps as one dimensional lists, None if it's not solved. If status is 'stopped' it's the best
+               partial path that the search has found (None if it has not returned one).
+        stop_reason : Exceeded limit of the budget ('nodes', 'seconds' or 'memory') if status is 'stopped', None
+                      otherwise.
+        bound : Lower bound of the number of moves that the search has found (See instrumentation), None if it's
+                not known. Solution's quality is moves / bound.
+        expanded : Number of nodes that algorithm has expanded.
+        wall_time, cpu_time : Seconds that search has taken.
+        peak_rss : Peak resident set size of the process in MB (None if it's not available).
+        error : Print ready exception's string if status is 'error', None otherwise.
+    """
+    result = {'status': 'solved', 'moves': None, 'path': None, 'stop_reason': None, 'bound': None, 'error': None}
+    if not is_solvable(lst, goal_lst):
+        result.update(status='unsolvable', expanded=0, wall_time=0.0, cpu_time=0.0, peak_rss=None)
+        return result
+
+    stats.reset()
+    reset_peak_rss()
+    reporter = None
+    if progress:
+        stats.on_improvement = lambda improvement: progress(compact_output(improvement, len(lst) - 1))
+        reporter = ProgressReporter(progress).start()
+    watcher = BudgetWatcher(budget, peak_rss).start() if budget else None
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        try:
+            output = search(list_to_puzzle(lst), list_to_puzzle(goal_lst))
+        finally:
+            if watcher:
+                watcher.stop()
+    except KeyboardInterrupt:
+        # Search has not returned in the grace period after it was stopped
+        if not stats.stopped:
+            raise
+        output = stats.best if stats.best is not None else stats.partial()
+    except MemoryError:
+        output = None
+        result['status'] = 'memory'
+    except Exception as e:
+        output = None
+        result['status'] = 'error'
+        exception_message = traceback.format_exception(type(e), e, e.__traceback__)
+        del exception_message[1]
+        result['error'] = ''.join(exception_message)
+    result['wall_time'] = time.perf_counter() - wall_start
+    result['cpu_time'] = time.process_time() - cpu_start
+    if result['status'] == 'memory':
+        # stats keeps the search's data structures (See instrumentation.SearchStats.track), without them and the
+        # exception (and it's traceback) the search's objects are garbage and are freed before anything else needs
+        # memory
+        stats.track()
+        stats.best = None
+        gc.collect()
+    if reporter:
+        reporter.stop()
+    result['expanded'] = stats.expanded
+    try:
+        result['peak_rss'] = peak_rss()
+    except MemoryError:
+        result['peak_rss'] = None
+
+    if result['status'] == 'solved' and isinstance(output, PartialResult):
+        partial = expand_partial(compact_output(output, len(lst) - 1), len(lst) - 1)
+        result.update(status='stopped', path=partial.path, stop_reason=partial.reason, bound=partial.bound)
+    elif result['status'] == 'solved':
+        steps = expand_output(compact_output(output, len(lst) - 1), len(lst) - 1, goal_lst)
+        if steps is None:
+            result['status'] = 'invalid'
+        else:
+            result['path'] = steps
+            result['moves'] = len(steps) - 1
+            result['bound'] = stats.lower_bound
+
+    return result
+
+
+class Algorithm:
+    """
+    An algorithm module's metadata, which is read from it's source without importing it.
+
+    module_name : Module's name inside algorithms package (file's name without .py).
+    name : Algorithm's name, search function's docstring (or module_name if it has no docstring).
+    """
+
+    def __init__(self, module_name, name):
+        self.module_name = module_name
+        self.name = name
+
+    def load(self):
+        """
+        Imports algorithm's module and returns it's search function.
+
+        Raises ImportError if the module has no proper search function and any exception that importing it raises.
+        """
+        module = import_module('algorithms.' + self.module_name)
+        search = getattr(module, 'search', None)
+        if not search:
+            raise ImportError("Algorithm's search not defined : " + self.module_name + '.py')
+        if search.__code__.co_argcount != 2:
+            raise ImportError('Search function should only accept 2 positional arguments : ' + self.module_name + '.py')
+        return search
+
+    def prepare(self, goal_state):
+        """
+        Calls the prepare function of algorithm's module (if it has one) with a two dimensional goal state, which builds
+        the data that the searches for that goal state need (like pattern databases).
+
+        Searches that run in processes that can't have their own pools or are killed by a timeout (like SolvePool's
+        workers) should be prepared in their parent process. Raises any exception that importing the module or it's
+        prepare function raises.
+        """
+        prepare = getattr(import_module('algorithms.' + self.module_name), 'prepare', None)
+        if prepare is not None:
+            prepare(goal_state)
+
+
+def read_algorithm_metadata(path):
+    """
+    Reads an algorithm module's search function from it's source code without running it.
+
+    Returns a dictionary with these keys:
+        error : None, 'exception' (file can't be parsed), 'search' (search is not defined) or 'arguments' (search
+                doesn't accept 2 positional arguments).
+        name : Search function's docstring or None.
+        dynamic : True if search is not a plain function definition (e.g. it's imported or assigned), so the module
+                  has to be imported to know about it.
+    """
+    metadata = {'error': None, 'name': None, 'dynamic': False}
+    try:
+        with open(path, 'rb') as file:
+            tree = ast.parse(file.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        metadata['error'] = 'exception'
+        return metadata
+
+    search = None
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == 'search':
+            search = node
+        elif isinstance(node, (ast.Assign, ast.AugAssign, ast.AnnAssign, ast.Import, ast.ImportFrom)):
+            targets = node.targets if isinstance(node, ast.Assign) else [getattr(node, 'target', None)]
+            names = [alias.asname or alias.name for alias in getattr(node, 'names', [])]
+            names += [target.id for target in targets if isinstance(target, ast.Name)]
+            if 'search' in names or '*' in names:
+                search = node
+    if search is None:
+        metadata['error'] = 'search'
+    elif not isinstance(search, ast.FunctionDef):
+        metadata['dynamic'] = True
+    else:
+        arguments = search.args
+        if len(getattr(arguments, 'posonlyargs', [])) + len(arguments.args) != 2:
+            metadata['error'] = 'arguments'
+        docstring = ast.get_docstring(search, clean=False)
+        if docstring and docstring.strip():
+            metadata['name'] = docstring.strip()
+    return metadata
+
+
+def discover_algorithms(previous_algorithms=(), cache_path=ALGORITHMS_CACHE):
+    """
+    Finds the algorithms of ./algorithm/ folder without importing them.
+    It assumes all python files as algorithms and reads their search functions from their source code, metadata is
+    cached in cache_path by files' modification times, so unchanged files are not even parsed. Modules are imported
+    later by Algorithm.load.
+
+    previous_algorithms : Algorithms that have been discovered before, their modules are removed from sys.modules so
+                          they get reloaded.
+    cache_path : Metadata cache's file, None means no cache.
+
+    Returns an (algorithms, logs) tuple which algorithms are Algorithm objects and logs are log lines about them.
+    """
+    logs = []
+
+    for algorithm in previous_algorithms:
+        # If the module is already loaded remove it, so it can be reloaded.
+        sys.modules.pop('algorithms.' + algorithm.module_name, None)
+
+    cache = {}
+    if cache_path:
+        try:
+            with open(cache_path) as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            pass
+    new_cache = {}
+
+    algorithms_files = sorted(f for f in listdir(ALGORITHMS_DIR) if f.endswith('.py') and
+                              isfile(join(ALGORITHMS_DIR, f)))
+    algorithms = []
+    for file in algorithms_files:
+        module_name = file[:-3]
+        path = join(ALGORITHMS_DIR, file)
+        stat = os.stat(path)
+        metadata = cache.get(file)
+        if metadata is None or metadata.get('mtime') != stat.st_mtime or metadata.get('size') != stat.st_size:
+            metadata = read_algorithm_metadata(path)
+            metadata.update(mtime=stat.st_mtime, size=stat.st_size)
+        new_cache[file] = metadata
+
+        error = metadata['error']
+        name = metadata['name']
+        if metadata['dynamic']:
+            # The module has to be imported to find it's search function
+            try:
+                search = Algorithm(module_name, None).load()
+                name = search.__doc__.strip() if search.__doc__ and search.__doc__.strip() else None
+            except ImportError as e:
+                error = 'arguments' if 'arguments' in str(e) else 'search'
+            except Exception:
+                error = 'exception'
+
+        if error == 'exception':
+            logs.append(log_datetime() + " : Error : Exception raised : " + file + "\n")
+            continue
+        logs.append(log_datetime() + " : OK : Loaded : " + file + "\n")
+        if error == 'search':
+            logs.append(log_datetime() + " : Error : Algorithm's search not defined : " + file + '\n')
+            continue
+        if error == 'arguments':
+            logs.append(log_datetime() + " : Error : Search function should only accept 2 positional arguments : " +
+                        file + '\n')
+            continue
+        if not name:
+            logs.append(log_datetime() + " : Warning : Algorithm's name not defined : " + file + '\n')
+            name = module_name
+        algorithms.append(Algorithm(module_name, name))
+
+    if cache_path and new_cache != cache:
+        try:
+            os.makedirs(dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + '.' + str(os.getpid()) + '.tmp'
+            with open(tmp_path, 'w') as file:
+                json.dump(new_cache, file)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    return algorithms, logs
+
+
+def _exit_on_terminate(signum, frame):
+    raise SystemExit(signum)
+
+
+def search_runner(func, pipe, lst, goal_state, progress_pipe=None, budget=None, cancel_pipe=None):
+    """
+    This function invokes the given func with lst and goal_state arguments and sends func's returned value to pipe as
+    a MovePath (See compact_output), or None if it's not valid. If some exception happened in func, sends print ready
+    exception's string to show to user.
+
+    If progress_pipe is given, search's progress snapshots and it's compacted improvements are sent to it while func
+    is running (See instrumentation).
+
+    Search is stopped when it exceeds budget (an instrumentation.Budget) or anything is received from cancel_pipe
+    (which can be pipe itself if it's duplex), then a PartialResult is sent (See compact_output). Without a budget and
+    cancel_pipe, search's budget is not watched at all.
+
+    Terminating the process raises SystemExit in func, so algorithms that use their own processes can stop them in a
+    finally block.
+    """
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, _exit_on_terminate)
+    stats.reset()
+    reset_peak_rss()
+    reporter = None
+    if progress_pipe:
+        # Improvements are sent from search's thread and snapshots from reporter's thread
+        progress_lock = threading.Lock()
+
+        def send_progress(obj):
+            with progress_lock:
+                progress_pipe.send(obj)
+
+        def send_improvement(improvement):
+            try:
+                send_progress(compact_output(improvement, len(lst) ** 2 - 1))
+            except (OSError, EOFError):
+                # Receiver is gone
+                pass
+
+        stats.on_improvement = send_improvement
+        reporter = ProgressReporter(send_progress).start()
+    watcher = BudgetWatcher(budget, peak_rss, cancel_pipe).start() if budget or cancel_pipe else None
+    try:
+        try:
+            try:
+                ret_val = func(lst, goal_state)
+            finally:
+                if watcher:
+                    watcher.stop()
+        except KeyboardInterrupt:
+            # Search has not returned in the grace period after it was stopped
+            if not stats.stopped:
+                raise
+            ret_val = stats.best if stats.best is not None else stats.partial()
+        if reporter:
+            reporter.stop()
+        pipe.send(compact_output(ret_val, len(lst) ** 2 - 1))
+    except SystemExit:
+        # Search has been stopped, nobody is waiting for it's result, so the process just exits
+        raise
+    except BaseException as e:
+        if reporter:
+            reporter.stop()
+        exception_message = traceback.format_exception(type(e), e, e.__traceback__)
+        del exception_message[1]
+        pipe.send(''.join(exception_message))
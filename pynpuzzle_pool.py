@@ -0,0 +1,339 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Solving many puzzles with a pool of worker processes
+
+Every worker keeps the algorithm's module loaded and solves one puzzle at a time. A worker that takes longer than the
+timeout, runs out of memory or dies is replaced with a new one, so one puzzle can't block the others.
+
+The app runs it's searches in a WarmWorker, which keeps algorithms' modules and the data they have precomputed
+(heuristic tables, pattern databases, ...) loaded between searches and only reloads the modules that have changed.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import gc
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+import types
+from collections import namedtuple
+from importlib import import_module
+from multiprocessing.connection import wait
+
+from pynpuzzle_core import Algorithm, list_to_puzzle, search_runner, solve_puzzle
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# What a WarmWorker sends instead of search's result when the algorithm's module can't be loaded, message is print ready
+# exception's string
+LoadError = namedtuple('LoadError', 'module_name message')
+
+
+def _worker(conn, algorithm, goal_lst, memory_limit, budget):
+    """
+    Worker process's target. Receives (name, lst) tasks from conn and sends back their results until it receives None.
+    """
+    if memory_limit and resource is not None:
+        limit = int(memory_limit * (2 ** 20))
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+    search = import_module('algorithms.' + algorithm).search
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        name, lst = task
+        started_at = time.perf_counter()
+        try:
+            result = {'name': name}
+            result.update(solve_puzzle(search, lst, goal_lst, budget=budget))
+            conn.send(result)
+        except MemoryError:
+            # Measuring or sending the result may need more memory than the search has left, the result is pickled
+            # before anything is written to conn, so a smaller one can still be sent
+            result = None
+            gc.collect()
+            conn.send(failed_result(name, 'memory', time.perf_counter() - started_at))
+
+
+class _Worker:
+    """
+    A worker process and the task that it's solving.
+    """
+
+    def __init__(self, algorithm, goal_lst, memory_limit, budget):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker,
+                                               args=(child_conn, algorithm, goal_lst, memory_limit, budget))
+        self.process.daemon = True
+        self.process.start()
+        child_conn.close()
+        # (name, lst) of the task that worker is solving, None if it's idle
+        self.task = None
+        self.started_at = None
+
+    def start(self, task):
+        self.task = task
+        self.started_at = time.monotonic()
+        self.conn.send(task)
+
+    def finish(self):
+        self.task = None
+        self.started_at = None
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+def failed_result(name, status, wall_time):
+    """
+    Returns the result of a task which it's worker has been killed or has died.
+    """
+    return {'name': name, 'status': status, 'moves': None, 'path': None, 'stop_reason': None, 'bound': None,
+            'expanded': None, 'wall_time': wall_time, 'cpu_time': None, 'peak_rss': None, 'error': None}
+
+
+class SolvePool:
+    """
+    Solves puzzles with a pool of worker processes.
+
+    Results are dictionaries that solve_puzzle returns (See pynpuzzle_core) with the puzzle's name in 'name'. status of
+    a puzzle that has taken more than timeout is 'timeout' and the status of a puzzle which it's worker has died
+    (for example killed by the system because of memory) is 'crashed'.
+
+    Unlike timeout, which kills the worker and loses everything that it has found, a search that exceeds budget is
+    stopped by itself and it's partial result is returned with 'stopped' status.
+
+    The algorithm is prepared for the goal state (See pynpuzzle_core.Algorithm.prepare) in this process, before the
+    workers are started.
+    """
+
+    def __init__(self, algorithm, goal_lst, processes=None, timeout=None, memory_limit=None, budget=None):
+        """
+        algorithm : Name of the algorithm's module in algorithms package.
+        goal_lst : One dimensional list of the goal state.
+        processes : Number of worker processes, None means number of CPUs.
+        timeout : Maximum seconds that a puzzle can take, None means no limit.
+        memory_limit : Maximum address space of a worker in MB, None means no limit. It's only enforced on systems
+                       that support resource.RLIMIT_AS.
+        budget : An instrumentation.Budget of every puzzle's search, None means no limit.
+        """
+        self.algorithm = algorithm
+        self.goal_lst = goal_lst
+        self.processes = processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.budget = budget
+        self.workers = []
+        try:
+            Algorithm(algorithm, None).prepare(list_to_puzzle(goal_lst))
+        except Exception:
+            # Workers fail the same way and report it as every puzzle's error
+            pass
+
+    def new_worker(self):
+        return _Worker(self.algorithm, self.goal_lst, self.memory_limit, self.budget)
+
+    def replace(self, worker):
+        """
+        Kills a worker and replaces it with a new one.
+        """
+        worker.kill()
+        self.workers[self.workers.index(worker)] = self.new_worker()
+
+    def imap_unordered(self, tasks):
+        """
+        Solves tasks and yields their results as soon as they are finished.
+
+        tasks : Iterable of (name, lst) tuples which lst is the one dimensional list of the puzzle.
+        """
+        tasks = iter(tasks)
+        while len(self.workers) < self.processes:
+            self.workers.append(self.new_worker())
+
+        remaining = True
+        while True:
+            # Give tasks to idle workers
+            for worker in self.workers:
+                if worker.task is None and remaining:
+                    task = next(tasks, None)
+                    if task is None:
+                        remaining = False
+                    else:
+                        worker.start(task)
+            busy = [worker for worker in self.workers if worker.task is not None]
+            if not busy:
+                return
+
+            wait_timeout = None
+            if self.timeout is not None:
+                now = time.monotonic()
+                wait_timeout = max(0, min(worker.started_at + self.timeout - now for worker in busy))
+            ready = wait([worker.conn for worker in busy], wait_timeout)
+
+            now = time.monotonic()
+            for worker in busy:
+                name = worker.task[0]
+                wall_time = now - worker.started_at
+                if worker.conn in ready:
+                    try:
+                        result = worker.conn.recv()
+                    except (EOFError, OSError):
+                        result = failed_result(name, 'crashed', wall_time)
+                        self.replace(worker)
+                    else:
+                        worker.finish()
+                        # A worker that has run out of memory may not be able to free it
+                        if result['status'] == 'memory':
+                            self.replace(worker)
+                    yield result
+                elif self.timeout is not None and wall_time >= self.timeout:
+                    self.replace(worker)
+                    yield failed_result(name, 'timeout', wall_time)
+
+    def close(self):
+        """
+        Stops all workers.
+        """
+        for worker in self.workers:
+            if worker.task is None:
+                worker.stop()
+            else:
+                worker.kill()
+        self.workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _module_mtime(module):
+    """
+    Returns the modification time of a module's file or None if it has no file.
+    """
+    try:
+        return os.stat(module.__file__).st_mtime
+    except (AttributeError, TypeError, OSError):
+        return None
+
+
+def reload_changed_modules(mtimes):
+    """
+    Removes the algorithms' modules which their files have changed from sys.modules, so they are imported again.
+
+    mtimes : Maps the names of the reloadable modules to their files' modification times when they were imported.
+
+    Algorithms keep references to the objects of the utility modules, so if a utility module has changed all of the
+    reloadable modules are removed. A removed module is also removed from it's package's attributes, otherwise
+    'from .util import module' would still return the old module.
+    """
+    changed = [name for name, mtime in mtimes.items()
+               if name not in sys.modules or _module_mtime(sys.modules[name]) != mtime]
+    if any(name.count('.') > 1 for name in changed):
+        changed = list(mtimes)
+    for name in changed:
+        sys.modules.pop(name, None)
+        package_name, _, attribute = name.rpartition('.')
+        package = sys.modules.get(package_name)
+        if isinstance(getattr(package, attribute, None), types.ModuleType):
+            delattr(package, attribute)
+        del mtimes[name]
+
+
+def _warm_worker(conn):
+    """
+    WarmWorker's process's target. Receives (module_name, pipe, lst, goal_state, progress_pipe) tasks from conn and runs
+    them with search_runner until conn is closed.
+    """
+    # Modules that have been imported by pynpuzzle_core itself (like instrumentation) are never reloaded
+    base_modules = set(name for name in sys.modules if name.startswith('algorithms.'))
+    mtimes = {}
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        module_name, pipe, lst, goal_state, progress_pipe = task
+
+        reload_changed_modules(mtimes)
+        try:
+            search = Algorithm(module_name, None).load()
+        except Exception as e:
+            exception_message = traceback.format_exception(type(e), e, e.__traceback__)
+            pipe.send(LoadError(module_name, ''.join(exception_message)))
+        else:
+            for name, module in list(sys.modules.items()):
+                if name.startswith('algorithms.') and name not in base_modules and name not in mtimes:
+                    mtimes[name] = _module_mtime(module)
+            # App cancels the search by sending anything to the other end of pipe
+            search_runner(search, pipe, lst, goal_state, progress_pipe, cancel_pipe=pipe)
+        pipe.close()
+        if progress_pipe is not None:
+            progress_pipe.close()
+
+
+class WarmWorker:
+    """
+    A process that runs searches one at a time and keeps algorithms' modules loaded between them.
+
+    The process is not daemonic, so algorithms can use their own pools of processes. Terminating it stops the running
+    search (See search_runner), a new WarmWorker should be made after that.
+    """
+
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_warm_worker, args=(child_conn,))
+        self.process.start()
+        child_conn.close()
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def search(self, module_name, pipe, lst, goal_state, progress_pipe=None):
+        """
+        Runs an algorithm's search with search_runner in the worker's process.
+
+        module_name : Name of the algorithm's module in algorithms package.
+        pipe, lst, goal_state, progress_pipe : Arguments of search_runner, the pipes are closed when the search is
+                                               finished. If the module can't be loaded, a LoadError is sent to pipe.
+                                               pipe is also search_runner's cancel_pipe.
+        """
+        self.conn.send((module_name, pipe, lst, goal_state, progress_pipe))
+
+    def terminate(self):
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
@@ -0,0 +1,47 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Tests of the command line interface
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+ROOT = dirname(dirname(abspath(__file__)))
+
+# A 15-puzzle that breadth-first search can't solve in a few hundred MB
+HARD_15_PUZZLE = '15 14 8 12\n10 11 9 13\n2 6 5 1\n3 7 4 0\n'
+
+
+class BatchTest(unittest.TestCase):
+
+    @unittest.skipIf(resource is None, 'memory limit needs resource.RLIMIT_AS')
+    def test_memory_limit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            puzzles = join(directory, 'puzzles.txt')
+            with open(puzzles, 'w') as file:
+                file.write(HARD_15_PUZZLE + '\n' + HARD_15_PUZZLE)
+            command = [sys.executable, join(ROOT, 'pynpuzzle_cli.py'), '--batch', '-j', '1', '--memory-limit', '150',
+                       '--timeout', '60', '-a', 'breadth_first_search', puzzles]
+            process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+                                     timeout=180)
+        results = [json.loads(line) for line in process.stdout.splitlines()]
+        self.assertEqual([result['status'] for result in results], ['memory', 'memory'])
+        self.assertNotIn('Traceback', process.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Tests of solving puzzles in worker processes
+
+Tests that change algorithms' files run on a copy of the repository in a temporary directory.
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+ROOT = dirname(dirname(abspath(__file__)))
+
+# Solves a puzzle with a warm worker, changes a utility module and solves it again with the same worker
+WARM_WORKER_SCRIPT = '''
+import multiprocessing
+import os
+
+from pynpuzzle_pool import WarmWorker
+
+
+def solve(worker):
+    receiver, sender = multiprocessing.Pipe()
+    worker.search('ida_star_manhattan_distance', sender, [[1, 0], [2, 3]], [[0, 1], [2, 3]])
+    sender.close()
+    return receiver.recv()
+
+
+if __name__ == '__main__':
+    worker = WarmWorker()
+    print(type(solve(worker)).__name__)
+    path = os.path.join('algorithms', 'util', 'ida_star.py')
+    with open(path, 'a') as file:
+        file.write('\\n\\ndef search(*args, **kwargs):\\n    raise RuntimeError("changed ida_star")\\n')
+    # File systems with a coarse modification time could give the changed file it's old time
+    mtime = os.stat(path).st_mtime + 10
+    os.utime(path, (mtime, mtime))
+    result = solve(worker)
+    worker.terminate()
+    print('changed' if isinstance(result, str) and 'changed ida_star' in result else type(result).__name__)
+'''
+
+
+class WarmWorkerTest(unittest.TestCase):
+
+    def test_reloads_changed_utility_module(self):
+        with tempfile.TemporaryDirectory() as directory:
+            shutil.copytree(join(ROOT, 'algorithms'), join(directory, 'algorithms'),
+                            ignore=shutil.ignore_patterns('__pycache__'))
+            for file_name in ('pynpuzzle_core.py', 'pynpuzzle_pool.py'):
+                shutil.copy(join(ROOT, file_name), directory)
+            script = join(directory, 'warm_worker.py')
+            with open(script, 'w') as file:
+                file.write(WARM_WORKER_SCRIPT)
+            output = subprocess.check_output([sys.executable, script], cwd=directory, universal_newlines=True,
+                                             timeout=60, env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'))
+        self.assertEqual(output.split(), ['MovePath', 'changed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+pynpuzzle - Solve n-puzzle with Python
+
+Tests of the transposition table
+
+Version : 1.0.0
+Author : Hamidreza Mahdavipanah
+Repository: http://github.com/mahdavipanah/pynpuzzle
+License : MIT License
+"""
+import sqlite3
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from algorithms.util import transposition
+
+
+class TranspositionTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = join(self.directory.name, transposition.DATABASE_NAME)
+        self.goal_state = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+        self.state = [[1, 2, 3], [4, 5, 6], [0, 7, 8]]
+
+    def tearDown(self):
+        for key in list(transposition._loaded_entries):
+            if key[0] == self.path:
+                del transposition._loaded_entries[key]
+        self.directory.cleanup()
+
+    def solve(self):
+        table = transposition.TranspositionTable(self.goal_state, path=self.path)
+        try:
+            packed = table.board.pack(self.state)[0]
+            if table.lookup(packed) is None:
+                path = [packed]
+                # The blank moves right twice
+                for move in ([[1, 2, 3], [4, 5, 6], [7, 0, 8]], [[1, 2, 3], [4, 5, 6], [7, 8, 0]]):
+                    path.append(table.board.pack(move)[0])
+                table.record(path)
+            return table.entries
+        finally:
+            table.close()
+
+    def test_entries_are_loaded_once_per_process(self):
+        entries = self.solve()
+        self.assertEqual(len(entries), 2)
+        # Entries that are only in the database aren't loaded again by the later tables
+        connection = sqlite3.connect(self.path)
+        connection.execute('DELETE FROM states')
+        connection.commit()
+        connection.close()
+        self.assertIs(self.solve(), entries)
+        self.assertEqual(len(entries), 2)
+
+    def test_entries_are_loaded_from_database(self):
+        self.solve()
+        transposition._loaded_entries.clear()
+        self.assertEqual(len(self.solve()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()